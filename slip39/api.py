@@ -18,22 +18,32 @@ from __future__          import annotations
 
 import base58
 import codecs
+import copy
 import hashlib
+import hmac
+import importlib.util
 import itertools
 import json
 import logging
 import math
+import mmap
+import os
+import random
 import re
 import string
+import struct
+import threading
 import warnings
 
-from functools		import wraps
-from collections	import namedtuple
-from typing		import Dict, List, Sequence, Tuple, Optional, Union, Callable
+from functools		import wraps, partial
+from collections	import namedtuple, OrderedDict, deque
+from collections.abc	import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from typing		import Any, Dict, List, Sequence, Tuple, Optional, Union, Callable
 
 from shamir_mnemonic	import EncryptedMasterSecret, split_ems
 from shamir_mnemonic.shamir import _random_identifier, RANDOM_BYTES
-from shamir_mnemonic.constants import ID_LENGTH_BITS
+from shamir_mnemonic.constants import ID_LENGTH_BITS, BASE_ITERATION_COUNT, ITERATION_EXP_LENGTH_BITS
 
 import hdwallet
 from hdwallet		import cryptocurrencies, exceptions
@@ -41,15 +51,23 @@ from hdwallet.seeds	import SLIP39Seed
 from hdwallet.entropies	import SLIP39Entropy
 from hdwallet.mnemonics	import MNEMONICS
 from hdwallet.hds	import BIP44HD, BIP49HD, BIP84HD
-from hdwallet.derivations import BIP44Derivation, BIP49Derivation, BIP84Derivation, CustomDerivation
+from hdwallet.consts	import SLIP10_SECP256K1_CONST, PUBLIC_KEY_TYPES
+from hdwallet.crypto	import hash160
+from hdwallet.libs.base58 import check_encode
+from hdwallet.libs.segwit_bech32 import segwit_encode
+from hdwallet.eccs.slip10 import secp256k1 as secp256k1_eccs
+from hdwallet.derivations import IDerivation, BIP44Derivation, BIP49Derivation, BIP84Derivation, CustomDerivation
 from hdwallet.addresses	import ADDRESSES
 from hdwallet.exceptions import SymbolError
+from hdwallet.utils	import normalize_derivation, integer_to_bytes
 
 from .defaults		import (
-    BITS_DEFAULT, BITS, MNEM_ROWS_COLS, GROUPS, GROUP_REQUIRED_RATIO, GROUP_THRESHOLD_RATIO, CRYPTO_PATHS
+    BITS_DEFAULT, BITS, MNEM_ROWS_COLS, GROUPS, GROUP_REQUIRED_RATIO, GROUP_THRESHOLD_RATIO, CRYPTO_PATHS,
+    DERIVATION_CACHE_SIZE, GAP_LIMIT, ADDRESS_CACHE_VERIFY, COLUMNS_CHUNKSIZE, ITERATION_SECONDS,
+    STRETCH_CHECKPOINT,
 )
-from .util		import ordinal, commas, is_mapping
-from .recovery		import produce_bip39, recover_bip39, recover as recover_slip39
+from .util		import ordinal, commas, is_mapping, timer, NpyWriter
+from .recovery		import produce_bip39_seed, recover_bip39, recover as recover_slip39, recover_encrypted, secret_remember
 from .exceptions	import SymbolError
 
 __author__                      = "Perry Kundert"
@@ -141,6 +159,103 @@ def path_edit(
         return edit
 
 
+class DerivationCache:
+    """A bounded (least-recently used) cache of derived HD wallet nodes, keyed by the root node and the
+    derivation path prefix (as a tuple of indices) leading to each node.
+
+    Deriving m/44'/60'/0'/0/0..N one Account at a time repeats all the derivations of the common
+    m/44'/60'/0'/0 parent for every address; 5 child key derivations where 1 would do.  Instead, we
+    find the deepest already derived node along the desired path, and only derive the remainder.
+
+    The root node is identified by its ECC curve, chain code, public key, and whether or not it
+    has a private key (a node derived from an xpub... root is incapable of hardened derivations, so
+    mustn't share nodes with one derived from the corresponding xprv...).  The "fingerprint" of a
+    root key is only 4 bytes, and is not unique enough for our purposes.
+
+    The 'hits' count the child key derivations avoided; 'misses' those actually performed.
+
+    Since the cached nodes may contain private keys, a cache should live no longer than the
+    MasterSecret (or Accounts) using it.
+
+    """
+    NODE			= (
+        '_private_key', '_chain_code', '_public_key', '_parent_fingerprint', '_depth', '_index', '_fingerprint',
+    )
+
+    def __init__( self, size: Optional[int] = None ):
+        self.size		= DERIVATION_CACHE_SIZE if size is None else size
+        self.nodes		= OrderedDict()
+        self.hits		= 0
+        self.misses		= 0
+
+    def __len__( self ):
+        return len( self.nodes )
+
+    def __repr__( self ):
+        return f"{self.__class__.__name__}({len(self)}/{self.size} nodes, {self.hits} hits, {self.misses} misses)"
+
+    def clear( self ):
+        self.nodes.clear()
+        self.hits		= 0
+        self.misses		= 0
+
+    @staticmethod
+    def root( hd ) -> Tuple[str,bytes,bytes,bool]:
+        """Identify the HD's root node."""
+        return (
+            hd._ecc.__class__.__name__,
+            hd._root_chain_code,
+            hd._root_public_key.raw_compressed() if hd._root_public_key else None,
+            hd._root_private_key is not None,
+        )
+
+    def derive( self, wallet: hdwallet.HDWallet, derivation: IDerivation ) -> hdwallet.HDWallet:
+        """Derive the HDWallet along the derivation path from its root node, starting from the deepest
+        cached node along the path.  Equivalent to wallet.from_derivation( derivation ).
+
+        """
+        hd			= wallet._hd
+        root			= self.root( hd )
+        indexes			= tuple( derivation.indexes() )
+        depth			= len( indexes )
+        while depth:
+            node		= self.nodes.get( (root, indexes[:depth]) )
+            if node is not None:
+                self.nodes.move_to_end( (root, indexes[:depth]) )
+                for a,v in zip( self.NODE, node ):
+                    setattr( hd, a, v )
+                break
+            depth	       -= 1
+        else:
+            hd.clean_derivation()
+        hd._derivation		= derivation
+        self.hits	       += depth
+        self.misses	       += len( indexes ) - depth
+        while depth < len( indexes ):
+            hd.drive( indexes[depth] )
+            depth	       += 1
+            self.nodes[root, indexes[:depth]] = tuple( getattr( hd, a, None ) for a in self.NODE )
+            if len( self.nodes ) > self.size:
+                self.nodes.popitem( last=False )
+        wallet._derivation	= derivation
+        return wallet
+
+
+class CryptoProfile( namedtuple( 'CryptoProfile', ('crypto', 'format', 'cryptocurrency', 'hd', 'address', 'semantic', 'network', 'path') )):
+    """Everything required to construct an HDWallet for a crypto's address format, resolved once by
+    Account.profile: its hdwallet cryptocurrency class, HD class, address class, semantic, default
+    network and default derivation path.
+
+    """
+    __slots__			= ()
+
+    def hdwallet( self, **args ) -> hdwallet.HDWallet:
+        """Construct a new (unseeded) HDWallet for this profile."""
+        return hdwallet.HDWallet(
+            cryptocurrency=self.cryptocurrency, hd=self.hd, network=self.network, address=self.address,
+            semantic=self.semantic, **args )
+
+
 class Account:
     """A Cryptocurrency "Account" / Wallet, based on a variety of underlying Python crypto-asset
     support modules.  Presently, only meherett/python-hdwallet is used.
@@ -361,14 +476,39 @@ class Account:
         ),
     )
 
+    # The secp256k1 ECC implementations supported by hdwallet, by backend (and module) name, fastest
+    # first.  Each is available only if its module is installed.  By default, we use hdwallet's own
+    # default (SLIP10_SECP256K1_CONST.USE); see ecc_backend.
+    ECC_BACKENDS		= dict(
+        coincurve	= secp256k1_eccs.SLIP10Secp256k1ECCCoincurve,		# libsecp256k1
+        ecdsa		= secp256k1_eccs.SLIP10Secp256k1ECCECDSA,		# pure Python
+    )
+    ECC_BACKEND			= None
+    ECC_AVAILABLE		= None  # The available ECC_BACKENDS names, once known
+
+    # Serializes the registration of dynamically supported cryptocurrencies; see supported
+    REGISTRY_LOCK		= threading.RLock()
+
+    # The CryptoProfile of each (<SYMBOL>,<format>), and pristine (unseeded) HDWallet templates for
+    # each (<SYMBOL>,<format>,<ECC>), as they are used; see profile, hdwallet_template
+    PROFILES			= {}
+    TEMPLATES			= {}
+
+    # The HDWallet and HD attributes defining a root node; see .root, .from_root
+    HDWALLET_ROOT		= ( '_entropy', '_mnemonic', '_seed' )
+    HD_ROOT			= (
+        '_seed', '_hmac', '_strict',
+        '_root_private_key', '_root_chain_code', '_root_public_key', '_root_depth', '_root_index',
+    )
+
     @classmethod
-    def path_default( cls, crypto, format=None ):
+    def path_default( cls, crypto, format=None, context=None ):
         """Return the default derivation path for the given crypto, based on its currently selected default
-        address format.
+        address format (or that selected by the supplied FormatContext).
 
         """
         crypto			= cls.supported( crypto )
-        format			= format.lower() if format else cls.address_format( crypto )
+        format			= format.lower() if format else ( context or cls ).address_format( crypto )
         if format not in cls.CRYPTO_FORMAT_PATH[crypto]:
             raise ValueError( f"{format} not supported for {crypto}; specify one of {commas( cls.CRYPTO_FORMAT_PATH[crypto].keys() )}" )
         return cls.CRYPTO_FORMAT_PATH[crypto][format]
@@ -378,7 +518,8 @@ class Account:
         """Get or set the desired default address format for the specified supported crypto.
 
         Future instances of Address created for the crypto will use the specified address format and
-        its default derivation path.
+        its default derivation path.  This is a process-wide default; to use a different format for
+        only some calls (eg. concurrently, in different threads), supply a FormatContext instead.
 
         """
         crypto			= cls.supported( crypto )
@@ -390,12 +531,95 @@ class Account:
             raise ValueError( f"{crypto} address format {format!r} not recognized; specify one of {commas( cls.FORMATS )}" )
         cls.CRYPTO_FORMAT[crypto]	= format
 
+    @classmethod
+    def profile( cls, crypto, format=None, context=None ) -> CryptoProfile:
+        """Return the CryptoProfile for the crypto's address format (default: that selected by the
+        FormatContext, or the crypto's address_format).  Each is resolved only once.
+
+        """
+        crypto			= cls.supported( crypto )
+        format			= format.lower() if format else ( context or cls ).address_format( crypto )
+        profile			= cls.PROFILES.get( (crypto, format) )
+        if profile is None:
+            cryptocurrency	= cryptocurrencies.CRYPTOCURRENCIES.cryptocurrency( cls.CRYPTO_SYMBOLS[crypto] )
+            # Fails if the cryptocurrency is incapable of representing address/semantic in the
+            # desired format.
+            profile		= CryptoProfile(
+                crypto		= crypto,
+                format		= format,
+                cryptocurrency	= cryptocurrency,
+                hd		= cls.CRYPTO_FORMAT_HD[crypto][format],
+                address		= cls.CRYPTO_FORMAT_ADDRESS[crypto][format],
+                semantic	= cls.CRYPTO_FORMAT_SEMANTIC[crypto][format],
+                network		= cryptocurrency.DEFAULT_NETWORK,
+                path		= cls.CRYPTO_FORMAT_PATH[crypto][format],
+            )
+            with cls.REGISTRY_LOCK:
+                cls.PROFILES	= { **cls.PROFILES, (crypto, format): profile }
+        return profile
+
+    @classmethod
+    def hdwallet_template( cls, profile: CryptoProfile, ecc=None, passphrase=None ) -> hdwallet.HDWallet:
+        """Return a new (unseeded) HDWallet for the CryptoProfile, using the 'ecc' class (default:
+        the cryptocurrency's own), by cloning a pristine template HDWallet.
+
+        Constructing an HDWallet re-validates its cryptocurrency, HD, network, address and semantic
+        every time, which is a large part of the cost of deriving an Account at a short path.  The
+        clone shares only the template's immutable parts; its HD (and its derivation) are its own.
+
+        """
+        key			= (profile.crypto, profile.format, ecc)
+        template		= cls.TEMPLATES.get( key )
+        if template is None:
+            template		= profile.hdwallet( **( dict( ecc=ecc ) if ecc else {} ))
+            with cls.REGISTRY_LOCK:
+                cls.TEMPLATES	= { **cls.TEMPLATES, key: template }
+        wallet			= copy.copy( template )
+        wallet._kwargs		= dict( template._kwargs )
+        wallet._hd		= copy.copy( template._hd )
+        # The derivation's lists (of immutable indices, tuples) are extended/cleaned in place
+        wallet._hd._derivation	= derivation = copy.copy( template._hd._derivation )
+        for name,value in vars( derivation ).items():
+            if isinstance( value, list ):
+                setattr( derivation, name, list( value ))
+        if passphrase is not None:
+            wallet._passphrase	= passphrase
+        return wallet
+
+    @classmethod
+    def ecc_backends( cls ) -> List[str]:
+        """The names of the secp256k1 ECC backends whose implementation is installed, fastest first."""
+        if cls.ECC_AVAILABLE is None:
+            cls.ECC_AVAILABLE	= [ name for name in cls.ECC_BACKENDS if importlib.util.find_spec( name ) ]
+        return cls.ECC_AVAILABLE
+
+    @classmethod
+    def ecc_backend( cls, backend=None ):
+        """Get or set the default secp256k1 ECC backend, eg. 'coincurve' or 'ecdsa', for future
+        instances of Account.  Set to False to restore hdwallet's own default.
+
+        """
+        if backend is None:
+            return cls.ECC_BACKEND or SLIP10_SECP256K1_CONST.USE
+        if backend:
+            cls.ecc( backend )  # Raises ValueError if not available
+        cls.ECC_BACKEND		= backend.lower() if backend else None
+
+    @classmethod
+    def ecc( cls, backend=None ):
+        """Return the hdwallet secp256k1 ECC class implemented by the backend (default: ecc_backend)."""
+        backend			= backend.lower() if backend else cls.ecc_backend()
+        if backend not in cls.ecc_backends():
+            raise ValueError( f"secp256k1 backend {backend!r} not available; specify one of {commas( cls.ecc_backends() )}" )
+        return cls.ECC_BACKENDS[backend]
+
     @classmethod
     def supported( cls, crypto ):
         """Validates that the specified cryptocurrency is supported and returns the normalized "SYMBOL"
         for it, or raises an a ValueError.  Eg. "ETH"/"Ethereum" --> "ETH"
 
-        If not currently available, attempts to add it, defining:
+        If not currently available, attempts to add it (holding the REGISTRY_LOCK, so concurrent
+        threads may safely request new cryptocurrencies), defining:
 
             cls.CRYPTO_SYMBOLS[<SYMBOL>]	= "Name"
             cls.CRYPTO_NAMES["name"]		= <SYMBOL>
@@ -406,75 +630,87 @@ class Account:
         Yields an HDWallet SymbolError on unsupported symbol.
 
         """
-        try:
-            validated		= cls.CRYPTO_NAMES.get(
+        def registered():
+            return cls.CRYPTO_NAMES.get(
                 crypto.lower(),
                 crypto.upper() if crypto.upper() in cls.CRYPTO_SYMBOLS else None
             )
-            if validated:
-                return validated
 
-            # Attempt to find it by Name/SYM in hdwallet.cryptocurrencies, or raise SymbolError
-            try:
-                validated_cls	= cryptocurrencies.CRYPTOCURRENCIES.cryptocurrency( crypto )
-            except exceptions.Error:
-                validated_cls	= cryptocurrencies.get_cryptocurrency( crypto )
-            validated		= validated_cls.SYMBOL
-
-            # Unable to support Cardano or Monero, which doesn't use the default BIP44 derivation.
-            cls.CRYPTO_SYMBOLS[validated]	= validated_cls.NAME
-            cls.CRYPTO_DECIMALS[validated]	= 18  # Default
-            cls.CRYPTO_NAMES[validated_cls.NAME.lower()] = validated
-            cls.CRYPTOCURRENCIES = set( cls.CRYPTO_NAMES.values() )
-            # Any dynamically added Cryptocurrency is considered "Beta"
-            cls.CRYPTOCURRENCIES_BETA	       |= {validated}
-
-            if str(validated_cls.DEFAULT_HD) != "BIP44":
-                raise SymbodError(
-                    f"Unknown default format; unable to support {validated_cls.NAME}"
-                )
-            # If BIP44 supported, consider it the legacy format. If BIP49: segwit, BIP84: bech32
-            cls.CRYPTO_FORMAT_PATH[validated]	= path = {}
-            cls.CRYPTO_FORMAT_SEMANTIC[validated]= sems = {}
-            cls.CRYPTO_FORMAT_ADDRESS[validated]= addr = {}
-            cls.CRYPTO_FORMAT_HD[validated]= hder = {}
-            cls.CRYPTO_FORMAT_DERIVATION[validated]= ders = {}
-            cls.CRYPTO_FORMAT[validated]	= "legacy"
-            
-            # The default format unless otherwise specified will be .CRYPTO_FORMAT[<SYMBOL>]; it'll
-            # be the highest BIP44/49/84 support by the cryptocurrency.
-            if hasattr( validated_cls.HDS, "BIP44" ):
-                path["legacy"]	= f"m/44'/{validated_cls.COIN_TYPE}'/0'/0/0"
-                sems["legacy"]	= "p2pkh"
-                addr["legacy"]	= ADDRESSES.address(validated_cls.DEFAULT_ADDRESS)
-                hder["legacy"]	= BIP44HD
-                ders["legacy"]	= BIP44Derivation
-            if hasattr( validated_cls.HDS, "BIP49" ):
-                path["segwit"]	= f"m/49'/{validated_cls.COIN_TYPE}'/0'/0/0"
-                sems["segwit"]	= "p2wpkh_in_p2sh"
-                addr["segwit"]	= ADDRESSES.addresses("P2WPKH-IN-P2SH")
-                hder["segwit"]	= BIP49HD
-                ders["segwit"]	= BIP49Derivation
-                cls.CRYPTO_FORMAT[validated]	= "segwit"
-            if hasattr( validated_cls.HDS, "BIP84" ):
-                path["bech32"]	= f"m/84'/{validated_cls.COIN_TYPE}'/0'/0/0"
-                sems["bech32"]	= "p2wpkh"
-                addr["bech32"]	= ADDRESSES.address("P2WPKH")
-                hder["bech32"]	= BIP84HD
-                ders["bech32"]	= BIP84Derivation
-                cls.CRYPTO_FORMAT[validated]	= "bech32"
-            if not path:
-                raise SymbolError(
-                    f"Unsupported HD derivation for cryptocurrency {validated_cls.NAME}"
-                )
+        validated		= registered()
+        if validated:
+            return validated
+        try:
+            with cls.REGISTRY_LOCK:
+                # Another thread may have just registered it
+                validated	= registered()
+                if validated:
+                    return validated
 
-            # If BIP38 is supported, use it otherwise assume Ethereum
-            if validated_cls.SUPPORT_BIP38:
-                cls.BIP38_ENCRYPT      |= {validated}
-            else:
-                cls.ETHJS_ENCRYPT      |= {validated}
+                # Attempt to find it by Name/SYM in hdwallet.cryptocurrencies, or raise SymbolError
+                try:
+                    validated_cls = cryptocurrencies.CRYPTOCURRENCIES.cryptocurrency( crypto )
+                except exceptions.Error:
+                    validated_cls = cryptocurrencies.get_cryptocurrency( crypto )
+                validated	= validated_cls.SYMBOL
+
+                # Unable to support Cardano or Monero, which doesn't use the default BIP44 derivation.
+                if str(validated_cls.DEFAULT_HD) != "BIP44":
+                    raise SymbolError(
+                        f"Unknown default format; unable to support {validated_cls.NAME}"
+                    )
+                # If BIP44 supported, consider it the legacy format. If BIP49: segwit, BIP84: bech32
+                path,sems,addr,hder,ders = {},{},{},{},{}
+                default		= "legacy"
+
+                # The default format unless otherwise specified will be .CRYPTO_FORMAT[<SYMBOL>]; it'll
+                # be the highest BIP44/49/84 support by the cryptocurrency.
+                if hasattr( validated_cls.HDS, "BIP44" ):
+                    path["legacy"] = f"m/44'/{validated_cls.COIN_TYPE}'/0'/0/0"
+                    sems["legacy"] = "p2pkh"
+                    addr["legacy"] = ADDRESSES.address(validated_cls.DEFAULT_ADDRESS)
+                    hder["legacy"] = BIP44HD
+                    ders["legacy"] = BIP44Derivation
+                if hasattr( validated_cls.HDS, "BIP49" ):
+                    path["segwit"] = f"m/49'/{validated_cls.COIN_TYPE}'/0'/0/0"
+                    sems["segwit"] = "p2wpkh_in_p2sh"
+                    addr["segwit"] = ADDRESSES.address("P2WPKH-In-P2SH")
+                    hder["segwit"] = BIP49HD
+                    ders["segwit"] = BIP49Derivation
+                    default	= "segwit"
+                if hasattr( validated_cls.HDS, "BIP84" ):
+                    path["bech32"] = f"m/84'/{validated_cls.COIN_TYPE}'/0'/0/0"
+                    sems["bech32"] = "p2wpkh"
+                    addr["bech32"] = ADDRESSES.address("P2WPKH")
+                    hder["bech32"] = BIP84HD
+                    ders["bech32"] = BIP84Derivation
+                    default	= "bech32"
+                if not path:
+                    raise SymbolError(
+                        f"Unsupported HD derivation for cryptocurrency {validated_cls.NAME}"
+                    )
 
-            return validated
+                # Publish the fully validated cryptocurrency.  Each registry is replaced (never
+                # mutated), so other threads' lookups (or iterations) are unaffected, and the Name
+                # and Symbol are published last, so it isn't supported 'til completely registered.
+                # Any dynamically added Cryptocurrency is considered "Beta".  If BIP38 is supported,
+                # use it otherwise assume Ethereum
+                cls.CRYPTO_FORMAT_PATH	= dict( cls.CRYPTO_FORMAT_PATH, **{validated: path} )
+                cls.CRYPTO_FORMAT_SEMANTIC = dict( cls.CRYPTO_FORMAT_SEMANTIC, **{validated: sems} )
+                cls.CRYPTO_FORMAT_ADDRESS = dict( cls.CRYPTO_FORMAT_ADDRESS, **{validated: addr} )
+                cls.CRYPTO_FORMAT_HD	= dict( cls.CRYPTO_FORMAT_HD, **{validated: hder} )
+                cls.CRYPTO_FORMAT_DERIVATION = dict( cls.CRYPTO_FORMAT_DERIVATION, **{validated: ders} )
+                cls.CRYPTO_FORMAT	= dict( cls.CRYPTO_FORMAT, **{validated: default} )
+                cls.CRYPTO_DECIMALS	= dict( cls.CRYPTO_DECIMALS, **{validated: 18} )  # Default
+                if validated_cls.SUPPORT_BIP38:
+                    cls.BIP38_ENCRYPT	= cls.BIP38_ENCRYPT | {validated}
+                else:
+                    cls.ETHJS_ENCRYPT	= cls.ETHJS_ENCRYPT | {validated}
+                cls.CRYPTOCURRENCIES_BETA = cls.CRYPTOCURRENCIES_BETA | {validated}
+                cls.CRYPTOCURRENCIES	= cls.CRYPTOCURRENCIES | {validated}
+                cls.CRYPTO_SYMBOLS	= dict( cls.CRYPTO_SYMBOLS, **{validated: validated_cls.NAME} )
+                cls.CRYPTO_NAMES	= dict( cls.CRYPTO_NAMES, **{validated_cls.NAME.lower(): validated} )
+
+                return validated
 
         except Exception as exc:
             validated		= exc
@@ -482,8 +718,6 @@ class Account:
         finally:
             log.debug( f"Validating {crypto!r} yields: {validated!r}" )
 
-        raise SymbolError( f"{crypto} not presently supported" )
-
     def __str__( self ):
         """Until from_seed/from_path are invoked, may not have an address or derivation path."""
         address			= None
@@ -496,27 +730,75 @@ class Account:
     def __repr__( self ):
         return f"{self.__class__.__name__}({self} @{self.path})"
 
-    def __init__( self, crypto, format=None, **args ):
+    # The HD attributes containing ECC keys, which must be pickled as raw bytes
+    HD_KEYS			= ( '_root_private_key', '_root_public_key', '_private_key', '_public_key' )
+
+    def __getstate__( self ):
+        """Accounts may be pickled (eg. to return them from a worker process).  The underlying ECC
+        keys (eg. coincurve's) cannot be pickled, so we retain their class and raw bytes.  Any
+        DerivationCache is not retained, nor is any Mnemonic's (large, and only used for decoding)
+        word indices.
+
+        """
+        hd			= dict( vars( self.hdwallet._hd ))
+        for a in self.HD_KEYS:
+            if key := hd.get( a ):
+                hd[a]		= ( key.__class__, key.raw() if a.endswith( '_private_key' ) else key.raw_compressed() )
+        hdw			= dict( vars( self.hdwallet ), _hd=( self.hdwallet._hd.__class__, hd ))
+        if getattr( hdw.get( '_mnemonic' ), '_word_indices', None ):
+            hdw['_mnemonic']	= copy.copy( hdw['_mnemonic'] )
+            hdw['_mnemonic']._word_indices = None
+        return dict( vars( self ), cache=None, hdwallet=( self.hdwallet.__class__, hdw ))
+
+    def __setstate__( self, state ):
+        hdw_cls,hdw		= state.pop( 'hdwallet' )
+        hd_cls,hd		= hdw.pop( '_hd' )
+        for a in self.HD_KEYS:
+            if hd.get( a ):
+                key_cls,raw	= hd[a]
+                hd[a]		= key_cls.from_bytes( raw )
+        self.__dict__.update( state )
+        self.hdwallet		= hdw_cls.__new__( hdw_cls )
+        self.hdwallet.__dict__.update( hdw )
+        self.hdwallet._hd	= hd_cls.__new__( hd_cls )
+        self.hdwallet._hd.__dict__.update( hd )
+
+    def __init__(
+        self,
+        crypto,
+        format				= None,
+        cache: Optional[DerivationCache] = None,
+        backend: Optional[str]		= None,
+        context: Optional[FormatContext] = None,
+        **args
+    ):
         """Initialize account with the specified Cryptocurrency name/symbol 'crypto'.
 
         Specifies the Hierarchical Derivation and the default address type, format and network.
 
         Optionally supply a desired address 'semantic', 'passphrase', etc.
 
+        If a DerivationCache is supplied, derivations reuse (and retain) any nodes derived along the
+        same path prefix from the same root.
+
+        A secp256k1 cryptocurrency's keys are computed by the ECC 'backend' (default: ecc_backend).
+
+        If no format is supplied, the one selected by any FormatContext is used, or the crypto's
+        process-wide default address_format.
+
         """
-        crypto			= Account.supported( crypto )  # The Cryptocurrency SYM
-        name			= self.CRYPTO_SYMBOLS[crypto.upper()]
-        cryptocurrency		= cryptocurrencies.CRYPTOCURRENCIES.cryptocurrency( name )
-        self.format		= format.lower() if format else Account.address_format( crypto )
-        # Used for default address type, and derivation scheme for public/private keys.  Fails if
-        # the cryptocurrency is incapable of representing address/semantic in the desired the
-        # desired format.
-        semantic		= self.CRYPTO_FORMAT_SEMANTIC[crypto][self.format]
-        hd			= self.CRYPTO_FORMAT_HD[crypto][self.format]
-        address			= self.CRYPTO_FORMAT_ADDRESS[crypto][self.format]
-        network			= cryptocurrency.DEFAULT_NETWORK
-        self.hdwallet		= hdwallet.HDWallet(
-            cryptocurrency=cryptocurrency, hd=hd, network=network, address=address, semantic=semantic, **args )
+        self.cache		= cache
+        self.formats		= None  # Any additional address formats desired; see .addresses
+        self.backend		= backend.lower() if backend else Account.ecc_backend()
+        # Used for default address type, and derivation scheme for public/private keys.
+        profile			= Account.profile( crypto, format, context=context )
+        self.format		= profile.format
+        if profile.cryptocurrency.ECC.NAME == secp256k1_eccs.SLIP10Secp256k1ECC.NAME:
+            args.setdefault( 'ecc', Account.ecc( self.backend ))
+        if set( args ) <= { 'ecc', 'passphrase' }:
+            self.hdwallet	= Account.hdwallet_template( profile, **args )
+        else:
+            self.hdwallet	= profile.hdwallet( **args )
 
     def from_entropy(
         self,
@@ -757,12 +1039,44 @@ class Account:
             raise ValueError( f"Unrecognized HD wallet derivation path: {from_path!r}" )
 
         # In order to support any number of derivation path segments, we only use CustomDerivation
-        self.hdwallet.from_derivation( derivation=CustomDerivation( path=from_path ))
+        return self.from_derivation( derivation=CustomDerivation( path=from_path ))
+
+    def from_derivation( self, derivation: IDerivation ) -> Account:
+        if self.cache is None:
+            self.hdwallet.clean_derivation()
+            self.hdwallet.update_derivation( derivation )
+        else:
+            self.cache.derive( self.hdwallet, derivation )
         return self
 
-    def from_derivation( self, derivation: IDerivation ):
-        self.hdwallet.clean_derivation()
-        self.hdwallet.update_derivation( derivation )
+    @property
+    def root( self ) -> Tuple[Dict[str,Any],Dict[str,Any]]:
+        """Returns the HDWallet (and its underlying HD's) root node state; everything required to derive
+        any path from the same seed/xkey, without repeating the Mnemonic/Seed decoding and HMAC
+        SHA-512 processing.  Only useful to restore into another Account of a cryptocurrency using
+        the same ECC curve, via from_root.
+
+        """
+        return (
+            { a: getattr( self.hdwallet, a, None ) for a in self.HDWALLET_ROOT },
+            { a: getattr( self.hdwallet._hd, a, None ) for a in self.HD_ROOT },
+        )
+
+    def from_root( self, root: Tuple[Dict[str,Any],Dict[str,Any]] ) -> Account:
+        """Restore the root node state obtained from another Account's .root, leaving this Account at
+        its clean (root) derivation, with its default derivation path.  Follow with from_path (for
+        Seeds) or from_derivation (for xkeys), as usual.
+
+        """
+        root_hdwallet,root_hd	= root
+        for a,v in root_hdwallet.items():
+            setattr( self.hdwallet, a, v )
+        for a,v in root_hd.items():
+            setattr( self.hdwallet._hd, a, v )
+        self.hdwallet._hd._index = self.hdwallet._hd._root_index
+        self.hdwallet._hd.clean_derivation()
+        self.hdwallet._derivation = self.hdwallet._hd.derivation()
+        return self
 
     @property
     def address( self ):
@@ -787,6 +1101,55 @@ class Account:
             address=self.CRYPTO_FORMAT_ADDRESS[self.hdwallet.symbol()]["bech32"]
         )
 
+    def format_addresses( self, formats: Optional[Sequence[str]] = None ) -> Tuple[str,...]:
+        """Returns the addresses in each of the formats (default: all formats supported by the crypto),
+        eg. the 1..., 3... and bc1... legacy, segwit and bech32 addresses of a BTC Account's current
+        node.  The node is not re-derived, and its public key's hash160 (which each of these formats
+        encodes) is computed only once.
+
+        """
+        crypto			= self.hdwallet.symbol()
+        supported		= self.CRYPTO_FORMAT_ADDRESS[crypto]
+        formats			= [ format.lower() for format in formats or supported.keys() ]
+        if unsupported := [ format for format in formats if format not in supported ]:
+            raise ValueError( f"{crypto} address format(s) {commas( map( repr, unsupported ))} not supported; specify one of {commas( supported )}" )
+        network			= self.hdwallet._network
+        public_key_hash		= None
+        addresses		= []
+        for format in formats:
+            address		= supported[format]
+            name		= address.name()
+            if name not in ( "P2PKH", "P2WPKH-In-P2SH", "P2WPKH" ):
+                addresses.append( self.hdwallet.address( address=address ))
+                continue
+            if public_key_hash is None:
+                public_key	= self.hdwallet._hd._public_key
+                public_key_hash	= hash160(
+                    public_key.raw_compressed()
+                    if self.hdwallet.public_key_type() == PUBLIC_KEY_TYPES.COMPRESSED else
+                    public_key.raw_uncompressed()
+                )
+            if name == "P2PKH":
+                addresses.append( check_encode(
+                    integer_to_bytes( network.PUBLIC_KEY_ADDRESS_PREFIX ) + public_key_hash,
+                    alphabet	= address.alphabet,
+                ))
+            elif name == "P2WPKH-In-P2SH":
+                addresses.append( check_encode(
+                    integer_to_bytes( network.SCRIPT_ADDRESS_PREFIX ) + hash160( b'\x00\x14' + public_key_hash ),
+                    alphabet	= address.alphabet,
+                ))
+            else:
+                addresses.append( segwit_encode(
+                    network.HRP, network.WITNESS_VERSIONS.get_witness_version( name ), public_key_hash
+                ))
+        return tuple( addresses )
+
+    @property
+    def addresses( self ) -> Tuple[str,...]:
+        """Returns the address in each of the Account's desired .formats (default: all formats)."""
+        return self.format_addresses( self.formats )
+
     @property
     def name( self ):
         return self.hdwallet._cryptocurrency.NAME
@@ -916,17 +1279,185 @@ class Account:
         return self
 
 
-def path_parser(
+class AccountRecord:
+    """A compact, immutable record of an Account's crypto, format, path and address, and optionally
+    its pubkey and/or xpubkey.
+
+    Each Account holds a live HDWallet, with its private key material, derivation state and
+    cryptocurrency classes; holding hundreds of thousands of them (eg. while buffering generated
+    account groups) is very expensive.  Where only the account's public details are required (eg. by
+    accountgroups_output, Invoice, or produce_pdf's address QR codes and labels), an AccountRecord
+    may be used instead.  The full Account may be re-derived on demand from the same master secret,
+    via .account( master_secret ); eg. paper wallets require the Account's private key.
+
+    """
+    __slots__			= ( 'crypto', 'format', 'path', 'address', 'pubkey', 'xpubkey' )
+
+    def __init__(
+        self,
+        crypto: str,
+        format: str,
+        path: str,
+        address: str,
+        pubkey: Optional[str]	= None,
+        xpubkey: Optional[str]	= None,
+    ):
+        for name,value in zip( self.__slots__, ( crypto, format, path, address, pubkey, xpubkey )):
+            object.__setattr__( self, name, value )
+
+    def __setattr__( self, name, value ):
+        raise AttributeError( f"{self.__class__.__name__} is immutable" )
+
+    def __delattr__( self, name ):
+        raise AttributeError( f"{self.__class__.__name__} is immutable" )
+
+    def __reduce__( self ):
+        return self.__class__, self.fields()
+
+    def fields( self ) -> Tuple[Optional[str],...]:
+        return tuple( getattr( self, name ) for name in self.__slots__ )
+
+    def __eq__( self, other ):
+        return isinstance( other, AccountRecord ) and self.fields() == other.fields()
+
+    def __hash__( self ):
+        return hash( self.fields() )
+
+    def __str__( self ):
+        return f"{self.crypto}: {self.address}"
+
+    def __repr__( self ):
+        return f"{self.__class__.__name__}({self} @{self.path})"
+
+    @property
+    def name( self ):
+        return Account.CRYPTO_SYMBOLS[self.crypto]
+
+    @property
+    def symbol( self ):
+        return self.crypto
+
+    @classmethod
+    def from_account( cls, acct: Account, keys: Sequence[str] = () ) -> AccountRecord:
+        """Record the Account's public details, and any of the desired keys, eg. ('pubkey','xpubkey')."""
+        return cls(
+            crypto	= acct.crypto,
+            format	= acct.format,
+            path	= acct.path,
+            address	= acct.address,
+            **{ key: getattr( acct, key ) for key in keys },
+        )
+
+    def account(
+        self,
+        master_secret: Union[str,bytes,MasterSecret],
+        passphrase: Optional[Union[bytes,str]] = None,
+        using_bip39: bool	= False,
+    ) -> Account:
+        """Materialize the full Account, from the master_secret that this AccountRecord was derived from."""
+        acct			= account(
+            master_secret,
+            crypto	= self.crypto,
+            path	= self.path,
+            format	= self.format,
+            passphrase	= passphrase,
+            using_bip39	= using_bip39,
+        )
+        assert acct.address == self.address, \
+            f"{self!r} was not derived from the supplied master secret"
+        return acct
+
+
+class FormatContext( Mapping ):
+    """An immutable selection of default address formats, by crypto, eg. FormatContext( BTC='segwit' ).
+
+    Account.address_format changes the process-wide default address format (in the Account class),
+    so different formats cannot be used concurrently by different threads (eg. serving different
+    clients).  Instead, supply a FormatContext as the 'context' of account, accounts, accountgroups,
+    cryptopaths_parser, etc.; any crypto it selects a format for uses it (and its default derivation
+    path) instead of the process-wide default, for that call only.
+
+    A FormatContext is a read-only Mapping of {<SYMBOL>: <format>}; it is hashable, and may be
+    pickled (eg. to a worker process).  Use .replace to derive a new context.
+
+    """
+    __slots__			= ( '_formats', )
+
+    def __init__(
+        self,
+        formats: Optional[Union[Dict[str,str],Sequence[Tuple[str,str]]]] = None,
+        **kwds
+    ):
+        selected		= {}
+        for crypto,format in dict( formats or {}, **kwds ).items():
+            crypto		= Account.supported( crypto )
+            format		= format.lower()
+            if format not in Account.CRYPTO_FORMAT_PATH[crypto]:
+                raise ValueError( f"{crypto} address format {format!r} not supported; specify one of {commas( Account.CRYPTO_FORMAT_PATH[crypto] )}" )
+            selected[crypto]	= format
+        object.__setattr__( self, '_formats', selected )
+
+    @classmethod
+    def parse( cls, specs: Sequence[str] ) -> FormatContext:
+        """Parse "<crypto>:<format>" specifications, eg. from a --format command-line option."""
+        return cls( spec.split( ':' ) for spec in specs )
+
+    def replace( self, formats: Optional[Dict[str,str]] = None, **kwds ) -> FormatContext:
+        """Return a new FormatContext, with these (additional) formats selected."""
+        return self.__class__( dict( self, **dict( formats or {}, **kwds )))
+
+    def __setattr__( self, name, value ):
+        raise AttributeError( f"{self.__class__.__name__} is immutable" )
+
+    def __delattr__( self, name ):
+        raise AttributeError( f"{self.__class__.__name__} is immutable" )
+
+    def __reduce__( self ):
+        return self.__class__, ( self._formats, )
+
+    def __getitem__( self, crypto ):
+        return self._formats[crypto]
+
+    def __iter__( self ):
+        return iter( self._formats )
+
+    def __len__( self ):
+        return len( self._formats )
+
+    def __hash__( self ):
+        return hash( frozenset( self._formats.items() ))
+
+    def __repr__( self ):
+        return f"{self.__class__.__name__}({', '.join( f'{c}={f!r}' for c,f in self._formats.items() )})"
+
+    def resolve( self, crypto: Optional[str], format: Optional[str] = None ) -> Optional[str]:
+        """The supplied format, or the format selected by this context for the crypto (default 'ETH');
+        None if neither (ie. use the process-wide default).
+
+        """
+        return format or self._formats.get( Account.supported( crypto or 'ETH' ))
+
+    def address_format( self, crypto: str ) -> str:
+        """The crypto's address format in this context; like Account.address_format (but never sets it)."""
+        crypto			= Account.supported( crypto )
+        return self._formats.get( crypto ) or Account.address_format( crypto )
+
+    def path_default( self, crypto: str, format: Optional[str] = None ) -> str:
+        """The crypto's default derivation path in this context."""
+        return Account.path_default( crypto, format=format, context=self )
+
+
+def path_ranges(
     paths: str,
     allow_unbounded: bool	= True,
-) -> Tuple[str, Dict[str, Callable[[], int]]]:
-    """Create a format and a dictionary of iterators to feed into it.
+) -> Tuple[str, List[Tuple[str,int,Optional[int]]]]:
+    """Create a format, and the (<key>,<begin>,<end>) of each range (in order) to feed into it; an
+    unbounded range's end is None.
 
     Supports paths with an arbitrary prefix, eg. 'm/' or '../'
     """
     path_segs			= paths.split( '/' )
-    unbounded			= False
-    ranges			= {}
+    ranges			= []
 
     for i,s in list( enumerate( path_segs )):
         if '-' not in s:
@@ -939,19 +1470,33 @@ def path_parser(
         b			= int( b or 0 )
         if e:
             e			= int( e )
-            ranges[c]		= lambda b=b,e=e: range( b, e+1 )
         else:
-            assert allow_unbounded and not ( unbounded or ranges ), \
+            assert allow_unbounded and not ranges, \
                 f"{'Only first' if allow_unbounded else 'No'} range allowed to be unbounded;" \
                 f" this is the {ordinal(len(ranges)+1)} range in {paths}"
-            unbounded		= True
-            ranges[c]		= lambda b=b: itertools.count( b )
+            e			= None
+        ranges.append( (c, b, e) )
         path_segs[i]		= f"{{{c}}}" + ( "'" if tic else "" )
 
     path_fmt			= '/'.join( path_segs )
     return path_fmt, ranges
 
 
+def path_parser(
+    paths: str,
+    allow_unbounded: bool	= True,
+) -> Tuple[str, Dict[str, Callable[[], int]]]:
+    """Create a format and a dictionary of iterators to feed into it.
+
+    Supports paths with an arbitrary prefix, eg. 'm/' or '../'
+    """
+    path_fmt,ranges		= path_ranges( paths, allow_unbounded=allow_unbounded )
+    return path_fmt, {
+        c: ( lambda b=b: itertools.count( b )) if e is None else ( lambda b=b,e=e: range( b, e+1 ))
+        for c,b,e in ranges
+    }
+
+
 def path_sequence(
     path_fmt: str,
     ranges: Dict[str, Callable[[], int]],
@@ -998,6 +1543,151 @@ def path_sequence(
                 values[k]	= next( viters[k], None )
 
 
+class PathRange:
+    """A compiled derivation path, with optional ranges, eg. "m/44'/60'/0-9'/0/0-99999", providing
+    random access to each of the paths that path_sequence would yield, in the same order.
+
+    Bounded ranges have a len(); any path is computed directly from its index (O(1) in the number
+    of paths), and slicing produces another (lazy) PathRange.  Thus, the 1,000,000th path, or any
+    slice (eg. from an unbounded "../-" range) is available without generating the prior paths:
+
+        >>> PathRange( "m/44'/60'/0-9'/0/0-99999" )[100000]
+        "m/44'/60'/1'/0/0"
+
+    The paths may be split into 'n' disjoint shards (either contiguous, or interleaved) for
+    concurrent generation on several hosts, without any coordination.  A None path yields just None
+    (ie. the crypto's default path).
+
+    """
+    def __init__(
+        self,
+        paths: Optional[str]	= None,
+        allow_unbounded: bool	= True,
+    ):
+        self.paths		= paths
+        self.path_fmt,self.ranges = ( None, [] ) if paths is None else path_ranges( paths, allow_unbounded=allow_unbounded )
+        # The selected base indices of the paths: start, stop (None if unbounded), step
+        self.start		= 0
+        self.stop		= self.total
+        self.step		= 1
+
+    @classmethod
+    def of( cls, paths: Optional[Union[str,PathRange]], allow_unbounded: bool = True ) -> PathRange:
+        """Compile the paths into a PathRange, unless already done."""
+        if not isinstance( paths, PathRange ):
+            return cls( paths, allow_unbounded=allow_unbounded )
+        assert allow_unbounded or paths.bounded, \
+            f"No range allowed to be unbounded in {paths!r}"
+        return paths
+
+    @property
+    def total( self ) -> Optional[int]:
+        """The number of paths in all the ranges (without any selection), or None if unbounded."""
+        total			= 1
+        for _,b,e in self.ranges:
+            if e is None:
+                return None
+            total	       *= max( 0, e - b + 1 )
+        return total
+
+    @property
+    def bounded( self ) -> bool:
+        return self.stop is not None
+
+    def __repr__( self ):
+        return f"{self.__class__.__name__}({self.paths!r}[{self.start}:{'' if self.stop is None else self.stop}:{self.step}])"
+
+    def __bool__( self ) -> bool:
+        """A PathRange is always a specified path (even if unbounded, or an empty selection)."""
+        return True
+
+    def __len__( self ) -> int:
+        if self.stop is None:
+            raise TypeError( f"Unbounded {self!r} has no len()" )
+        return len( range( self.start, self.stop, self.step ))
+
+    def indices( self ) -> Union[range,itertools.count]:
+        """The index (in all the ranges) of each of the selected paths."""
+        if self.stop is None:
+            return itertools.count( self.start, self.step )
+        return range( self.start, self.stop, self.step )
+
+    def path( self, n: int ) -> Optional[str]:
+        """The path at index n (in all the ranges, without any selection); the last range varies fastest."""
+        values			= {}
+        for c,b,e in reversed( self.ranges ):
+            if e is None:
+                n,values[c]	= 0, b + n
+            else:
+                n,v		= divmod( n, e - b + 1 )
+                values[c]	= b + v
+        return None if self.path_fmt is None else self.path_fmt.format( **values )
+
+    def __iter__( self ):
+        for n in self.indices():
+            yield self.path( n )
+
+    def __getitem__( self, i: Union[int,slice] ) -> Union[Optional[str],PathRange]:
+        if isinstance( i, slice ):
+            return self.select( i )
+        if self.stop is None:
+            if i < 0:
+                raise IndexError( f"Unbounded {self!r} doesn't support negative indexing" )
+            return self.path( self.start + i * self.step )
+        return self.path( self.indices()[i] )
+
+    def select( self, selection: slice ) -> PathRange:
+        """Return a PathRange with the slice of this one's selected paths."""
+        view			= copy.copy( self )
+        if self.stop is not None:
+            indices		= self.indices()[selection]
+            view.start,view.stop,view.step = indices.start, indices.stop, indices.step
+            return view
+        assert ( selection.step or 1 ) > 0 and all( i is None or i >= 0 for i in ( selection.start, selection.stop )), \
+            f"Unbounded {self!r} may only be sliced w/ positive start, stop and step"
+        view.start		= self.start + ( selection.start or 0 ) * self.step
+        view.stop		= None
+        if selection.stop is not None:
+            view.stop		= max( view.start, self.start + selection.stop * self.step )
+        view.step		= self.step * ( selection.step or 1 )
+        return view
+
+    def shard( self, k: int, n: int, interleaved: bool = True ) -> PathRange:
+        """Return the k'th (of 0, ..., n-1) of n disjoint shards of these paths; either interleaved (every
+        n'th path, starting at k; the only option if unbounded) or contiguous.
+
+        """
+        assert 0 <= k < n, \
+            f"Shard {k} must be in the range 0-{n-1}"
+        if interleaved:
+            return self[k::n]
+        assert self.bounded, \
+            f"Unbounded {self!r} may only be sharded interleaved"
+        size			= len( self )
+        return self[k * size // n:( k + 1 ) * size // n]
+
+    def selection(
+        self,
+        start: int		= 0,
+        count: Optional[int]	= None,
+        shard: Optional[Union[str,Tuple[int,int]]] = None,  # eg. "0/4" (or (0,4)); the first of 4 shards
+        interleaved: bool	= True,
+    ) -> PathRange:
+        """Select 'count' paths (default: all) from 'start', and then (optionally) the k/n 'shard' of them.
+        A None path (ie. the crypto's default path) is just one path; there's nothing to start from, or
+        shard.
+
+        """
+        if self.path_fmt is None and ( start or shard ):
+            raise ValueError( "A start or shard requires path ranges (eg. \"../0-\"), not the default path" )
+        view			= self[start:None if count is None else start + count]
+        if shard:
+            if isinstance( shard, str ):
+                shard		= tuple( map( int, shard.split( '/' )))
+            view		= view.shard( *shard, interleaved=interleaved )
+        return view
+
+
 def path_hardened( path ):
     """Remove any non-hardened components from the end of path, eg:
 
@@ -1032,6 +1722,7 @@ def cryptopaths_parser(
     edit			= None,
     hardened_defaults		= False,
     format			= None,
+    context: Optional[FormatContext] = None,
 ):
     """Generate a standard cryptopaths list, from the given sequnce of "<crypto>",
     (<crypto>,<paths>), (<crypto>,<paths>,<format>), or "<crypto>[:<paths>[:<format>:]"
@@ -1041,7 +1732,8 @@ def cryptopaths_parser(
     Adjusts the provided derivation paths by an optional eg. "../-" path adjustment.
 
     A non-default format may be specified, which may change the default HD derivation path.  This
-    must also be passed back, as it also affects the crypto's account's address format.
+    must also be passed back, as it also affects the crypto's account's address format.  Any format
+    selected by a FormatContext for a crypto is resolved here, and passed back.
 
     """
     for crypto in cryptocurrency or CRYPTO_PATHS:
@@ -1053,6 +1745,8 @@ def cryptopaths_parser(
         fmt,			= fmt or (format,)
 
         cry			= Account.supported( cry )
+        if context:
+            fmt			= context.resolve( cry, fmt )
         if not pth:
             pth			= Account.path_default( cry, fmt )
             if hardened_defaults:
@@ -1112,6 +1806,9 @@ def stretch_seed_entropy( entropy, n, bits, encoding=None ):
     first and subsequent Seeds (SHA-512 is used to stretch, so any encoded and stretched entropy
     data will be sufficient) for 128- and 256-bit seeds.
 
+    Each call stretches the entropy n times from scratch; to produce many successive Seeds from the
+    same entropy, use a SeedEntropyStretcher.
+
     """
     assert n == 0 or ( entropy and n >= 0 ), \
         f"Some Extra Seed Entropy is required to produce the {ordinal(n+1)}+ Seed(s)"
@@ -1138,6 +1835,81 @@ def stretch_seed_entropy( entropy, n, bits, encoding=None ):
     return entropy[:octets]
 
 
+class SeedEntropyStretcher:
+    """Produces the same n'th Seed Entropy as stretch_seed_entropy( entropy, n, bits, encoding ), but
+    incrementally: the SHA-512 chain state of the last Seed produced is retained, so the next Seed
+    requires only one more round, instead of n+1 rounds from scratch.  Producing each of the 1st to
+    n'th Seeds in turn thus costs O(n) rounds, instead of O(n^2).
+
+    Every 'checkpoint' rounds, the chain state is also remembered, so that stepping back to (or
+    jumping to) any earlier Seed requires at most 'checkpoint' rounds.  The 'rounds' count the SHA-512
+    rounds actually performed.
+
+    Since the chain states are derived from secret Seed Entropy, a stretcher should live no longer
+    than the Seed Entropy it was supplied.
+
+    """
+    def __init__( self, entropy, bits, encoding=None, checkpoint: Optional[int] = None ):
+        assert ( type(entropy) is bytes ) == ( not encoding ), \
+            "If non-binary Seed Entropy is supplied, an appropriate encoding must be specified"
+        self.entropy		= entropy
+        self.bits		= bits
+        self.encoding		= encoding
+        self.checkpoint		= STRETCH_CHECKPOINT if checkpoint is None else checkpoint
+        self.offset		= 0			# SHA-512 rounds preceding the 0th Seed
+        if encoding:
+            if encoding == 'hex_codec':
+                # Hexadecimal Entropy was provided; Use the raw encoded Hex data for the first round!
+                entropy		= f"{entropy:<0{bits // 4}.{bits // 4}}"
+                entropy		= codecs.decode( entropy, encoding )
+            else:
+                # Other encoding was provided, eg 'UTF-8', 'ASCII', ...; stretch for the 0th Seed, too.
+                self.offset	= 1
+                entropy		= codecs.encode( entropy, encoding )
+        self.states		= { 0: entropy }		# { <rounds>: <state>, ... } every checkpoint rounds
+        self.last		= ( 0, entropy )		# The most recently produced ( <rounds>, <state> )
+        self.rounds		= 0
+
+    def __repr__( self ):
+        return f"{self.__class__.__name__}({self.bits} bits, {len(self.states)} checkpoints, {self.rounds} rounds)"
+
+    def key( self ):
+        """Identifies the Seed Entropy stretched; a stretcher w/ the same key produces the same Seeds."""
+        return ( self.entropy, self.bits, self.encoding )
+
+    def state( self, rounds: int ) -> bytes:
+        """The SHA-512 chain state after the specified number of rounds, from the nearest prior known state."""
+        done, entropy		= self.last
+        if self.checkpoint:
+            nearest		= rounds - rounds % self.checkpoint
+            if ( done > rounds or done < nearest ) and nearest in self.states:
+                done, entropy	= nearest, self.states[nearest]
+        if done > rounds:
+            done, entropy	= 0, self.states[0]
+        while done < rounds:
+            entropy		= hashlib.sha512( entropy ).digest()
+            done	       += 1
+            self.rounds	       += 1
+            if self.checkpoint and done % self.checkpoint == 0:
+                self.states[done] = entropy
+        self.last		= ( done, entropy )
+        return entropy
+
+    def __call__( self, n: int ) -> bytes:
+        """Returns the n'th Seed's designated number of bits (rounded up to bytes) of Seed Entropy."""
+        assert n == 0 or ( self.entropy and n >= 0 ), \
+            f"Some Extra Seed Entropy is required to produce the {ordinal(n+1)}+ Seed(s)"
+        octets			= ( self.bits + 7 ) // 8
+        if self.states[0]:
+            entropy		= self.state( n + self.offset )
+        else:
+            # If no entropy provided, result is all 0
+            entropy		= b'\0' * octets
+        assert len( entropy ) >= octets, \
+            f"Insufficient extra Seed Entropy provided for {ordinal(n+1)} {self.bits}-bit Seed"
+        return entropy[:octets]
+
+
 Details = namedtuple( 'Details', ('name', 'group_threshold', 'groups', 'accounts', 'using_bip39') )
 
 
@@ -1217,6 +1989,7 @@ def create(
     strength: Optional[int]	= None,			# Default: 128
     extendable: Optional[bool]	= None,			# Default: True
     identifier: Optional[int]	= None,			# Default: random identifier
+    remember: bool		= False,		# Remember the secret, for one recover of the Mnemonics
 ) -> Tuple[str,int,Dict[str,Tuple[int,List[str]]], Sequence[Sequence[Account]], bool]:
     """Creates a SLIP-39 encoding for supplied master_secret Entropy, and 1 or more Cryptocurrency
     accounts.  Returns the Details, in a form directly compatible with the layout.produce_pdf API.
@@ -1243,6 +2016,9 @@ def create(
     Entropy, by generating the Seed from a BIP-38 Mnemonic produced from the provided entropy
     (or generated, default 128 bits), plus any supplied passphrase.
 
+    If the SLIP-39 Mnemonics are certain to be recovered next (eg. by layout.produce_pdf, to produce
+    a BIP-39 cover page), 'remember' the master secret, so that recovery needn't repeat the KDF.
+
     """
     if master_secret is None:
         if not strength:
@@ -1272,11 +2048,7 @@ def create(
         log.warning( "Assuming BIP-39 seed entropy: Ensure you recover and use via a BIP-39 Mnemonic" )
         if isinstance( master_secret, str ):
             master_secret	= recover_bip39( mnemonic=master_secret, as_entropy=True )
-        bip39_mnem		= produce_bip39( entropy=master_secret )
-        bip39_seed		= recover_bip39(
-            mnemonic	= bip39_mnem,
-            passphrase	= passphrase,
-        )
+        _,bip39_seed		= produce_bip39_seed( master_secret, passphrase=passphrase )
         log.info(
             f"SLIP-39 for {name} from {len(master_secret)*8}-bit Entropy using BIP-39 Mnemonic{' w/ Passphrase' if passphrase else ''}"
         )
@@ -1321,6 +2093,7 @@ def create(
         iteration_exponent= iteration_exponent,
         extendable	= extendable,
         identifier	= identifier,
+        remember	= remember,
     )
 
     groups			= {
@@ -1341,6 +2114,76 @@ def create(
     return Details(name, group_threshold, groups, accts, using_bip39)
 
 
+def worker_init(
+    crypto_format: Dict[str,str],
+    backend: Optional[str]	= None,
+):
+    """Initialize a worker process (eg. of create_parallel, or a recovery search).  Adopts the
+    parent's default address formats and any selected ECC backend.  Each crypto is registered (if
+    dynamically supported) before its format is selected, as a newly spawned process knows only the
+    statically supported cryptos.  Each create_parallel worker obtains its new master secrets (and
+    SLIP-39 identifiers) from the OS' randomness, just as create does in this process.
+
+    """
+    for crypto,format in crypto_format.items():
+        Account.address_format( crypto, format )
+    if backend:
+        Account.ecc_backend( backend )
+
+
+def create_entropy(
+    name: str,
+    strength: Optional[int]	= None,			# Default: 128
+    **kwds,						# Any other create options, except master_secret
+) -> Tuple[Details,Optional[bytes]]:
+    """Create the Details for name from a new random master secret, in a create_parallel worker.
+    If asked to 'remember' a using_bip39 secret, the master secret Entropy is also returned, so that
+    the parent process can remember it; its produce_pdf then recovers the BIP-39 cover page Mnemonic
+    without running the SLIP-39 KDF again.  The worker itself retains nothing.
+
+    """
+    master_secret		= random_secret(( strength or BITS_DEFAULT ) // 8 )
+    details			= create( name, master_secret=master_secret, strength=strength, **dict( kwds, remember=False ))
+    return details, master_secret if kwds.get( 'remember' ) and details.using_bip39 else None
+
+
+def create_parallel(
+    names: Sequence[str],
+    workers: Optional[int]	= None,			# default: os.cpu_count()
+    **kwds,						# Any other create options, except master_secret
+) -> Sequence[Details]:
+    """Create the SLIP-39 Details for each of the names, each from its own new random master secret,
+    using a pool of worker processes.  The Details are yielded in the order of the names, regardless
+    of the order in which the workers complete them.
+
+    Each create generates a secret, runs the SLIP-39 encryption KDF, derives the accounts and (if
+    using_bip39) stretches the BIP-39 Seed; creating thousands of Details is dominated by these, and
+    parallelizes perfectly.
+
+    If asked to 'remember', a using_bip39 master secret is remembered in this process (see
+    secret_remember), just as create would have; a subsequent produce_pdf of the Details needn't
+    repeat the KDF for its cover page.
+
+    """
+    assert not kwds.get( 'master_secret' ), \
+        "Creating multiple account details from the same secret entropy doesn't make sense"
+    pool			= ProcessPoolExecutor(
+        max_workers	= workers or os.cpu_count() or 1,
+        initializer	= worker_init,
+        initargs	= ( dict( Account.CRYPTO_FORMAT ), Account.ECC_BACKEND ),
+    )
+    try:
+        for details,master_secret in pool.map( partial( create_entropy, **kwds ), names ):
+            if master_secret is not None:
+                # Combining the Shares is cheap; it's decrypting them (the KDF) that we avoid
+                encrypted_secret,_ = next( recover_encrypted(
+                    [ mnem for _,g_mnems in details.groups.values() for mnem in g_mnems ] ))
+                secret_remember( encrypted_secret, b"", master_secret )
+            yield details
+    finally:
+        pool.shutdown( wait=True, cancel_futures=True )
+
+
 def mnemonics(
     group_threshold: Optional[int],  # Default: 1/2 of groups, rounded up
     groups: Sequence[Tuple[int, int]],
@@ -1350,6 +2193,7 @@ def mnemonics(
     strength: int		= BITS_DEFAULT,
     extendable: Optional[bool]	= None,			# Default: True
     identifier: Optional[int]	= None,			# Default: random identifier
+    remember: bool		= False,		# Remember the secret, for one recover (see secret_remember)
 ) -> List[List[str]]:
     """Generate SLIP39 mnemonics for the supplied master_secret for group_threshold of the given
      groups.  Will generate a random master_secret, if necessary.
@@ -1391,6 +2235,9 @@ def mnemonics(
             extendable	= extendable,
             iteration_exponent = iteration_exponent,
         )
+        if remember:
+            # We've just run the (expensive) SLIP-39 KDF; the next recover of these Mnemonics needn't repeat it
+            secret_remember( encrypted_secret, passphrase, master_secret )
 
     if len( encrypted_secret.ciphertext ) * 8 not in BITS:
         raise ValueError(
@@ -1430,105 +2277,510 @@ def mnemonics_encrypted(
     return [[share.mnemonic() for share in group] for group in grouped_shares]
 
 
-def account(
-    master_secret: Union[str,bytes],
-    crypto: Optional[str]	= None,  # default 'ETH'
-    path: Optional[str]		= None,  # default to the crypto's path_default
-    format: Optional[str]	= None,  # eg. 'bech32', or use the default address format for the crypto
-    passphrase: Optional[Union[bytes,str]] = None,  # If mnemonic(s) provided, then passphrase/using_bip39 optional
-    using_bip39: bool		= False,
-):
-    """Generate an HD wallet Account from the supplied master_secret seed, at the given HD derivation
-    path, for the specified cryptocurrency.
+class WatchOnly:
+    """A watch-only HD wallet, able to derive the public keys and addresses of non-hardened paths
+    below an xpub..., ypub... or zpub... key.
+
+    An Account (ie. a full hdwallet.HDWallet) is not required to do this.  We retain the xpub's
+    chain code and public key (and those of any intermediate nodes, eg. the m/0 of m/0/0..N), so
+    each address requires only one HMAC SHA-512 and one EC point addition (CKDpub).  Then, we
+    encode the child public key using a template Account for each desired cryptocurrency and address
+    format; any format supported by the cryptocurrency may be produced from the same public key.
+
+    As for Accounts derived from an xpub..., the default address format is deduced from the x/y/z
+    prefix, and the paths are relative to the xpub's own node, eg. "m/0/0".
+
+    Each template Account's public key is replaced to encode each address, and the retained nodes
+    are reordered as they are used; a WatchOnly may be shared by threads, so these are serialized.
+
+    """
+    def __init__(
+        self,
+        xpubkey: str,
+        size: Optional[int]	= None,  # default: DERIVATION_CACHE_SIZE intermediate nodes
+        backend: Optional[str]	= None,  # default: Account.ecc_backend()
+    ):
+        xpubkey			= xpubkey.strip()
+        data			= base58.b58decode_check( xpubkey )
+        if len( data ) != 78 or data[45] not in ( 2, 3 ):
+            raise ValueError( f"Expected an x/y/z + pub key; {xpubkey[:8]+'...'!r} supplied" )
+        self.format_default	= {
+            'xpub': 'legacy',
+            'ypub': 'segwit',
+            'zpub': 'bech32',
+        }.get( xpubkey[:4] )
+        self.xpubkey		= xpubkey
+        self.chain_code		= data[13:45]
+        self.public_key		= data[45:78]
+        self.size		= DERIVATION_CACHE_SIZE if size is None else size
+        self.backend		= backend
+        self.nodes		= OrderedDict()  # { (<ECC>,<indexes>): (<public_key>,<chain_code>), ... }
+        self.templates		= {}             # { (<crypto>,<format>): Account, ... }
+        self.lock		= threading.Lock()  # Serializes use of the nodes and templates
+
+    def __repr__( self ):
+        return f"{self.__class__.__name__}({self.format_default}, {len(self.nodes)} nodes, {len(self.templates)} templates)"
+
+    def template( self, crypto: Optional[str] = None, format: Optional[str] = None ) -> Account:
+        """The Account used to encode addresses for crypto in format."""
+        key			= (crypto or 'ETH', format or self.format_default)
+        acct			= self.templates.get( key )
+        if acct is None:
+            # Loading the xpub validates it for this crypto/format (eg. a ypub... isn't 'legacy')
+            acct		= Account( crypto=key[0], format=key[1], backend=self.backend ).from_xpubkey( self.xpubkey )
+            self.templates[key]	= acct
+        return acct
+
+    @staticmethod
+    def ckd( ecc, public_key, chain_code: bytes, index: int ):
+        """Derive the non-hardened child public key and chain code at index (BIP-32 CKDpub)."""
+        if index & 0x80000000:
+            raise exceptions.DerivationError( "Hardened derivation path is invalid for xpublic key" )
+        digest			= hmac.digest( chain_code, public_key.raw_compressed() + struct.pack( ">L", index ), "sha512" )
+        IL,IR			= int.from_bytes( digest[:32], 'big' ), digest[32:]
+        if IL > ecc.ORDER:
+            # Invalid child (probability < 1 in 2^127); as hdwallet does, remain at the parent node
+            return public_key, chain_code
+        return ecc.PUBLIC_KEY.from_point( public_key.point() + ( ecc.GENERATOR * IL )), IR
+
+    def node( self, ecc, indexes: Sequence[int] ):
+        """Return the (public_key, chain_code) at the path indexes, using the deepest retained parent
+        node.  All the intermediate (parent) nodes are retained; leaf nodes are not.
+
+        """
+        indexes			= tuple( indexes )
+        depth			= len( indexes ) - 1
+        while depth > 0:
+            if ( node := self.nodes.get( (ecc.__class__.__name__, indexes[:depth]) )) is not None:
+                self.nodes.move_to_end( (ecc.__class__.__name__, indexes[:depth]) )
+                break
+            depth	       -= 1
+        else:
+            depth		= 0
+            node		= ecc.PUBLIC_KEY.from_bytes( self.public_key ), self.chain_code
+        for index in indexes[depth:]:
+            node		= self.ckd( ecc, *node, index )
+            depth	       += 1
+            if depth < len( indexes ):
+                self.nodes[ecc.__class__.__name__, indexes[:depth]] = node
+                if len( self.nodes ) > self.size:
+                    self.nodes.popitem( last=False )
+        return node
+
+    def account(
+        self,
+        path: Optional[str]	= None,
+        crypto: Optional[str]	= None,
+        format: Optional[str]	= None,
+        formats: Optional[Sequence[str]] = None,
+    ) -> Tuple[str,str,Union[str,Tuple[str,...]]]:
+        """Return the (crypto, path, address) at path, or (crypto, path, (address, ...)) if formats."""
+        with self.lock:
+            acct		= self.template( crypto, format )
+            path,indexes,_	= normalize_derivation( path=path )
+            acct.hdwallet._hd._public_key,_ = self.node( acct.hdwallet._hd._ecc, indexes )
+            return acct.crypto, path, acct.format_addresses( formats ) if formats else acct.hdwallet.address()
+
+    def address( self, path: Optional[str] = None, crypto: Optional[str] = None, format: Optional[str] = None ) -> str:
+        return self.account( path=path, crypto=crypto, format=format )[2]
+
+    def addresses(
+        self,
+        crypto: Optional[str]	= None,  # default 'ETH'
+        paths: Optional[str]	= None,  # default: the xpub's own node, ie. "m/"; supports ranges
+        format: Optional[str]	= None,
+        allow_unbounded: bool	= True,
+        formats: Optional[Sequence[str]] = None,
+    ):
+        """Yield (crypto, path, address) for each of the paths (allowing ranges), as addresses."""
+        for path in PathRange.of( paths, allow_unbounded=allow_unbounded ):
+            yield self.account( path=path, crypto=crypto, format=format, formats=formats )
+
+
+class MasterSecret:
+    """A master_secret Seed (or BIP-39 Entropy), BIP-39/SLIP-39 Mnemonic(s), or {x,y,z}{pub,prv}
+    key, resolved just once into the HD wallet root node(s) from which any number of Accounts are
+    derived.
 
     If the master_secret is bytes, it is used as-is.  If a str, then we generally expect it to be
     hex.  However, this is where we can detect alternatives like "{x,y,z}{pub,priv}key...".  These
     are identifiable by their prefix, which is incompatible with hex, so there is no ambiguity.
 
+    Obtaining the root node is expensive for Mnemonics: SLIP-39 recovery decrypts the Encrypted
+    Master Secret via PBKDF2, and BIP-39 stretches the Mnemonic into a Seed via 2048 rounds of PBKDF2
+    HMAC-SHA512.  Generating 10,000 addresses from a Mnemonic shouldn't require 10,000 of these!  So,
+    the first Account for each distinct root (ie. each ECC curve, and each set of Mnemonic types
+    supported by the cryptocurrency) is derived normally, and its root node is retained.  Each
+    subsequent Account is initialized from this root, and then derived at its path.
+
+    All the Accounts share a DerivationCache, so sequential and sibling paths (eg. m/44'/60'/0'/0/0,
+    m/44'/60'/0'/0/1, ...) reuse their already derived parent node.
+
     """
-    if isinstance( master_secret, str ):
-        master_secret		= master_secret.strip()
-    if isinstance( master_secret, bytes ) or master_secret[:2].lower() == "0x" or all(
-        c in string.hexdigits for c in master_secret
+    def __init__(
+        self,
+        master_secret: Union[str,bytes],
+        passphrase: Optional[Union[bytes,str]] = None,  # If mnemonic(s) provided, then passphrase/using_bip39 optional
+        using_bip39: bool	= False,
+        cache: Optional[DerivationCache] = None,  # default: a new DerivationCache
+        backend: Optional[str]	= None,  # default: Account.ecc_backend()
     ):
-        # Probably a binary/hex Seed.
-        acct			= Account(
-            crypto	= crypto or 'ETH',
-            format	= format,
-        )
-        if using_bip39:
-            acct.from_entropy(
-                entropy	= master_secret,
-                path	= path,
-            )
+        if isinstance( master_secret, str ):
+            master_secret	= master_secret.strip()
+        self.cache		= DerivationCache() if cache is None else cache
+        self.master_secret	= master_secret
+        self.passphrase		= passphrase
+        self.using_bip39	= using_bip39
+        self.backend		= backend
+        self.format_default	= None
+        self.from_method	= None
+        if isinstance( master_secret, bytes ) or master_secret[:2].lower() == "0x" or all(
+            c in string.hexdigits for c in master_secret
+        ):
+            # Probably a binary/hex Seed (or Entropy, if using_bip39)
+            self.kind		= 'entropy' if using_bip39 else 'seed'
+        elif ' ' in master_secret:
+            # Some kind of Mnemonic; this is the only valid use of whitespace within a master_secret.
+            self.kind		= 'mnemonic'
         else:
-            acct.from_seed(
-                seed	= master_secret,
-                path	= path,
-            )
-        log.debug( f"Created {acct.format} {acct} from {len(master_secret)*8}-bit {'entropy' if using_bip39 else 'seed'}, at derivation path {acct.path}" )
-    elif ' ' in master_secret:
-        # Some kind of Mnemonic; this is the only valid use of whitespace within a master_secret.
+            # See if we recognize the prefix as a {x,y,z}pub... or .prv...  Get the bound function for
+            # initializing the seed.  Also, deduce the default format from the x/y/z+pub/prv.
+            self.format_default,self.from_method = {
+                'xpub': ('legacy', Account.from_xpubkey),
+                'xprv': ('legacy', Account.from_xprvkey),
+                'ypub': ('segwit', Account.from_xpubkey),
+                'yprv': ('segwit', Account.from_xprvkey),
+                'zpub': ('bech32', Account.from_xpubkey),
+                'zprv': ('bech32', Account.from_xprvkey),
+            }.get( master_secret[:4], (None,None) )
+            if self.from_method is None:
+                raise ValueError(
+                    f"Only x/y/z + pub/prv prefixes supported; {master_secret[:8]+'...'!r} prefix supplied" )
+            self.kind		= master_secret[:4]
+        # An x/y/z + pub key can use the (much faster) WatchOnly public key derivation for addresses
+        self.watch_only		= WatchOnly( master_secret, backend=backend ) if self.kind.endswith( 'pub' ) else None
+        self.roots		= {}  # { (<ECC>,<Mnemonic>): (<HDWallet root>,<HD root>), ... }
+
+    def __repr__( self ):
+        return f"{self.__class__.__name__}({self.kind}, {len(self.roots)} roots, {self.cache!r})"
+
+    def root_keys( self, acct: Account ) -> List[Tuple[str,Optional[str]]]:
+        """Accounts w/ the same ECC curve (eg. ETH, BTC: SLIP10-Secp256k1) share a root node, unless a
+        Mnemonic (or BIP-39 Entropy) must be decoded using the cryptocurrency's own Mnemonic types.
+        Returns the (<ECC>,<Mnemonic>) keys of the root nodes that this Account could use.
+
+        A SLIP-39 Mnemonic directly encodes the Seed (unless using_bip39), so it never depends on
+        the cryptocurrency's Mnemonic types.  Otherwise, a Mnemonic is decoded using the first of
+        the cryptocurrency's Mnemonic types that recognizes it; if we've already decoded it with
+        this cryptocurrency's first Mnemonic type, then we know it will again.
+
+        """
+        ecc			= acct.hdwallet._hd._ecc.__class__.__name__
+        cryptocurrency		= acct.hdwallet._cryptocurrency
+        if self.kind == 'mnemonic':
+            mnemonic,*_		= cryptocurrency.MNEMONICS.get_mnemonics()
+            if isinstance( mnemonic, dict ):
+                mnemonic,	= mnemonic.keys()
+            return [ (ecc, None), (ecc, mnemonic) ]
+        if self.kind == 'entropy':
+            return [ (ecc, cryptocurrency.ENTROPIES.get_entropies()[0]) ]
+        return [ (ecc, None) ]
+
+    def account(
+        self,
+        crypto: Optional[str]	= None,  # default 'ETH'
+        path: Optional[str]	= None,  # default to the crypto's path_default
+        format: Optional[str]	= None,  # eg. 'bech32', or use the default address format for the crypto
+        context: Optional[FormatContext] = None,  # eg. FormatContext( BTC='segwit' ); default address formats
+    ) -> Account:
+        """Generate an HD wallet Account for the crypto at path, from this master secret's root node.
+
+        """
+        if context:
+            format		= context.resolve( crypto, format )
         acct			= Account(
             crypto	= crypto or 'ETH',
-            format	= format,
-            passphrase	= passphrase,
+            format	= format or self.format_default,
+            cache	= self.cache,
+            backend	= self.backend,
+            **( dict( passphrase=self.passphrase ) if self.kind == 'mnemonic' else {} )
         )
-        log.debug( f"Making  {acct.format} {acct} from Mnemonic(s), at derivation path {acct.path}" )
-        acct.from_mnemonic( master_secret, path=path, using_bip39=using_bip39 )
-        log.debug( f"Created {acct.format} {acct} from Mnemonic(s), at derivation path {acct.path}" )
-    else:
-        # See if we recognize the prefix as a {x,y,z}pub... or .prv...  Get the bound function for
-        # initializing the seed.  Also, deduce the default format from the x/y/z+pub/prv.
-        default_fmt,from_method	= {
-            'xpub': ('legacy', Account.from_xpubkey),
-            'xprv': ('legacy', Account.from_xprvkey),
-            'ypub': ('segwit', Account.from_xpubkey),
-            'yprv': ('segwit', Account.from_xprvkey),
-            'zpub': ('bech32', Account.from_xpubkey),
-            'zprv': ('bech32', Account.from_xprvkey),
-        }.get( master_secret[:4], (None,None) )
-        if from_method is None:
-            raise ValueError(
-                f"Only x/y/z + pub/prv prefixes supported; {master_secret[:8]+'...'!r} prefix supplied" )
-        if format is None:
-            format		= default_fmt
-        acct			= Account(
-            crypto	= crypto or 'ETH',
-            format	= format
+        key,root		= next(
+            (
+                (key,self.roots[key])
+                for key in self.root_keys( acct )
+                if key in self.roots
+            ),
+            (None,None)
         )
-        from_method( acct, master_secret, path )  # It's an unbound method, so pass the instance
-        log.debug( f"Created {acct.format} {acct} from {master_secret[:4]} key, at derivation path {acct.path}" )
+        if root is not None:
+            acct.from_root( root )
+            if self.from_method:
+                acct.from_derivation( derivation=CustomDerivation( path=path ))
+            else:
+                acct.from_path( path )
+            log.debug( f"Created {acct.format} {acct} from {self.kind} root {key!r}, at derivation path {acct.path}" )
+            return acct
+
+        if self.kind in ('entropy', 'seed'):
+            if self.using_bip39:
+                acct.from_entropy(
+                    entropy	= self.master_secret,
+                    path	= path,
+                )
+            else:
+                acct.from_seed(
+                    seed	= self.master_secret,
+                    path	= path,
+                )
+            log.debug( f"Created {acct.format} {acct} from {len(self.master_secret)*8}-bit {self.kind}, at derivation path {acct.path}" )
+        elif self.kind == 'mnemonic':
+            log.debug( f"Making  {acct.format} {acct} from Mnemonic(s), at derivation path {acct.path}" )
+            acct.from_mnemonic( self.master_secret, path=path, using_bip39=self.using_bip39 )
+            log.debug( f"Created {acct.format} {acct} from Mnemonic(s), at derivation path {acct.path}" )
+        else:
+            self.from_method( acct, self.master_secret, path )  # It's an unbound method, so pass the instance
+            log.debug( f"Created {acct.format} {acct} from {self.kind} key, at derivation path {acct.path}" )
+        mnemonic		= acct.hdwallet._mnemonic
+        self.roots[acct.hdwallet._hd._ecc.__class__.__name__, mnemonic.name() if mnemonic else None] = acct.root
+        return acct
+
+
+def account(
+    master_secret: Union[str,bytes,MasterSecret],
+    crypto: Optional[str]	= None,  # default 'ETH'
+    path: Optional[str]		= None,  # default to the crypto's path_default
+    format: Optional[str]	= None,  # eg. 'bech32', or use the default address format for the crypto
+    passphrase: Optional[Union[bytes,str]] = None,  # If mnemonic(s) provided, then passphrase/using_bip39 optional
+    using_bip39: bool		= False,
+    context: Optional[FormatContext] = None,		# eg. FormatContext( BTC='segwit' ); default address formats
+):
+    """Generate an HD wallet Account from the supplied master_secret seed, at the given HD derivation
+    path, for the specified cryptocurrency.
+
+    If the master_secret is bytes, it is used as-is.  If a str, then we generally expect it to be
+    hex.  However, this is where we can detect alternatives like "{x,y,z}{pub,priv}key...".  These
+    are identifiable by their prefix, which is incompatible with hex, so there is no ambiguity.
 
-    return acct
+    If an already resolved MasterSecret is supplied, its root node(s) are used, and its own
+    passphrase and using_bip39 apply.
+
+    """
+    if not isinstance( master_secret, MasterSecret ):
+        master_secret		= MasterSecret(
+            master_secret,
+            passphrase	= passphrase,
+            using_bip39	= using_bip39,
+        )
+    return master_secret.account(
+        crypto		= crypto,
+        path		= path,
+        format		= format,
+        context		= context,
+    )
 
 
 def accounts(
-    master_secret: Union[str,bytes],
+    master_secret: Union[str,bytes,MasterSecret],
     crypto: str			= None,  # default 'ETH'
-    paths: str			= None,  # default to the crypto's path_default; allow ranges
+    paths: Optional[Union[str,PathRange]] = None,  # default to the crypto's path_default; allow ranges (or a PathRange)
     format: Optional[str]	= None,
     allow_unbounded		= True,
     passphrase: Optional[Union[bytes,str]] = None,  # If mnemonic(s) provided, then passphrase/using_bip39 optional
     using_bip39: bool		= False,
+    workers: Optional[int]	= None,			# If desired, derive in parallel using a pool of processes
+    formats: Optional[Sequence[str]] = None,		# eg. ("legacy","segwit","bech32"); see Account.addresses
+    records: Union[bool,Sequence[str]] = False,		# True (or eg. ('pubkey','xpubkey')) yields AccountRecords
+    context: Optional[FormatContext] = None,		# eg. FormatContext( BTC='segwit' ); default address formats
+    address_cache: Optional[AddressCache] = None,		# Consult (and extend) this cache of public data for records
 ):
-    """Create accounts for crypto, at the provided paths (allowing ranges), with the optionsal address format. """
-    for path in [None] if paths is None else path_sequence( *path_parser(
-        paths		= paths,
-        allow_unbounded	= allow_unbounded,
-    )):
-        yield account(
+    """Create accounts for crypto, at the provided paths (allowing ranges), with the optionsal address
+    format.  The master_secret is resolved into its root node only once, for all paths.
+
+    If multiple address formats are desired for each path (eg. for BTC: legacy, segwit and bech32),
+    supply them as 'formats'; each path is derived once (in the Account's 'format'), and each
+    Account's .addresses returns its address in each of the formats.
+
+    If only the accounts' public details are required, supply 'records' to yield a compact
+    AccountRecord instead of each Account; a sequence of key names also retains those keys.
+
+    Any address format selected for the crypto by the FormatContext is used (instead of the
+    process-wide default), if no format is supplied.
+
+    If an AddressCache is supplied and only records (optionally w/ 'pubkey') are desired, they are
+    obtained from the cache (in this process), deriving (and caching) only those not yet cached; by
+    'workers' processes, if supplied.
+
+    """
+    if context:
+        format			= context.resolve( crypto, format )
+    if address_cache is not None and records and ( records is True or set( records ) <= { 'pubkey' } ):
+        if not isinstance( master_secret, MasterSecret ):
+            master_secret	= MasterSecret(
+                master_secret,
+                passphrase	= passphrase,
+                using_bip39	= using_bip39,
+            )
+        for record in address_cache.records(
             master_secret,
+            crypto		= crypto,
+            paths		= paths,
+            format		= format,
+            allow_unbounded	= allow_unbounded,
+            workers		= workers,
+        ):
+            yield record if records is not True else AccountRecord( *record.fields()[:4] )
+        return
+    if workers:
+        for acct, in accountgroups_parallel(
+            master_secret,
+            cryptopaths		= [ (crypto, paths, format) ],
+            allow_unbounded	= allow_unbounded,
+            passphrase		= passphrase,
+            using_bip39		= using_bip39,
+            workers		= workers,
+            records		= records,
+        ):
+            if not records:
+                acct.formats	= formats
+            yield acct
+        return
+    if not isinstance( master_secret, MasterSecret ):
+        master_secret		= MasterSecret(
+            master_secret,
+            passphrase	= passphrase,
+            using_bip39	= using_bip39,
+        )
+    for path in PathRange.of( paths, allow_unbounded=allow_unbounded ):
+        acct			= master_secret.account(
             crypto	= crypto,
             path	= path,
             format	= format,
-            passphrase	= passphrase,
-            using_bip39	= using_bip39,
         )
+        if records:
+            yield AccountRecord.from_account( acct, keys=() if records is True else records )
+            continue
+        acct.formats		= formats
+        yield acct
+
+
+def accountgroups_worker(
+    master_secret: Union[str,bytes],
+    passphrase: Optional[Union[bytes,str]],
+    using_bip39: bool,
+    crypto_format: Dict[str,str],
+    backend: Optional[str]	= None,
+):
+    """Initialize an accountgroups_parallel worker process.  Adopts the parent's default address
+    formats and ECC backend, and resolves the master secret just once for all the chunks this
+    process will derive.
+
+    """
+    worker_init( crypto_format )
+    accountgroups_worker.master_secret = MasterSecret(
+        master_secret,
+        passphrase	= passphrase,
+        using_bip39	= using_bip39,
+        backend		= backend,
+    )
+accountgroups_worker.master_secret = None  # noqa: E305
+
+
+def accountgroups_chunk(
+    cryptopaths: Sequence[Tuple[str,Optional[str],Optional[str]]],
+    start: int,
+    count: int,
+    allow_unbounded: bool,
+    records: Union[bool,Sequence[str]] = False,
+) -> List[Tuple[Union[Account,AccountRecord],...]]:
+    """Derive the 'count' groups of Accounts starting at group 'start', in an accountgroups_worker.
+    The paths preceding group 'start' are not generated.  If 'records', only (much smaller)
+    AccountRecords are returned to the parent process.
+
+    """
+    master_secret		= accountgroups_worker.master_secret
+    keys			= () if records is True else records
+    return list( zip( *[
+        [
+            AccountRecord.from_account( acct, keys=keys ) if records else acct
+            for acct in (
+                master_secret.account( crypto=cry, path=path, format=fmt )
+                for path in PathRange.of( pth, allow_unbounded=allow_unbounded )[start:start + count]
+            )
+        ]
+        for cry,pth,fmt in cryptopaths
+    ]))
+
+
+def address_cache_chunk(
+    crypto: str,
+    format: str,
+    paths: Sequence[str],
+) -> List[Tuple[str,str,str]]:
+    """Derive the (path, pubkey, address) at each of the paths missing from an AddressCache, in an
+    accountgroups_worker.
+
+    """
+    master_secret		= accountgroups_worker.master_secret
+    return [
+        ( acct.path, acct.pubkey, acct.address )
+        for acct in (
+            master_secret.account( crypto=crypto, path=path, format=format )
+            for path in paths
+        )
+    ]
+
+
+def accountgroups_parallel(
+    master_secret: Union[str,bytes,MasterSecret],
+    cryptopaths: Sequence[Tuple[str,Optional[str],Optional[str]]],  # (crypto,paths,format), eg. from cryptopaths_parser
+    allow_unbounded: bool	= True,
+    passphrase: Optional[Union[bytes,str]] = None,
+    using_bip39: bool		= False,
+    workers: Optional[int]	= None,			# default: os.cpu_count()
+    chunksize: int		= 100,
+    records: Union[bool,Sequence[str]] = False,		# True (or eg. ('pubkey','xpubkey')) yields AccountRecords
+) -> Sequence[Sequence[Union[Account,AccountRecord]]]:
+    """Derive groups of Accounts (as accountgroups), in chunks of 'chunksize' groups, using a pool of
+    worker processes.  The groups are yielded in their original order, as they would be by
+    accountgroups.
+
+    Only a limited number of chunks are ever outstanding (2 per worker); the futures of these
+    chunks form a reorder buffer, from which we yield each chunk's groups in order, as they are
+    completed.  Thus, unbounded path ranges (eg. ".../-") are supported; the caller simply stops
+    consuming groups.  The sequence ends with the first short chunk.
+
+    Each worker resolves the master secret once; for a Mnemonic, this will be concurrent in each
+    worker.
+
+    """
+    backend			= None
+    if isinstance( master_secret, MasterSecret ):
+        master_secret,passphrase,using_bip39,backend = (
+            master_secret.master_secret, master_secret.passphrase, master_secret.using_bip39, master_secret.backend )
+    workers			= workers or os.cpu_count() or 1
+    pool			= ProcessPoolExecutor(
+        max_workers	= workers,
+        initializer	= accountgroups_worker,
+        initargs	= ( master_secret, passphrase, using_bip39, dict( Account.CRYPTO_FORMAT ), backend or Account.ecc_backend() ),
+    )
+    try:
+        pending			= deque()
+        start			= 0
+        while True:
+            while len( pending ) < 2 * workers:
+                pending.append( pool.submit( accountgroups_chunk, cryptopaths, start, chunksize, allow_unbounded, records ))
+                start	       += chunksize
+            groups		= pending.popleft().result()
+            yield from groups
+            if len( groups ) < chunksize:
+                break
+    finally:
+        pool.shutdown( wait=True, cancel_futures=True )
 
 
 def accountgroups(
-    master_secret: Union[str,bytes],
+    master_secret: Union[str,bytes,MasterSecret],
     cryptopaths: Optional[Sequence[Union[str,Tuple[str,str],Tuple[str,str,str]]]] = None,  # default: ETH, BTC at default path, format
     allow_unbounded: bool	= True,
     passphrase: Optional[Union[bytes,str]] = None,      # If mnemonic(s) provided, then passphrase/using_bip39 optional
@@ -1536,7 +2788,11 @@ def accountgroups(
     format: Optional[str]	= None,			# If the default format for every cryptopath isn't desired
     edit: Optional[str]		= None,
     hardened_defaults: bool	= False,
-) -> Sequence[Sequence[Account]]:
+    workers: Optional[int]	= None,			# If desired, derive in parallel using a pool of processes
+    chunksize: int		= 100,
+    records: Union[bool,Sequence[str]] = False,		# True (or eg. ('pubkey','xpubkey')) yields AccountRecords
+    context: Optional[FormatContext] = None,		# eg. FormatContext( BTC='segwit' ); default address formats
+) -> Sequence[Sequence[Union[Account,AccountRecord]]]:
     """Generate the desired cryptocurrency account(s) at each crypto's given path(s).  This is useful
     for generating sequences of groups of wallets for multiple cryptocurrencies, eg. for receiving
     multiple cryptocurrencies for each client.  Since each cryptocurrency uses a different BIP-44 path,
@@ -1557,7 +2813,42 @@ def accountgroups(
         ],
         ...
 
+    The master_secret is resolved into its root node(s) only once, and shared by every
+    cryptocurrency and path; supply a MasterSecret to share it across several calls.
+
+    If 'workers' is supplied, the groups are derived in parallel (in order) by a pool of processes;
+    see accountgroups_parallel.
+
+    If 'records', each group contains compact AccountRecords instead of full Accounts; see accounts.
+
+    The address formats selected by any FormatContext are resolved (see cryptopaths_parser) before
+    derivation, so they apply in any worker processes, too.
+
     """
+    if workers:
+        yield from accountgroups_parallel(
+            master_secret,
+            cryptopaths		= list( cryptopaths_parser(
+                cryptopaths,
+                edit		= edit,
+                hardened_defaults = hardened_defaults,
+                format		= format,
+                context		= context,
+            )),
+            allow_unbounded	= allow_unbounded,
+            passphrase		= passphrase,
+            using_bip39		= using_bip39,
+            workers		= workers,
+            chunksize		= chunksize,
+            records		= records,
+        )
+        return
+    if not isinstance( master_secret, MasterSecret ):
+        master_secret		= MasterSecret(
+            master_secret,
+            passphrase	= passphrase,
+            using_bip39	= using_bip39,
+        )
     yield from zip( *[
         accounts(
             master_secret	= master_secret,
@@ -1567,18 +2858,20 @@ def accountgroups(
             allow_unbounded	= allow_unbounded,
             passphrase		= passphrase,
             using_bip39		= using_bip39,
+            records		= records,
         )
         for cry,pth,fmt in cryptopaths_parser(
             cryptopaths,
             edit		= edit,
             hardened_defaults	= hardened_defaults,
             format		= format,
+            context		= context,
         )
     ])
 
 
 def address(
-    master_secret: Union[str,bytes],
+    master_secret: Union[str,bytes,MasterSecret],
     crypto: str			= None,
     path: str			= None,
     format: Optional[str]	= None,
@@ -1597,19 +2890,66 @@ def address(
 
 
 def addresses(
-    master_secret: Union[str,bytes],
+    master_secret: Union[str,bytes,MasterSecret],
     crypto: str	 		= None,  # default 'ETH'
-    paths: str			= None,  # default: The crypto's path_default; supports ranges
+    paths: Optional[Union[str,PathRange]] = None,  # default: The crypto's path_default; supports ranges (or a PathRange)
     format: Optional[str]	= None,
     allow_unbounded: bool	= True,
     passphrase: Optional[Union[bytes,str]] = None,  # If mnemonic(s) provided, then passphrase/using_bip39 optional
     using_bip39: bool		= False,
+    workers: Optional[int]	= None,
+    formats: Optional[Sequence[str]] = None,		# eg. ("legacy","segwit","bech32")
+    context: Optional[FormatContext] = None,		# eg. FormatContext( BTC='segwit' ); default address formats
+    address_cache: Optional[AddressCache] = None,		# Consult (and extend) this cache of public data
 ):
     """Generate a sequence of cryptocurrency account (path, address, ...)  for all designated
     cryptocurrencies.  Usually a single (<path>, <address>) tuple is desired (different
     cryptocurrencies typically have their own unique path derivations.
 
+    Addresses for an x/y/z + pub key master_secret are derived by its WatchOnly, without creating
+    an Account for each.
+
+    If 'formats' are supplied, each path is derived once, and (<crypto>, <path>, (<address>, ...))
+    is yielded with its address in each of the formats, eg. BTC's 1..., 3... and bc1... addresses.
+    The paths (eg. the default path) are those of the 'format' (or that selected by any FormatContext).
+
+    If an AddressCache is supplied (and not multiple 'formats'), the addresses are obtained from it
+    (in this process), deriving (and caching) only those not yet cached, by any 'workers' processes.
+
     """
+    if context:
+        format			= context.resolve( crypto, format )
+    if address_cache is not None and not formats:
+        for record in accounts(
+            master_secret,
+            crypto		= crypto,
+            paths		= paths,
+            format		= format,
+            allow_unbounded	= allow_unbounded,
+            passphrase		= passphrase,
+            using_bip39		= using_bip39,
+            workers		= workers,
+            records		= True,
+            address_cache	= address_cache,
+        ):
+            yield (record.crypto, record.path, record.address)
+        return
+    if not workers:
+        if not isinstance( master_secret, MasterSecret ):
+            master_secret	= MasterSecret(
+                master_secret,
+                passphrase	= passphrase,
+                using_bip39	= using_bip39,
+            )
+        if master_secret.watch_only:
+            yield from master_secret.watch_only.addresses(
+                crypto		= crypto,
+                paths		= paths,
+                format		= format,
+                allow_unbounded	= allow_unbounded,
+                formats		= formats,
+            )
+            return
     for acct in accounts(
             master_secret,
             crypto	= crypto,
@@ -1618,12 +2958,14 @@ def addresses(
             allow_unbounded = allow_unbounded,
             passphrase	= passphrase,
             using_bip39	= using_bip39,
+            workers	= workers,
+            formats	= formats,
     ):
-        yield (acct.crypto, acct.path, acct.address)
+        yield (acct.crypto, acct.path, acct.addresses if formats else acct.address)
 
 
 def addressgroups(
-    master_secret: Union[str,bytes],
+    master_secret: Union[str,bytes,MasterSecret],
     cryptopaths: Optional[Sequence[Union[str,Tuple[str,str],Tuple[str,str,str]]]] = None,  # default: ETH, BTC at default path, format
     allow_unbounded: bool	= True,
     passphrase: Optional[Union[bytes,str]] = None,  # If mnemonic(s) provided, then passphrase/using_bip39 optional
@@ -1631,10 +2973,33 @@ def addressgroups(
     format: Optional[str]	= None,
     edit: Optional[str]		= None,
     hardened_defaults: bool	= False,
+    workers: Optional[int]	= None,
+    context: Optional[FormatContext] = None,		# eg. FormatContext( BTC='segwit' ); default address formats
 ) -> Sequence[str]:
     """Yields account (<crypto>, <path>, <address>) records for the desired cryptocurrencies at paths.
 
     """
+    if workers:
+        for group in accountgroups(
+            master_secret	= master_secret,
+            cryptopaths		= cryptopaths,
+            allow_unbounded	= allow_unbounded,
+            passphrase		= passphrase,
+            using_bip39		= using_bip39,
+            format		= format,
+            edit		= edit,
+            hardened_defaults	= hardened_defaults,
+            workers		= workers,
+            context		= context,
+        ):
+            yield tuple( (acct.crypto, acct.path, acct.address) for acct in group )
+        return
+    if not isinstance( master_secret, MasterSecret ):
+        master_secret		= MasterSecret(
+            master_secret,
+            passphrase	= passphrase,
+            using_bip39	= using_bip39,
+        )
     yield from zip( *[
         addresses(
             master_secret	= master_secret,
@@ -1650,5 +3015,751 @@ def addressgroups(
             edit		= edit,
             hardened_defaults	= hardened_defaults,
             format		= format,
+            context		= context,
         )
     ])
+
+
+AddressBatch = namedtuple( 'AddressBatch', ('crypto', 'format', 'paths', 'addresses', 'pubkeys', 'xpubkeys') )
+
+
+def addresses_batch(
+    master_secret: Union[str,bytes,MasterSecret],
+    cryptopaths: Optional[Sequence[Union[str,Tuple[str,str],Tuple[str,str,str]]]] = None,  # default: ETH, BTC at default path, format
+    start: int			= 0,
+    count: Optional[int]	= None,			# default: all (only if no path ranges are unbounded)
+    pubkeys: bool		= False,
+    xpubkeys: bool		= False,
+    passphrase: Optional[Union[bytes,str]] = None,  # If mnemonic(s) provided, then passphrase/using_bip39 optional
+    using_bip39: bool		= False,
+    format: Optional[str]	= None,
+    edit: Optional[str]		= None,
+    hardened_defaults: bool	= False,
+    context: Optional[FormatContext] = None,		# eg. FormatContext( BTC='segwit' ); default address formats
+) -> List[AddressBatch]:
+    """Derive the 'count' addresses starting at the 'start'-th path of each cryptopath, returning them
+    in columnar form: an AddressBatch of parallel lists of paths, addresses and (optionally)
+    pubkeys and/or xpubkeys for each cryptopath.
+
+    The same cryptopaths as addressgroups are supported, eg. "ETH:.../-" or ("BTC","m/84'/0'/0'/0/-").
+    So, to get the 2nd 1,000 ETH and BTC addresses:
+
+        >>> eth,btc = addresses_batch( master_secret, ["ETH:.../-", "BTC:.../-"], start=1000, count=1000 )
+        >>> eth.addresses[0], btc.paths[-1]
+
+    Instead of creating a new Account for every address, a single Account is re-derived at each of
+    the cryptopath's paths, and only the requested data is retained.
+
+    """
+    if not isinstance( master_secret, MasterSecret ):
+        master_secret		= MasterSecret(
+            master_secret,
+            passphrase	= passphrase,
+            using_bip39	= using_bip39,
+        )
+    batches			= []
+    for cry,pth,fmt in cryptopaths_parser(
+        cryptopaths,
+        edit			= edit,
+        hardened_defaults	= hardened_defaults,
+        format			= format,
+        context			= context,
+    ):
+        acct			= master_secret.account( crypto=cry, format=fmt )
+        paths			= copy.copy( PathRange.of( pth, allow_unbounded=count is not None ))
+        if not master_secret.from_method and paths.path_fmt is not None:
+            # Seeds' paths are relative to the Account's default path; resolve them (once) from the format.
+            paths.path_fmt	= path_edit( acct.path, paths.path_fmt )
+        batch			= AddressBatch(
+            crypto	= acct.crypto,
+            format	= acct.format,
+            paths	= [],
+            addresses	= [],
+            pubkeys	= [] if pubkeys else None,
+            xpubkeys	= [] if xpubkeys else None,
+        )
+        for path in paths[start:None if count is None else start + count]:
+            acct.from_derivation( derivation=CustomDerivation( path=path ))
+            batch.paths.append( acct.path )
+            batch.addresses.append( acct.address )
+            if pubkeys:
+                batch.pubkeys.append( acct.pubkey )
+            if xpubkeys:
+                batch.xpubkeys.append( acct.xpubkey )
+        batches.append( batch )
+    return batches
+
+
+class AccountColumns:
+    """Write derived Accounts (or AccountRecords) in columnar form, as a NumPy .npy file of
+    fixed-size records, for memory-mapped loading by downstream (eg. analytics, reconciliation) jobs:
+
+        >>> accts = numpy.load( "accounts.npy", mmap_mode='r' )
+        >>> accts['address'][accts['crypto'] == b'BTC']
+
+    Each row contains the (group) index, the crypto symbol and address format, the derivation path's
+    depth and (up to DEPTH) indices (hardened indices have the HARDENED bit set) and the address.
+
+    Rows are buffered, and written in chunks of 'chunksize' (default: COLUMNS_CHUNKSIZE), so any
+    number of rows may be streamed without holding them in memory.  Numpy is not required.  If used as
+    a context manager and an exception is raised, the incomplete file is discarded.
+
+    """
+    DEPTH			= 10
+    HARDENED			= 0x80000000
+    DESCR			= (
+        "[('index', '<u8'), ('crypto', '|S8'), ('format', '|S8'), ('depth', '|u1'),"
+        f" ('path', '<u4', ({DEPTH},)), ('address', '|S64')]"
+    )
+    RECORD			= struct.Struct( f'<Q8s8sB{DEPTH}I64s' )
+
+    def __init__( self, filename: str, chunksize: Optional[int] = None ):
+        self.writer		= NpyWriter( filename, self.DESCR, self.RECORD.size )
+        self.chunksize		= chunksize or COLUMNS_CHUNKSIZE
+        self.chunk		= bytearray()
+
+    def __repr__( self ):
+        return f"{self.__class__.__name__}({self.writer.filename!r}, {len( self )} rows)"
+
+    def __len__( self ):
+        return self.writer.count + len( self.chunk ) // self.RECORD.size
+
+    @classmethod
+    def path_indices( cls, path: str ) -> List[int]:
+        """Convert eg. "m/84'/0'/0'/0/3" into its derivation indices."""
+        indices			= [
+            int( seg[:-1] ) | cls.HARDENED if seg.endswith( "'" ) else int( seg )
+            for seg in path.split( '/' )[1:] if seg
+        ]
+        if len( indices ) > cls.DEPTH:
+            raise ValueError( f"Derivation path {path} deeper than {cls.DEPTH} not supported" )
+        return indices
+
+    def append( self, index: int, acct: Union[Account,AccountRecord] ):
+        indices			= self.path_indices( acct.path )
+        address			= acct.address.encode( 'ascii' )
+        if len( address ) > 64:
+            raise ValueError( f"Address {acct.address} longer than 64 bytes not supported" )
+        self.chunk	       += self.RECORD.pack(
+            index, acct.crypto.encode( 'ascii' ), acct.format.encode( 'ascii' ), len( indices ),
+            *( indices + [0] * ( self.DEPTH - len( indices ))), address
+        )
+        if len( self.chunk ) >= self.chunksize * self.RECORD.size:
+            self.flush()
+
+    def extend( self, groups: Sequence[Tuple[int,Sequence[Union[Account,AccountRecord]]]] ) -> int:
+        """Append each (index, group) of accounts, eg. from enumerate( accountgroups( ... )).  Returns
+        the number of groups.
+
+        """
+        count			= 0
+        for count,(index,group) in enumerate( groups, start=1 ):
+            for acct in group:
+                self.append( index, acct )
+        return count
+
+    def flush( self ):
+        self.writer.write( bytes( self.chunk ))
+        self.chunk		= bytearray()
+
+    def close( self ):
+        self.flush()
+        self.writer.close()
+
+    def discard( self ):
+        self.chunk		= bytearray()
+        self.writer.discard()
+
+    def __enter__( self ):
+        return self
+
+    def __exit__( self, exc_type, *exc ):
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+
+class AddressIndex:
+    """A reverse index from address to the (crypto, format, path) that produced it, for a master
+    secret.  Answers "which derivation path produced this deposit address?" without deriving every
+    address ever generated, and finds all the used addresses of a wallet.
+
+    Addresses are derived (and indexed) BIP-44 style, at each account' / change / index below the
+    default path of the crypto's address format, eg. for BTC bech32 m/84'/0'/<account>'/<change>/<index>.
+    For an x/y/z + pub/prv key master secret, there is no account level: m/<change>/<index>.
+
+    Each account's change chains are scanned until 'gap_limit' consecutive addresses are unused (ie.
+    not among those sought).  Unless specific accounts are supplied, account scanning stops with the
+    first account having no used addresses.
+
+    The index may be saved to (and restored from) a JSON file, so addresses need be derived only once.
+    The file records the fingerprint of the master secret's root node; loading an index saved for
+    some other master secret (or passphrase) raises a ValueError.
+
+    """
+    def __init__(
+        self,
+        master_secret: Union[str,bytes,MasterSecret],
+        passphrase: Optional[Union[bytes,str]] = None,  # If mnemonic(s) provided, then passphrase/using_bip39 optional
+        using_bip39: bool	= False,
+        gap_limit: Optional[int] = None,		# default: GAP_LIMIT
+        filename: Optional[str]	= None,			# Load any existing index from, and save to this file
+    ):
+        if not isinstance( master_secret, MasterSecret ):
+            master_secret	= MasterSecret(
+                master_secret,
+                passphrase	= passphrase,
+                using_bip39	= using_bip39,
+            )
+        self.master_secret	= master_secret
+        self.gap_limit		= GAP_LIMIT if gap_limit is None else gap_limit
+        self.filename		= filename
+        self.index		= {}  # { <address>: (<crypto>,<format>,<path>), ... }
+        self.accounts		= {}  # { (<crypto>,<format>): Account, ... }, re-derived at each path
+        self._fingerprint	= None
+        if filename and os.path.exists( filename ):
+            self.load( filename )
+
+    def __repr__( self ):
+        return f"{self.__class__.__name__}({len( self.index )} addresses)"
+
+    def __len__( self ):
+        return len( self.index )
+
+    def __contains__( self, address ):
+        return self.key( address ) in self.index
+
+    def __getitem__( self, address ) -> Tuple[str,str,str]:
+        return self.index[self.key( address )]
+
+    @staticmethod
+    def key( address: str ) -> str:
+        """Ethereum-style 0x... addresses are indexed case-insensitively (ignoring any EIP-55 checksum)."""
+        return address.lower() if address[:2] == '0x' else address
+
+    @property
+    def fingerprint( self ) -> str:
+        """Identifies the master secret's root node, as AddressCache.fingerprint does."""
+        if self._fingerprint is None:
+            if self.master_secret.watch_only:
+                watch_only	= self.master_secret.watch_only
+                self._fingerprint = hashlib.sha256( watch_only.chain_code + watch_only.public_key ).hexdigest()[:32]
+            else:
+                self._fingerprint = AddressCache.fingerprint( self.master_secret.account() )
+        return self._fingerprint
+
+    def load( self, filename: Optional[str] = None ):
+        filename		= filename or self.filename
+        with open( filename, 'r', encoding='UTF-8' ) as f:
+            saved		= json.load( f )
+        if not isinstance( saved, dict ) or saved.get( 'fingerprint' ) != self.fingerprint:
+            raise ValueError(
+                f"Address index {filename} was saved for another master secret (root {saved.get( 'fingerprint' ) if isinstance( saved, dict ) else None}), not {self.fingerprint}"
+            )
+        self.index.update( ( addr, tuple( found )) for addr,found in saved['index'].items() )
+
+    def save( self, filename: Optional[str] = None ):
+        with open( filename or self.filename, 'w', encoding='UTF-8' ) as f:
+            json.dump( dict( fingerprint=self.fingerprint, index=self.index ), f, indent=1 )
+
+    def path( self, crypto: str, format: str, account: int, change: int, index: int ) -> str:
+        if self.master_secret.from_method:
+            return f"m/{change}/{index}"
+        purpose_coin		= Account.path_default( crypto, format ).split( '/' )[:3]
+        return '/'.join( purpose_coin + [ f"{account}'", f"{change}", f"{index}" ] )
+
+    def derive( self, crypto: str, format: str, path: str ) -> str:
+        """Derive and index the crypto's address in format at path."""
+        if self.master_secret.watch_only:
+            _,path,address	= self.master_secret.watch_only.account( path=path, crypto=crypto, format=format )
+        else:
+            acct		= self.accounts.get( (crypto,format) )
+            if acct is None:
+                acct		= self.accounts[crypto,format] = self.master_secret.account( crypto=crypto, path=path, format=format )
+            else:
+                acct.from_derivation( derivation=CustomDerivation( path=path ))
+            path,address	= acct.path, acct.address
+        self.index[self.key( address )] = crypto,format,path
+        return address
+
+    def scan(
+        self,
+        crypto: Optional[str]	= None,			# default: 'ETH'
+        format: Optional[str]	= None,			# default: an x/y/z key's format, or the crypto's default
+        used: Optional[Sequence[str]] = None,		# The known used (eg. funded) addresses; default: none
+        accounts: Optional[Sequence[int]] = None,		# default: 0, 1, ... until an unused account
+        changes: Sequence[int]	= ( 0, 1 ),		# The external (receive) and internal (change) chains
+        gap_limit: Optional[int] = None,		# default: self.gap_limit
+        complete: bool		= False,		# Stop as soon as all the used addresses are found
+    ) -> List[Tuple[str,str,str,str]]:
+        """Scan the crypto's account(s) in format for any of the used addresses, indexing each address
+        derived.  Returns the (crypto, format, path, address) of each used address found, in the order
+        they were found.  If 'complete', stops as soon as every one of the used addresses is found.
+
+        """
+        crypto			= Account.supported( crypto or 'ETH' )
+        format			= format.lower() if format else self.master_secret.format_default or Account.address_format( crypto )
+        used			= set( map( self.key, used or () ))
+        gap_limit		= self.gap_limit if gap_limit is None else gap_limit
+        found			= []
+        for account in [0] if self.master_secret.from_method else itertools.count() if accounts is None else accounts:
+            account_used	= False
+            for change in changes:
+                gap,index	= 0,0
+                while gap < gap_limit:
+                    path	= self.path( crypto, format, account, change, index )
+                    address	= self.derive( crypto, format, path )
+                    if self.key( address ) in used:
+                        found.append( (crypto, format, self.index[self.key( address )][2], address) )
+                        if complete and len( found ) >= len( used ):
+                            return found
+                        account_used,gap = True,0
+                    else:
+                        gap    += 1
+                    index      += 1
+            log.info( f"Scanned {crypto} {format} account {account}: {'used' if account_used else 'unused'}; {len( found )} of {len( used )} found" )
+            if accounts is None and not account_used:
+                break
+        return found
+
+    def lookup(
+        self,
+        addresses: Sequence[str],
+        cryptopaths: Optional[Sequence[Union[str,Tuple[str,str]]]] = None,  # default: every crypto's formats
+        accounts: Optional[Sequence[int]] = None,
+        changes: Sequence[int]	= ( 0, 1 ),
+        gap_limit: Optional[int] = None,
+    ) -> Dict[str,Optional[Tuple[str,str,str]]]:
+        """Find the (crypto, format, path) of each of the addresses, or None if not found.  Any
+        addresses not already indexed are sought by scanning each of the (crypto, format) in
+        cryptopaths; "BTC" (all of its formats) or "BTC:bech32" (only that format); by default,
+        every supported crypto and format.  Any (crypto, format) that an x/y/z key cannot produce is
+        skipped.  The index is saved, if a filename was supplied.
+
+        """
+        missing			= [ addr for addr in addresses if addr not in self ]
+        if missing:
+            for crypto,formats in (
+                ( Account.supported( crypto ), [ format ] if format else Account.CRYPTO_FORMAT_PATH[Account.supported( crypto )] )
+                for crypto,format in (
+                    ( cp.split( ':', 1 ) + [ None ] )[:2] if isinstance( cp, str ) else cp
+                    for cp in cryptopaths or Account.CRYPTO_FORMAT_PATH
+                )
+            ):
+                for format in formats:
+                    try:
+                        self.scan(
+                            crypto	= crypto,
+                            format	= format,
+                            used	= missing,
+                            accounts	= accounts,
+                            changes	= changes,
+                            gap_limit	= gap_limit,
+                            complete	= True,
+                        )
+                    except exceptions.Error as exc:
+                        # eg. a ypub... key cannot produce another crypto's (or format's) addresses
+                        log.info( f"Skipping {crypto} {format} addresses: {exc}" )
+                        continue
+                    missing	= [ addr for addr in missing if addr not in self ]
+                    if not missing:
+                        break
+                if not missing:
+                    break
+            if self.filename:
+                self.save()
+        return { addr: self.index.get( self.key( addr )) for addr in addresses }
+
+
+class AddressCacheFile:
+    """An append-only file of fixed-size (path, pubkey, address) records, read via a memory map.
+
+    Following an 8-byte header, each record is a NUL-padded path (64 bytes), a compressed public key
+    (33 bytes) and a NUL-padded address (95 bytes).  The records present when the file is opened are
+    read from the (read-only) memory map; records appended since are also retained in memory.  Any
+    partial record (eg. from an interrupted append) is truncated away when opened.  Several handles
+    (or processes) may append the same path; the last such record is used.
+
+    """
+    MAGIC			= b'SLIP39AC'
+    RECORD			= struct.Struct( '64s33s95s' )
+
+    def __init__( self, filename: str ):
+        self.filename		= filename
+        self.file		= open( filename, 'a+b' )
+        self.load()
+
+    def __repr__( self ):
+        return f"{self.__class__.__name__}({self.filename!r}, {len( self )} records)"
+
+    def __len__( self ):
+        return len( self.index )
+
+    def __contains__( self, path ):
+        return path in self.index
+
+    def load( self ):
+        self.mmap		= None
+        self.mapped		= 0   # records in the mmap; a path appended more than once has several
+        self.index		= {}  # { <path>: <record number>, ... }
+        self.appended		= []  # [ (<pubkey>,<address>), ... ], appended since the mmap
+        size			= os.fstat( self.file.fileno() ).st_size
+        if not size:
+            self.file.write( self.MAGIC )
+            self.file.flush()
+            return
+        self.file.seek( 0 )
+        if self.file.read( len( self.MAGIC )) != self.MAGIC:
+            raise ValueError( f"{self.filename} is not an address cache file" )
+        count			= ( size - len( self.MAGIC )) // self.RECORD.size
+        if size != len( self.MAGIC ) + count * self.RECORD.size:
+            log.warning( f"{self.filename}: Truncating incomplete record at offset {len( self.MAGIC ) + count * self.RECORD.size}" )
+            self.file.truncate( len( self.MAGIC ) + count * self.RECORD.size )
+        if count:
+            self.mapped		= count
+            self.mmap		= mmap.mmap( self.file.fileno(), len( self.MAGIC ) + count * self.RECORD.size, access=mmap.ACCESS_READ )
+            for i in range( count ):
+                offset		= len( self.MAGIC ) + i * self.RECORD.size
+                self.index[self.mmap[offset:offset + 64].rstrip( b'\0' ).decode( 'ascii' )] = i
+
+    def get( self, path: str ) -> Optional[Tuple[str,str]]:
+        """Return the (hex) pubkey and address cached for path, or None."""
+        i			= self.index.get( path )
+        if i is None:
+            return None
+        if i >= self.mapped:
+            return self.appended[i - self.mapped]
+        _,pubkey,address	= self.RECORD.unpack_from( self.mmap, len( self.MAGIC ) + i * self.RECORD.size )
+        return pubkey.hex(), address.rstrip( b'\0' ).decode( 'ascii' )
+
+    def append( self, path: str, pubkey: str, address: str ) -> bool:
+        """Append the path's (hex) pubkey and address, unless already present; False if not cacheable."""
+        if path in self.index:
+            return True
+        if len( path ) > 64 or len( address ) > 95 or len( pubkey ) != 66:
+            return False  # would be silently truncated/padded
+        try:
+            record		= self.RECORD.pack( path.encode( 'ascii' ), bytes.fromhex( pubkey ), address.encode( 'ascii' ))
+        except ( UnicodeEncodeError, ValueError ):
+            return False
+        self.file.write( record )
+        self.file.flush()
+        self.index[path]	= self.mapped + len( self.appended )
+        self.appended.append( (pubkey, address) )
+        return True
+
+    def discard( self ):
+        """Discard all the cached records."""
+        if self.mmap is not None:
+            self.mmap.close()
+        self.file.truncate( 0 )
+        self.load()
+
+    def close( self ):
+        if self.mmap is not None:
+            self.mmap.close()
+            self.mmap		= None
+        self.file.close()
+
+
+class AddressCache:
+    """An on-disk cache of the public data (path, pubkey and address) derived from master secrets, so
+    services regenerating the same ranges of (eg. deposit) addresses after every restart need not
+    re-derive them.  Supply it as the 'address_cache' of accounts or addresses.
+
+    Only public data is ever stored; never a private key or seed.  Each (crypto, format) of a master
+    secret has its own AddressCacheFile in the 'directory', named by the fingerprint of the master
+    secret's root public key and chain code (ie. of its root xpub...), eg.:
+
+        2f1c...9e0a-BTC-bech32.adr
+
+    When a file is first used, 'verify' of its records (default: ADDRESS_CACHE_VERIFY) are randomly
+    sampled and re-derived; if any fail to match, the file's records are discarded (and re-derived
+    as required).
+
+    """
+    def __init__(
+        self,
+        directory: str,
+        verify: Optional[int]	= None,			# default: ADDRESS_CACHE_VERIFY
+    ):
+        self.directory		= directory
+        self.verify		= ADDRESS_CACHE_VERIFY if verify is None else verify
+        self.files		= {}  # { (<fingerprint>,<crypto>,<format>): (AddressCacheFile,Account), ... }
+        self.hits		= 0
+        self.misses		= 0
+        os.makedirs( directory, exist_ok=True )
+
+    def __repr__( self ):
+        return f"{self.__class__.__name__}({self.directory!r}, {len( self.files )} files, {self.hits} hits, {self.misses} misses)"
+
+    @staticmethod
+    def fingerprint( acct: Account ) -> str:
+        """Identifies the Account's root node, by the hash of its public key and chain code."""
+        hd			= acct.hdwallet._hd
+        return hashlib.sha256( hd._root_chain_code + hd._root_public_key.raw_compressed() ).hexdigest()[:32]
+
+    def open( self, master_secret: MasterSecret, crypto: Optional[str] = None, format: Optional[str] = None ) -> Tuple[AddressCacheFile,Account]:
+        """Return the AddressCacheFile for the master secret's crypto and format, and an Account (to
+        re-derive at any path).  The file is verified by re-deriving a random sample, when first used.
+
+        """
+        acct			= master_secret.account( crypto=crypto, format=format )
+        key			= ( self.fingerprint( acct ), acct.crypto, acct.format )
+        if key in self.files:
+            return self.files[key]
+        cached			= AddressCacheFile( os.path.join( self.directory, '-'.join( key ) + '.adr' ))
+        self.files[key]		= cached,acct
+        for path in random.sample( list( cached.index ), min( self.verify, len( cached ))):
+            acct.from_derivation( derivation=CustomDerivation( path=path ))
+            if ( acct.pubkey, acct.address ) != cached.get( path ):
+                log.warning( f"{cached!r}: Discarding records; {path} doesn't match its re-derived {acct.address}" )
+                cached.discard()
+                break
+        return cached,acct
+
+    def records(
+        self,
+        master_secret: MasterSecret,
+        crypto: Optional[str]	= None,
+        paths: Optional[Union[str,PathRange]] = None,
+        format: Optional[str]	= None,
+        allow_unbounded: bool	= True,
+        workers: Optional[int]	= None,			# Derive any missing records in parallel, using this many processes
+        chunksize: int		= 100,
+    ) -> Sequence[AccountRecord]:
+        """Yield an AccountRecord (w/ pubkey) for each of the paths, from the cache if available, otherwise
+        by deriving (and caching) it.  A seed's paths are relative to the format's default path.
+
+        If 'workers', the paths are considered 'chunksize' per worker at a time; those missing from
+        the cache are derived by the pool of worker processes, and cached (in order) here.
+
+        """
+        cached,acct		= self.open( master_secret, crypto=crypto, format=format )
+        default			= None if master_secret.from_method else Account.path_default( acct.crypto, acct.format )
+        pool			= ProcessPoolExecutor(
+            max_workers	= workers,
+            initializer	= accountgroups_worker,
+            initargs	= (
+                master_secret.master_secret, master_secret.passphrase, master_secret.using_bip39,
+                dict( Account.CRYPTO_FORMAT ), master_secret.backend or Account.ecc_backend(),
+            ),
+        ) if workers else None
+        try:
+            ranged		= iter( PathRange.of( paths, allow_unbounded=allow_unbounded ))
+            while window := list( itertools.islice( ranged, chunksize * workers if pool else 1 )):
+                if default:
+                    window	= [ path_edit( default, path ) if path else default for path in window ]
+                derived		= {}  # { <path>: (<path>,<pubkey>,<address>), ... }
+                if pool and ( missing := list( dict.fromkeys( path for path in window if path and path not in cached ))):
+                    for found in pool.map(
+                        partial( address_cache_chunk, acct.crypto, acct.format ),
+                        [ missing[i:i + chunksize] for i in range( 0, len( missing ), chunksize ) ],
+                    ):
+                        derived.update( zip( missing[len( derived ):], found ))
+                for path in window:
+                    found	= cached.get( path ) if path else None
+                    if found:
+                        self.hits  += 1
+                        pubkey,address	= found
+                    elif path in derived:
+                        self.misses += 1
+                        path,pubkey,address = derived[path]
+                        cached.append( path, pubkey, address )
+                    else:
+                        self.misses += 1
+                        if path:
+                            acct.from_derivation( derivation=CustomDerivation( path=path ))
+                        else:
+                            acct	= master_secret.account( crypto=acct.crypto, format=acct.format )
+                        pubkey,address	= acct.pubkey, acct.address
+                        path		= acct.path
+                        cached.append( path, pubkey, address )
+                    yield AccountRecord( acct.crypto, acct.format, path, address, pubkey=pubkey )
+        finally:
+            if pool:
+                pool.shutdown( wait=True, cancel_futures=True )
+
+    def close( self ):
+        for cached,_ in self.files.values():
+            cached.close()
+        self.files		= {}
+
+
+def addresses_crosscheck(
+    master_secret: Union[str,bytes,MasterSecret],
+    crypto: str	 		= None,  # default 'ETH'
+    paths: Optional[Union[str,PathRange]] = None,  # default: The crypto's path_default; supports ranges (or a PathRange)
+    format: Optional[str]	= None,
+    allow_unbounded: bool	= True,
+    passphrase: Optional[Union[bytes,str]] = None,  # If mnemonic(s) provided, then passphrase/using_bip39 optional
+    using_bip39: bool		= False,
+    backends: Optional[Sequence[str]] = None,		# default: all available Account.ecc_backends()
+):
+    """Generate the same sequence of (crypto, path, address) as addresses, but derive each one using
+    every one of the secp256k1 ECC backends, and raise an AssertionError if they ever disagree.
+
+    """
+    if isinstance( master_secret, MasterSecret ):
+        master_secret,passphrase,using_bip39 = (
+            master_secret.master_secret, master_secret.passphrase, master_secret.using_bip39 )
+    backends			= backends or Account.ecc_backends()
+    for results in zip( *(
+        addresses(
+            MasterSecret(
+                master_secret,
+                passphrase	= passphrase,
+                using_bip39	= using_bip39,
+                backend		= backend,
+            ),
+            crypto		= crypto,
+            paths		= paths,
+            format		= format,
+            allow_unbounded	= allow_unbounded,
+        )
+        for backend in backends
+    )):
+        result,*others		= results
+        assert all( other == result for other in others ), \
+            f"secp256k1 backends {commas( backends )} disagree: {commas( results )}"
+        yield result
+
+
+def addresses_benchmark(
+    master_secret: Optional[Union[str,bytes]] = None,		# default: a random 128-bit seed
+    count: int			= 100,
+    backends: Optional[Sequence[str]] = None,		# default: all available Account.ecc_backends()
+    crosscheck: bool		= True,
+) -> Dict[Tuple[str,str,str],float]:
+    """Measure the addresses/second derived by each secp256k1 ECC backend, for every crypto and
+    format in Account.CRYPTO_FORMAT_PATH.  The 'count' addresses m/.../0 to m/.../<count-1> below each
+    default path are derived.  Returns { (<backend>,<crypto>,<format>): <addresses/second>, ... }.
+
+    Unless 'crosscheck' is False, also confirms that all the backends derive identical addresses.
+
+    """
+    if master_secret is None:
+        master_secret		= random_secret()
+    backends			= backends or Account.ecc_backends()
+    rates			= {}
+    addrs			= {}
+    for backend in backends:
+        for crypto,format_paths in Account.CRYPTO_FORMAT_PATH.items():
+            for format,path in format_paths.items():
+                begun		= timer()
+                addrs[crypto,format,backend] = list( addresses(
+                    MasterSecret( master_secret, backend=backend ),
+                    crypto	= crypto,
+                    paths	= path_edit( path, f"...-{count-1}" ),
+                    format	= format,
+                ))
+                rates[backend,crypto,format] = count / ( timer() - begun )
+                log.info( f"{backend:>12} {crypto:>5} {format:>8}: {rates[backend,crypto,format]:9.2f} addresses/s" )
+                if crosscheck:
+                    assert addrs[crypto,format,backend] == addrs[crypto,format,backends[0]], \
+                        f"secp256k1 backends {backend} and {backends[0]} disagree for {crypto} {format} addresses"
+    return rates
+
+
+def iteration_exponent_benchmark(
+    target: Optional[float]	= None,			# default: ITERATION_SECONDS per recovery
+    names: Sequence[int]	= (1, 10, 100, 1000),		# Project write_pdfs batches of this many names
+    workers: Optional[int]	= None,			# ... creating their Details w/ this many processes
+    strength: int		= BITS_DEFAULT,
+    passphrase: Optional[Union[bytes,str]] = None,
+    minimum: float		= .1,			# Calibrate the KDF w/ at least this many seconds of PBKDF2
+    repeat: int			= 3,			# Keep the fastest of this many of each measurement
+    render: bool		= True,			# Also measure the (serial) PDF rendering of each name
+    **kwds,						# Any other create options (eg. using_bip39, cryptopaths)
+) -> Dict[str,Any]:
+    """Measure the cost of the SLIP-39 PBKDF2 KDF on this machine, and recommend the largest
+    iteration_exponent whose decryption (ie. each recovery of the Mnemonics, or each passphrase
+    guess) takes no longer than 'target' seconds.
+
+    Each EncryptedMasterSecret encryption or decryption runs BASE_ITERATION_COUNT << e PBKDF2
+    iterations.  These are timed at increasing exponents until one takes at least 'minimum'
+    seconds, yielding a per-iteration cost that is projected over every possible exponent.  The
+    remaining (exponent-independent) cost of each create, and of rendering each name's PDF, are also
+    measured, to project the duration of write_pdfs runs of each of the 'names' batch sizes.  Only
+    the Details creation is parallelized by 'workers'; the PDFs are rendered serially.
+
+    Returns a report dict (directly exportable as JSON); its "exponents" are flat rows (exportable
+    as CSV), w/ the projected "encrypt", "decrypt", "create" and "batch_<N>" seconds of each exponent.
+
+    """
+    target			= ITERATION_SECONDS if target is None else target
+    workers			= workers or 1
+    if passphrase is None:
+        passphrase		= b""
+    if isinstance( passphrase, str ):
+        passphrase		= passphrase.encode( 'UTF-8' )
+    secret			= random_secret(( strength + 7 ) // 8 )
+
+    def fastest( func ):
+        durations		= []
+        for _ in range( repeat ):
+            begun		= timer()
+            result		= func()
+            durations.append( timer() - begun )
+        return min( durations ), result
+
+    for exponent in range( 1 << ITERATION_EXP_LENGTH_BITS ):
+        encrypt,ems		= fastest( partial(
+            EncryptedMasterSecret.from_master_secret,
+            master_secret	= secret,
+            passphrase	= passphrase,
+            identifier	= _random_identifier(),
+            extendable	= True,
+            iteration_exponent = exponent,
+        ))
+        decrypt,_		= fastest( partial( ems.decrypt, passphrase ))
+        if min( encrypt, decrypt ) >= minimum:
+            break
+    iterations			= BASE_ITERATION_COUNT << exponent
+    encrypt_rate		= encrypt / iterations
+    decrypt_rate		= decrypt / iterations
+    log.info( f"SLIP-39 KDF w/ iteration_exponent {exponent} ({iterations:,} iterations): {encrypt:.3f}s encrypt, {decrypt:.3f}s decrypt" )
+
+    # The cost of each create, beyond its KDF; eg. deriving the accounts, and any BIP-39 Seed
+    created,details		= fastest( partial(
+        create, "benchmark", master_secret=secret, passphrase=passphrase, iteration_exponent=0, **kwds
+    ))
+    create_overhead		= max( 0.0, created - encrypt_rate * BASE_ITERATION_COUNT )
+    render_overhead		= 0.0
+    if render:
+        from .layout		import produce_pdf		# (layout depends on api)
+        render_overhead,_	= fastest( partial( produce_pdf, *details ))
+
+    rows			= []
+    for e in range( 1 << ITERATION_EXP_LENGTH_BITS ):
+        row			= dict(
+            iteration_exponent	= e,
+            iterations		= BASE_ITERATION_COUNT << e,
+            encrypt		= encrypt_rate * ( BASE_ITERATION_COUNT << e ),
+            decrypt		= decrypt_rate * ( BASE_ITERATION_COUNT << e ),
+        )
+        row['create']		= create_overhead + row['encrypt']
+        for n in names:
+            row[f"batch_{n}"]	= n * row['create'] / min( workers, n ) + n * render_overhead
+        rows.append( row )
+
+    fits			= [ row['iteration_exponent'] for row in rows if row['decrypt'] <= target ]
+    recommended			= fits[-1] if fits else 0
+    if not fits:
+        log.warning( f"No SLIP-39 iteration_exponent decrypts in {target:.3f}s; {rows[0]['decrypt']:.3f}s minimum" )
+    log.info( f"SLIP-39 iteration_exponent {recommended} recommended; {rows[recommended]['decrypt']:.3f}s per recovery (target {target:.3f}s)" )
+    for n in names:
+        log.info( f"write_pdfs of {n:>6,} names w/ {workers} workers: {rows[recommended][f'batch_{n}']:12.3f}s" )
+    return dict(
+        target		= target,
+        recommended	= recommended,
+        workers		= workers,
+        strength	= strength,
+        names		= list( names ),
+        encrypt_per_iteration = encrypt_rate,
+        decrypt_per_iteration = decrypt_rate,
+        create_overhead	= create_overhead,
+        render_overhead	= render_overhead,
+        exponents	= rows,
+    )
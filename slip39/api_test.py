@@ -1,11 +1,20 @@
 # -*- mode: python ; coding: utf-8 -*-
+import itertools
 import json
+import multiprocessing
+import os
+import pickle
 import pytest
+import sys
 
 try:
     import eth_account
 except ImportError:
     eth_account			= None
+try:
+    import numpy
+except ImportError:
+    numpy			= None
 try:
     from Crypto.Cipher	import AES
     from Crypto.Protocol.KDF import scrypt
@@ -14,9 +23,17 @@ except ImportError:
     scrypt			= None
 
 import shamir_mnemonic
-
-from .			import account, create, addresses, addressgroups, accountgroups, Account
-from .recovery		import recover
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools		import partial
+
+from .			import (
+    account, accounts, create, create_parallel, addresses, addressgroups, accountgroups, addresses_batch, cryptopaths_parser,
+    addresses_crosscheck, addresses_benchmark, iteration_exponent_benchmark,
+    Account, AccountColumns, AccountRecord, AddressCache, AddressIndex, CryptoProfile, FormatContext, MasterSecret, DerivationCache, PathRange, WatchOnly,
+    SeedEntropyStretcher, stretch_seed_entropy,
+)
+from .			import api
+from .recovery		import recover, secret_forget, secret_remember
 
 from .dependency_test	import substitute, nonrandom_bytes, SEED_XMAS, SEED_ONES
 
@@ -487,6 +504,63 @@ def test_create_bip39():
     assert xrp.address == 'rUPzi4ZwoYxi7peKCqUkzqEuSrzSRyLguV'
 
 
+def test_create_parallel():
+    """Details for many names are created by worker processes, each w/ its own random secret, in order."""
+    names			= [ f"Wallet {n}" for n in range( 6 ) ]
+    details			= list( create_parallel(
+        names, workers=2, group_threshold=1, groups=dict( fren = (3,5) ), cryptopaths=('ETH','BTC'),
+    ))
+    assert [ d.name for d in details ] == names
+    assert len( set( d.accounts[0][0].address for d in details )) == len( names )
+    for d in details:
+        assert account( '\n'.join( d.groups['fren'][1][:3] ), crypto='BTC' ).address == d.accounts[0][1].address
+
+    with pytest.raises( AssertionError ):
+        list( create_parallel( names, master_secret=SEED_XMAS ))
+
+
+def test_create_parallel_spawn( monkeypatch ):
+    """Spawned workers (the default on macOS and Windows) adopt the parent's formats, even for
+    dynamically supported cryptos they have not yet registered."""
+    monkeypatch.setattr( api, 'ProcessPoolExecutor', partial( ProcessPoolExecutor, mp_context=multiprocessing.get_context( 'spawn' )))
+    format			= Account.address_format( 'QTUM' )
+    Account.address_format( 'QTUM', 'legacy' )
+    try:
+        serial			= create( "spawn", 1, dict( one=(1, 1) ), SEED_XMAS, cryptopaths=[ 'QTUM' ] ).accounts[0][0]
+        assert serial.path == "m/44'/2301'/0'/0/0"
+        details,		= create_parallel( [ 'spawn' ], workers=1, group_threshold=1, groups=dict( one=(1, 1) ), cryptopaths=[ 'QTUM' ] )
+        assert details.accounts[0][0].path == serial.path
+        assert account( details.groups['one'][1][0], crypto='QTUM' ).address == details.accounts[0][0].address
+        assert [ a.path for a, in accountgroups( SEED_XMAS, [ 'QTUM:../0-1' ], workers=1 ) ] \
+            == [ a.path for a, in accountgroups( SEED_XMAS, [ 'QTUM:../0-1' ] ) ]
+    finally:
+        Account.address_format( 'QTUM', format )
+
+def test_create_parallel_bip39( tmp_path, monkeypatch ):
+    """The workers' using_bip39 secrets are remembered here; the PDF cover pages needn't decrypt them."""
+    from .layout		import write_pdfs
+
+    decrypts			= []
+    decrypt			= shamir_mnemonic.EncryptedMasterSecret.decrypt
+
+    def decrypt_counted( self, passphrase ):
+        decrypts.append( passphrase )
+        return decrypt( self, passphrase )
+    monkeypatch.setattr( shamir_mnemonic.EncryptedMasterSecret, 'decrypt', decrypt_counted )
+
+    names			= [ f"Wallet {n}" for n in range( 3 ) ]
+    try:
+        pdfs			= write_pdfs(
+            names=names, using_bip39=True, workers=2, group=[ "fren(2/3)" ], group_threshold=1,
+            filepath=str( tmp_path ), filename="{name}.pdf",
+        )
+        assert list( pdfs ) == [ f"{name}.pdf" for name in names ]
+        assert decrypts == []
+        assert not secret_remember.secrets  # each was recalled (and forgotten) by its cover page
+    finally:
+        secret_forget()
+
+
 def test_addresses():
     master_secret		= b'\xFF' * 16
     addrs			= list( addresses(
@@ -630,3 +704,572 @@ def test_accountgroups():
     ))
     # print( json.dumps( acctgrps, default=repr ))
     assert len(acctgrps) == 4
+
+
+def test_accountgroups_mnemonic_once():
+    """Mnemonics are resolved into their root node just once per accountgroups call, and produce the
+    same Accounts as the raw Seed."""
+    details			= create(
+        "SLIP39 Wallet: Ones native SLIP-39",
+        1,
+        dict( fren = (3,5) ),
+        SEED_ONES
+    )
+    mnemonics			= '\n'.join( details.groups['fren'][1][:3] )
+    cryptopaths			= [
+        ('ETH', ".../-3"),
+        ('BTC', ".../-3"),
+        ('LTC', ".../-3"),
+    ]
+
+    recoveries			= []
+
+    def recover_counted( *args, **kwds ):
+        recoveries.append( args )
+        return recover( *args, **kwds )
+
+    with substitute( api, 'recover_slip39', recover_counted ):
+        addrgrps_mnemonics	= list( addressgroups( mnemonics, cryptopaths ))
+    assert len( recoveries ) == 1
+    assert addrgrps_mnemonics == list( addressgroups( SEED_ONES, cryptopaths ))
+    assert addrgrps_mnemonics[3][1] == ('BTC', "m/84'/0'/0'/0/3", account( SEED_ONES, 'BTC', "../3" ).address )
+
+    # A MasterSecret may be resolved once, and shared across calls
+    master_secret		= MasterSecret( BIP39_ZOO )
+    assert [
+        acct.address for acct in accounts( master_secret, 'ETH', ".../-1" )
+    ] + [
+        acct.address for acct in accounts( master_secret, 'ETH', ".../2-3" )
+    ] == [
+        '0xfc2077CA7F403cBECA41B1B0F62D91B5EA631B5E',
+        '0xd1a7451beB6FE0326b4B78e3909310880B781d66',
+        '0x578270B5E5B53336baC354756b763b309eCA90Ef',
+        '0x909f59835A5a120EafE1c60742485b7ff0e305da',
+    ]
+    assert len( master_secret.roots ) == 1
+
+
+def test_derivation_cache():
+    """Sequential paths reuse their (cached) parent node; only the final index is derived."""
+    cache			= DerivationCache()
+    master_secret		= MasterSecret( SEED_XMAS, cache=cache )
+    addrs			= [ acct.address for acct in accounts( master_secret, 'ETH', ".../-9" ) ]
+    assert cache.misses == 5 + 9  # m/44'/60'/0'/0/0, then .../1-9
+    assert cache.hits == 4 * 9    # ... reusing m/44'/60'/0'/0
+    assert len( cache ) == 4 + 10
+    assert addrs == [ account( SEED_XMAS, 'ETH', f"../{i}" ).address for i in range( 10 ) ]
+
+    # A different root (here, the BIP-39 Seed from the same entropy) doesn't share nodes
+    cache.clear()
+    assert [
+        acct.address for acct in accounts( MasterSecret( SEED_XMAS, using_bip39=True, cache=cache ), 'ETH', ".../-9" )
+    ] == [
+        account( SEED_XMAS, 'ETH', f"../{i}", using_bip39=True ).address for i in range( 10 )
+    ] != addrs
+    assert cache.misses == 5 + 9
+
+    # Bounded; least-recently used nodes are discarded, but the common parent remains
+    cache			= DerivationCache( size=8 )
+    list( accounts( MasterSecret( SEED_XMAS, cache=cache ), 'ETH', ".../-9" ))
+    assert len( cache ) == 8
+    assert cache.hits == 4 * 9
+
+
+def test_addresses_batch():
+    """Columnar batches of addresses for a range of each cryptopath's paths."""
+    cryptopaths			= [ "ETH:.../-", "BTC:.../-", "BTC:m/49'/0'/0'/0/-:segwit", "LTC:../-1/-3" ]
+    eth,btc,btc_segwit,ltc	= addresses_batch( BIP39_ZOO, cryptopaths, start=2, count=4, pubkeys=True )
+    assert eth.crypto == 'ETH' and eth.format == 'legacy'
+    assert eth.paths == [ f"m/44'/60'/0'/0/{i}" for i in range( 2, 6 ) ]
+    assert eth.addresses[:2] == [
+        '0x578270B5E5B53336baC354756b763b309eCA90Ef',
+        '0x909f59835A5a120EafE1c60742485b7ff0e305da',
+    ]
+    assert btc.addresses[:2] == [
+        'bc1qvr7e5aytd0hpmtaz2d443k364hprvqpm3lxr8w',
+        'bc1q6t9vhestkcfgw4nutnm8y2z49n30uhc0kyjl0d',
+    ]
+    assert eth.xpubkeys is None and len( eth.pubkeys ) == 4
+    assert btc_segwit.format == 'segwit' and btc_segwit.paths[0] == "m/49'/0'/0'/0/2"
+    assert ltc.paths == [ "m/84'/2'/0'/0/2", "m/84'/2'/0'/0/3", "m/84'/2'/0'/1/0", "m/84'/2'/0'/1/1" ]
+
+    # The same as the equivalent addresses
+    for batch,(cry,pth,fmt) in zip( (eth,btc,btc_segwit,ltc), cryptopaths_parser( cryptopaths )):
+        assert list( zip( batch.paths, batch.addresses )) == [
+            (path, addr)
+            for _,path,addr in itertools.islice( addresses( BIP39_ZOO, cry, pth, fmt ), 2, 6 )
+        ]
+
+    # Unbounded path ranges require a count
+    with pytest.raises( AssertionError ):
+        addresses_batch( BIP39_ZOO, [ "ETH:.../-" ] )
+
+
+def test_accountgroups_parallel():
+    """Parallel derivation yields the same groups, in the same order; unbounded ranges are streamed."""
+    cryptopaths			= [ ('ETH', ".../-"), ('BTC', ".../-") ]
+    addrgrps			= list( itertools.islice( addressgroups( BIP39_ZOO, cryptopaths ), 25 ))
+    assert list( itertools.islice( addressgroups( BIP39_ZOO, cryptopaths, workers=2 ), 25 )) == addrgrps
+    assert [
+        tuple( (acct.crypto, acct.path, acct.address) for acct in group )
+        for group in accountgroups( BIP39_ZOO, [ ('ETH', ".../-24"), ('BTC', ".../-24") ], workers=2, chunksize=10 )
+    ] == addrgrps
+    assert list( addresses( SEED_XMAS, 'BTC', "../-1/-2", workers=2 )) == list( addresses( SEED_XMAS, 'BTC', "../-1/-2" ))
+
+
+def test_watch_only():
+    """Addresses below an x/y/z + pub key are derived without an Account per address."""
+    for format,path in ( ('legacy', "m/44'/0'/0'"), ('segwit', "m/49'/0'/0'"), ('bech32', "m/84'/0'/0'") ):
+        xpubkey			= account( SEED_XMAS, 'BTC', path, format=format ).xpubkey
+        assert MasterSecret( xpubkey ).watch_only.format_default == format
+        for crypto,fmt in ( ('BTC', None), ('BTC', format), ('LTC', format), ('DOGE', 'legacy'), ('ETH', None) ):
+            try:
+                expected	= [ (acct.crypto, acct.path, acct.address) for acct in accounts( xpubkey, crypto, "../-1/-3", fmt ) ]
+            except Exception as exc:
+                with pytest.raises( type( exc )):
+                    list( addresses( xpubkey, crypto, "../-1/-3", fmt ))
+            else:
+                assert list( addresses( xpubkey, crypto, "../-1/-3", fmt )) == expected
+
+    watch			= WatchOnly( xpubkey )
+    assert watch.address( crypto='BTC' ) == account( xpubkey, 'BTC' ).address
+    assert watch.account( "m/1/2", crypto='BTC' ) == ( 'BTC', "m/1/2", account( xpubkey, 'BTC', "m/1/2" ).address )
+    assert len( watch.nodes ) == 1  # m/1 retained; the leaf m/1/2 is not
+
+    # A WatchOnly may be shared by threads, each deriving its own crypto's addresses
+    cryptopaths			= [ (crypto, f"m/{change}/{index}") for index in range( 10 ) for change in ( 0, 1 ) for crypto in ( 'BTC', 'LTC' ) ]
+    expected			= [ watch.account( path, crypto=crypto ) for crypto,path in cryptopaths ]
+    shared			= WatchOnly( xpubkey, size=3 )
+    switching			= sys.getswitchinterval()
+    sys.setswitchinterval( 1e-6 )  # Switch threads often, to provoke any races
+    try:
+        with ThreadPoolExecutor( max_workers=8 ) as executor:
+            assert list( executor.map( lambda cp: shared.account( cp[1], crypto=cp[0] ), cryptopaths * 10 )) == expected * 10
+    finally:
+        sys.setswitchinterval( switching )
+    with pytest.raises( Exception, match="Hardened" ):
+        watch.address( "m/0'/1", crypto='BTC' )
+    with pytest.raises( ValueError ):
+        WatchOnly( account( SEED_XMAS, 'BTC' ).xprvkey )
+
+
+def test_ecc_backends():
+    """Every available secp256k1 ECC backend derives identical keys and addresses."""
+    assert Account.ecc_backend() == 'coincurve'
+    assert set( Account.ecc_backends() ) == { 'coincurve', 'ecdsa' }
+    ecdsa			= MasterSecret( SEED_XMAS, backend='ecdsa' ).account( 'BTC' )
+    assert ecdsa.hdwallet._hd._ecc.__class__ is Account.ECC_BACKENDS['ecdsa']
+    assert ecdsa.xpubkey == account( SEED_XMAS, 'BTC' ).xpubkey
+
+    try:
+        Account.ecc_backend( 'ecdsa' )
+        assert Account( 'ETH' ).backend == 'ecdsa'
+        with pytest.raises( ValueError ):
+            Account.ecc_backend( 'nonexistent' )
+    finally:
+        Account.ecc_backend( False )
+    assert Account( 'ETH' ).backend == 'coincurve'
+
+    assert list( addresses_crosscheck( BIP39_ZOO, 'BTC', "../-1/-2" )) == list( addresses( BIP39_ZOO, 'BTC', "../-1/-2" ))
+    xpubkey			= account( SEED_XMAS, 'LTC', "m/84'/2'/0'" ).xpubkey
+    assert list( addresses_crosscheck( xpubkey, 'LTC', "m/0/-3" )) == list( addresses( xpubkey, 'LTC', "m/0/-3" ))
+
+    rates			= addresses_benchmark( SEED_XMAS, count=3 )
+    assert set( rates ) == set(
+        (backend, crypto, format)
+        for backend in Account.ecc_backends()
+        for crypto,formats in Account.CRYPTO_FORMAT_PATH.items()
+        for format in formats
+    )
+    for (backend,crypto,format),rate in sorted( rates.items() ):
+        print( f"{backend:>12} {crypto:>5} {format:>8}: {rate:9.2f} addresses/s" )
+
+
+def test_seed_entropy_stretcher():
+    """Successive, backward and random-access Seed Entropy is identical to stretch_seed_entropy."""
+    for entropy,encoding in (( "0123abcd", 'hex_codec' ), ( "dice 316242", 'UTF-8' ), ( SEED_XMAS * 4, None )):
+        for bits in ( 128, 256, 512 ):
+            stretcher		= SeedEntropyStretcher( entropy, bits, encoding, checkpoint=10 )
+            for n in range( 100 ):
+                assert stretcher( n ) == stretch_seed_entropy( entropy, n, bits, encoding )
+            assert stretcher.rounds == 99 + ( encoding == 'UTF-8' )
+            for n in ( 55, 99, 3, 0, 42 ):
+                rounds		= stretcher.rounds
+                assert stretcher( n ) == stretch_seed_entropy( entropy, n, bits, encoding )
+                assert stretcher.rounds - rounds < 10
+
+    assert SeedEntropyStretcher( "", 256, 'UTF-8' )( 0 ) == b'\0' * 32
+    with pytest.raises( AssertionError ):
+        SeedEntropyStretcher( "", 128, 'hex_codec' )( 1 )
+
+
+def test_iteration_exponent_benchmark():
+    """The SLIP-39 KDF cost is measured, and projected over every iteration_exponent."""
+    report			= iteration_exponent_benchmark( target=.5, names=(1, 20), workers=4, minimum=.01, repeat=1, render=False )
+    assert json.loads( json.dumps( report )) == report
+    rows			= report['exponents']
+    assert [ row['iteration_exponent'] for row in rows ] == list( range( 16 ))
+    assert all( b['decrypt'] == 2 * a['decrypt'] for a, b in zip( rows, rows[1:] ))
+    assert rows[report['recommended']]['decrypt'] <= .5 or report['recommended'] == 0
+    assert report['recommended'] == 15 or rows[report['recommended']+1]['decrypt'] > .5
+    assert report['render_overhead'] == 0
+    # 20 names w/ 4 workers take 5 creates' time; 1 name, 1 create
+    for row in rows:
+        assert row['batch_20'] == pytest.approx( 5 * row['batch_1'] )
+        print( f"{row['iteration_exponent']:2}: {row['decrypt']:9.3f}s recover, {row['batch_20']:9.3f}s for 20 names" )
+
+
+def test_addresses_formats():
+    """Each path is derived once, yielding its address in each of the desired formats."""
+    formats			= ( 'legacy', 'segwit', 'bech32' )
+    assert list( addresses( SEED_XMAS, 'BTC', "../-1", formats=formats )) == [
+        ( 'BTC', "m/84'/0'/0'/0/0", (
+            '134t1ktyF6e4fNrJR8L6nXtaTENJx9oGcF', '3HVYmkx24C2V7mPqPjysJfrqtef1gdTkPK', 'bc1qz6kp20ukkyx8c5t4nwac6g8hsdc5tdkxhektrt' )),
+        ( 'BTC', "m/84'/0'/0'/0/1", (
+            '1NL3VN8FA6HaLG8y32qWJ2FuNRUM5TUrdo', '39DvnHjG7Bhc6saQ2cQqEWR4aZPcQ5cyo4', 'bc1qa86f7k446tjxt55uemfu7vwk7t56e9z8qpl8dq' )),
+    ]
+    # The same as the separately derived Account in each format, for every crypto
+    for crypto,format_paths in Account.CRYPTO_FORMAT_PATH.items():
+        for acct in accounts( BIP39_ZOO, crypto, "../-2", formats=tuple( format_paths )):
+            assert acct.addresses == tuple(
+                account( BIP39_ZOO, crypto, acct.path, format ).address
+                for format in format_paths
+            )
+    assert account( SEED_XMAS, 'LTC' ).format_addresses() == account( SEED_XMAS, 'LTC' ).addresses
+
+    # An xpub... yields the same addresses, in any format
+    xpubkey			= account( SEED_XMAS, 'BTC', "m/84'/0'/0'" ).xpubkey
+    assert list( addresses( xpubkey, 'BTC', "m/0/-1", formats=formats )) == [
+        ( 'BTC', 'm' + path[11:], addrs ) for _,path,addrs in addresses( SEED_XMAS, 'BTC', "../-1", formats=formats )
+    ]
+    with pytest.raises( ValueError, match="ETH address format.* 'bech32' not supported; specify one of legacy" ):
+        account( SEED_XMAS, 'ETH' ).format_addresses( ( 'bech32', ))
+
+
+def test_account_records( tmp_path ):
+    """Compact, immutable AccountRecords may be generated instead of full Accounts."""
+    cryptopaths			= [ "ETH:../-2", "BTC:../-2" ]
+    groups			= list( accountgroups( SEED_XMAS, cryptopaths ))
+    records			= list( accountgroups( SEED_XMAS, cryptopaths, records=True ))
+    assert records == [ tuple( map( AccountRecord.from_account, group )) for group in groups ]
+    assert records == list( accountgroups( SEED_XMAS, cryptopaths, records=True, workers=2 ))
+
+    eth,btc			= records[1]
+    assert ( btc.crypto, btc.format, btc.path, btc.address ) == ( 'BTC', 'bech32', "m/84'/0'/0'/0/1", groups[1][1].address )
+    assert btc.symbol == 'BTC' and btc.pubkey is None and btc.xpubkey is None
+    assert repr( eth ) == repr( groups[1][0] ).replace( 'Account(', 'AccountRecord(' )
+    assert not hasattr( btc, '__dict__' )
+    with pytest.raises( AttributeError ):
+        btc.address		= '1Fake'
+    assert pickle.loads( pickle.dumps( btc )) == btc
+
+    # Desired keys may be retained, and the full Account may be materialized on demand
+    btc,			= accounts( SEED_XMAS, 'BTC', "../1", records=( 'pubkey', 'xpubkey' ))
+    assert ( btc.pubkey, btc.xpubkey ) == ( groups[1][1].pubkey, groups[1][1].xpubkey )
+    assert btc.account( SEED_XMAS ).key == groups[1][1].key
+    with pytest.raises( AssertionError ):
+        btc.account( SEED_ONES )
+
+    # Records may be supplied to produce_pdf (via write_pdfs); paper wallets require full Accounts
+    from .layout		import write_pdfs
+    assert ( eth.name, btc.name ) == ( groups[1][0].name, groups[1][1].name ) == ( 'Ethereum', 'Bitcoin' )
+    details			= create( "records", master_secret=SEED_XMAS, cryptopaths=cryptopaths )
+    details			= details._replace( accounts=[ tuple( map( AccountRecord.from_account, group )) for group in details.accounts ] )
+    pdfs			= write_pdfs( names=dict( records=details ), filepath=str( tmp_path ), filename="{name}.pdf" )
+    assert list( pdfs ) == [ "records.pdf" ] and ( tmp_path / "records.pdf" ).exists()
+    with pytest.raises( ValueError, match="requires the full Account" ):
+        write_pdfs( names=dict( records=details ), filepath=str( tmp_path ), filename="{name}.pdf", wallet_pwd="password" )
+
+
+def test_address_index( tmp_path ):
+    """Scan for used addresses within the gap limit, and look up the paths of addresses."""
+    used			= [
+        account( SEED_XMAS, 'BTC', path ).address
+        for path in ( "m/84'/0'/0'/0/3", "m/84'/0'/0'/0/25", "m/84'/0'/0'/1/2", "m/84'/0'/1'/0/7", "m/84'/0'/3'/0/0" )
+    ]
+    index			= AddressIndex( SEED_XMAS, gap_limit=20 )
+    # .../0/25 is beyond the gap limit after .../0/3, and account 2' is unused, so 3' isn't scanned
+    assert [ path for _,_,path,_ in index.scan( 'BTC', used=used ) ] == [
+        "m/84'/0'/0'/0/3", "m/84'/0'/0'/1/2", "m/84'/0'/1'/0/7",
+    ]
+    assert len( index ) == (4+20) + (3+20) + (8+20) + 20 + 2*20
+    assert used[0] in index and used[1] not in index and used[4] not in index
+    assert [ path for _,_,path,_ in index.scan( 'BTC', used=used, accounts=[3] ) ] == [ "m/84'/0'/3'/0/0" ]
+
+    eth				= account( SEED_XMAS, 'ETH', "../5" ).address
+    ltc				= account( SEED_XMAS, 'LTC', "m/49'/2'/0'/1/4", 'segwit' ).address
+    filename			= str( tmp_path / 'index.json' )
+    index			= AddressIndex( SEED_XMAS, filename=filename )
+    assert index.lookup( [ eth.lower(), ltc, '1NotAnAddressOfOurs' ], cryptopaths=[ "ETH", "LTC:segwit" ] ) == {
+        eth.lower():		( 'ETH', 'legacy', "m/44'/60'/0'/0/5" ),
+        ltc:			( 'LTC', 'segwit', "m/49'/2'/0'/1/4" ),
+        '1NotAnAddressOfOurs':	None,
+    }
+    # The saved index answers without any further derivation
+    index			= AddressIndex( SEED_XMAS, filename=filename )
+    assert len( index ) and eth in index
+    with substitute( index, 'derive', None ):
+        assert index.lookup( [ eth ] ) == { eth: ( 'ETH', 'legacy', "m/44'/60'/0'/0/5" ) }
+    # ... but only for the same master secret
+    with pytest.raises( ValueError, match="saved for another master secret" ):
+        AddressIndex( SEED_ONES, filename=filename )
+
+    # An xpub... has no account level
+    xpubkey			= account( SEED_XMAS, 'BTC', "m/84'/0'/0'" ).xpubkey
+    assert [ path for _,_,path,_ in AddressIndex( xpubkey ).scan( 'BTC', used=used ) ] == [ "m/0/3", "m/1/2" ]
+
+    # ... and an xpub/ypub... scans its own format by default; a lookup skips formats it can't produce
+    for format in ( 'legacy', 'segwit' ):
+        xpubkey			= account( SEED_XMAS, 'BTC', "m/84'/0'/0'", format ).xpubkey
+        address			= account( SEED_XMAS, 'BTC', "m/84'/0'/0'/0/3", format ).address
+        assert xpubkey[:4] == { 'legacy': 'xpub', 'segwit': 'ypub' }[format]
+        assert AddressIndex( xpubkey ).scan( 'BTC', used=[ address ] ) == [ ( 'BTC', format, "m/0/3", address ) ]
+        assert AddressIndex( xpubkey, gap_limit=5 ).lookup( [ address ] ) == { address: ( 'BTC', format, "m/0/3" ) }
+
+
+def test_path_range():
+    paths			= "m/44'/60'/0-9'/0/0-99999"
+    pr				= PathRange( paths )
+    assert len( pr ) == pr.total == 1000000
+    assert pr[0] == "m/44'/60'/0'/0/0" and pr[-1] == "m/44'/60'/9'/0/99999"
+    assert pr[123456] == "m/44'/60'/1'/0/23456"
+    assert pr[100000] == "m/44'/60'/1'/0/0"  # The PathRange docstring example
+    with pytest.raises( IndexError ):
+        pr[1000000]
+
+    # Identical to the (iterated) path_sequence, and any slice is computed directly
+    paths			= "../1-3/2-4'/-2"
+    expected			= list( api.path_sequence( *api.path_parser( paths )))
+    pr				= PathRange( paths )
+    assert list( pr ) == expected and len( pr ) == 27
+    assert list( pr[5:20:3] ) == expected[5:20:3]
+    assert list( pr[5:20:3][1:-1] ) == expected[5:20:3][1:-1]
+    assert list( pr[::-2] ) == expected[::-2]
+
+    # Shards are disjoint and complete, interleaved or contiguous
+    for interleaved in ( True, False ):
+        shards			= [ list( pr.shard( k, 4, interleaved=interleaved )) for k in range( 4 ) ]
+        assert sorted( sum( shards, [] )) == sorted( expected )
+    assert list( pr.shard( 1, 4 )) == expected[1::4]
+    assert list( pr.selection( start=2, count=10, shard="1/3" )) == expected[2:12][1::3]
+
+    # Unbounded ranges have no len, but support slicing from any (positive) index
+    pr				= PathRange( "../-" )
+    with pytest.raises( TypeError ):
+        len( pr )
+    assert pr[1000000] == "../1000000"
+    assert list( pr[10:][::2][:3] ) == [ "../10", "../12", "../14" ]
+    assert list( pr.selection( start=5, count=8, shard=(2,4) )) == [ "../7", "../11" ]
+    assert list( pr.selection( start=5, count=8, shard=(2,4) ).indices() ) == [ 7, 11 ]
+    with pytest.raises( AssertionError ):
+        PathRange( "../-" ).shard( 0, 2, interleaved=False )
+    with pytest.raises( AssertionError ):
+        PathRange.of( "../-", allow_unbounded=False )
+    assert list( PathRange( None )) == [ None ]
+    assert list( PathRange( None ).selection( count=1 )) == [ None ]
+    with pytest.raises( ValueError, match="requires path ranges" ):
+        PathRange( None ).selection( start=5 )
+
+    # An unbounded selection (eg. slip39-generator --path "../-" --start 5 --shard 0/2) is a specified
+    # path, not replaced by the crypto's default path (an unbounded PathRange has no len())
+    cryptopaths			= [
+        (cry, PathRange( pth ).selection( start=5, shard="0/2" ), fmt)
+        for cry,pth,fmt in cryptopaths_parser( [ 'ETH' ], edit="../-" )
+    ]
+    assert all( pth for _,pth,_ in cryptopaths ) and PathRange( "../1-3" )[5:]
+    assert list( cryptopaths_parser( cryptopaths )) == cryptopaths
+    assert [
+        [ a.path for a in group ]
+        for group in itertools.islice( accountgroups( SEED_XMAS, cryptopaths=cryptopaths ), 3 )
+    ] == [ [ "m/44'/60'/0'/0/5" ], [ "m/44'/60'/0'/0/7" ], [ "m/44'/60'/0'/0/9" ] ]
+
+    # Accepted (eg. pickled to workers) wherever paths are, deriving only the selected Accounts
+    selected			= PathRange( "../-" ).selection( start=1000, count=6, shard="1/2" )
+    assert [ (c,p) for c,p,a in addresses( SEED_XMAS, 'ETH', pickle.loads( pickle.dumps( selected ))) ] == [
+        ('ETH', "m/44'/60'/0'/0/1001"), ('ETH', "m/44'/60'/0'/0/1003"), ('ETH', "m/44'/60'/0'/0/1005"),
+    ]
+    assert [ a for _,_,a in addresses( SEED_XMAS, 'ETH', selected, workers=2 ) ] \
+        == [ a for _,_,a in addresses( SEED_XMAS, 'ETH', "../1001-1005" ) ][::2]
+
+
+def test_format_context():
+    segwit			= FormatContext( btc='SegWit' )
+    assert dict( segwit ) == { 'BTC': 'segwit' } and segwit == FormatContext( [ ('Bitcoin', 'segwit') ] )
+    assert segwit == FormatContext.parse( [ "BTC:segwit" ] ) and hash( segwit ) == hash( FormatContext( BTC='segwit' ))
+    assert pickle.loads( pickle.dumps( segwit )) == segwit
+    with pytest.raises( AttributeError ):
+        segwit._formats		= {}
+    with pytest.raises( ValueError ):
+        FormatContext( ETH='bech32' )
+    both			= segwit.replace( LTC='legacy' )
+    assert dict( both ) == { 'BTC': 'segwit', 'LTC': 'legacy' } and dict( segwit ) == { 'BTC': 'segwit' }
+
+    # The context's format (and its default path) apply only to the calls it is supplied to
+    btc				= account( SEED_XMAS, 'BTC', context=segwit )
+    assert ( btc.format, btc.path ) == ( 'segwit', "m/49'/0'/0'/0/0" )
+    assert btc.address == account( SEED_XMAS, 'BTC', format='segwit' ).address
+    assert account( SEED_XMAS, 'BTC', format='legacy', context=segwit ).format == 'legacy'
+    assert account( SEED_XMAS, 'BTC' ).format == Account.address_format( 'BTC' ) == 'bech32'
+    assert segwit.path_default( 'BTC' ) == "m/49'/0'/0'/0/0" and segwit.address_format( 'ETH' ) == 'legacy'
+    assert list( cryptopaths_parser( [ "BTC", "ETH:../1" ], context=segwit )) == [
+        ('BTC', "m/49'/0'/0'/0/0", 'segwit'), ('ETH', "../1", None),
+    ]
+    assert [ a.format for a, in accountgroups( SEED_XMAS, [ "BTC:../0-1" ], context=segwit ) ] == [ 'segwit', 'segwit' ]
+
+    # Many threads may concurrently derive, each in its own context, and (safely) add new cryptos
+    expected			= {
+        fmt: [ a for _,_,a in addresses( SEED_XMAS, 'BTC', "../0-2", format=fmt ) ]
+        for fmt in Account.FORMATS
+    }
+
+    def derive( fmt ):
+        context			= FormatContext( BTC=fmt, QTUM=fmt )
+        return fmt, [ a for _,_,a in addresses( SEED_XMAS, 'BTC', "../0-2", context=context ) ]
+
+    with ThreadPoolExecutor( max_workers=6 ) as executor:
+        for fmt,derived in executor.map( derive, Account.FORMATS * 4 ):
+            assert derived == expected[fmt]
+    assert Account.supported( 'Qtum' ) == 'QTUM' and set( Account.CRYPTO_FORMAT_PATH['QTUM'] ) == set( Account.FORMATS )
+    assert account( SEED_XMAS, 'Qtum', context=FormatContext( QTUM='segwit' )).path == "m/49'/2301'/0'/0/0"
+
+
+def test_crypto_profile():
+    profile			= Account.profile( 'Bitcoin', 'SegWit' )
+    assert isinstance( profile, CryptoProfile ) and profile is Account.profile( 'BTC', 'segwit' )
+    assert ( profile.crypto, profile.format, profile.path ) == ( 'BTC', 'segwit', "m/49'/0'/0'/0/0" )
+    assert Account.profile( 'BTC', context=FormatContext( BTC='segwit' )) is profile
+    with pytest.raises( KeyError ):
+        Account.profile( 'ETH', 'bech32' )
+
+    # Accounts clone a pristine HDWallet template; deriving them never alters it, or each other
+    accts			= [ Account( 'BTC', 'segwit' ).from_seed( SEED_XMAS, f"m/49'/0'/0'/0/{i}" ) for i in range( 3 ) ]
+    template			= Account.TEMPLATES['BTC','segwit',Account.ecc()]
+    assert all( acct.hdwallet is not template and acct.hdwallet._hd is not template._hd for acct in accts )
+    assert template._hd._derivation.path() == "m/49'/0'/0'/0/0" and template._hd._private_key is None
+    # An Account w/ any other HDWallet arguments is constructed from its profile, as before
+    fresh			= Account( 'BTC', 'segwit', language='english' )
+    assert fresh.hdwallet not in Account.TEMPLATES.values()
+    assert [ acct.address for acct in accts ] == [
+        fresh.from_seed( SEED_XMAS, f"m/49'/0'/0'/0/{i}" ).address for i in range( 3 )
+    ] == [ a for _,_,a in addresses( SEED_XMAS, 'BTC', "m/49'/0'/0'/0/0-2", format='segwit' ) ]
+
+    # Passphrases are per-Account, not shared via the template
+    zoo,zoo_pass		= (
+        Account( 'ETH', passphrase=pp ).from_mnemonic( BIP39_ZOO, using_bip39=True ) for pp in ( None, 'password' )
+    )
+    assert zoo.address != zoo_pass.address
+    assert zoo.address == Account( 'ETH' ).from_mnemonic( BIP39_ZOO, using_bip39=True ).address
+
+
+def test_address_cache( tmp_path ):
+    directory			= str( tmp_path / 'addresses' )
+    expected			= list( addresses( SEED_XMAS, 'BTC', "../0-9" ))
+    cache			= AddressCache( directory )
+    assert list( addresses( SEED_XMAS, 'BTC', "../0-9", address_cache=cache )) == expected
+    assert ( cache.hits, cache.misses ) == ( 0, 10 )
+    assert list( addresses( SEED_XMAS, 'BTC', "../5-14", address_cache=cache )) == list( addresses( SEED_XMAS, 'BTC', "../5-14" ))
+    assert ( cache.hits, cache.misses ) == ( 5, 15 )
+    cache.close()
+
+    # Only public data is stored, in fixed-size records
+    filename,			= ( tmp_path / 'addresses' ).iterdir()
+    data			= filename.read_bytes()
+    assert len( data ) == 8 + 15 * 192
+    acct			= account( SEED_XMAS, 'BTC', "../3" )
+    assert SEED_XMAS not in data and SEED_XMAS.hex().encode() not in data
+    assert bytes.fromhex( acct.prvkey ) not in data and bytes.fromhex( acct.pubkey ) in data
+
+    # Re-loaded and verified, the cached records are used; an interrupted append is discarded
+    with open( filename, 'ab' ) as f:
+        f.write( b'partial' )
+    cache			= AddressCache( directory )
+    records			= list( accounts( SEED_XMAS, 'BTC', "../0-14", records=( 'pubkey', ), address_cache=cache ))
+    assert ( cache.hits, cache.misses ) == ( 15, 0 )
+    assert records[3] == AccountRecord.from_account( acct, keys=( 'pubkey', ))
+    cache.close()
+
+    # A cache failing verification is discarded, and re-derived
+    with open( filename, 'r+b' ) as f:
+        f.seek( 8 + 3 * 192 + 64 + 33 )
+        f.write( b'bc1qbogus' )
+    cache			= AddressCache( directory, verify=15 )
+    assert list( addresses( SEED_XMAS, 'BTC', "../0-9", address_cache=cache )) == expected
+    assert ( cache.hits, cache.misses ) == ( 0, 10 )
+    cache.close()
+
+    # Caches are distinct for each master secret, crypto and format; an xpub... key's are relative to it
+    cache			= AddressCache( directory )
+    xpubkey			= account( SEED_XMAS, 'BTC', "m/84'/0'/0'" ).xpubkey
+    assert [ a for _,_,a in addresses( xpubkey, 'BTC', "m/0/0-9", address_cache=cache ) ] == [ a for _,_,a in expected ]
+    assert list( addresses( SEED_ONES, 'BTC', "../0-1", address_cache=cache )) == list( addresses( SEED_ONES, 'BTC', "../0-1" ))
+    assert len( list(( tmp_path / 'addresses' ).iterdir() )) == 3
+    cache.close()
+
+    # Missing records may be derived by workers; they're cached (in order), as if derived here
+    cache			= AddressCache( str( tmp_path / 'parallel' ))
+    assert list( addresses( SEED_XMAS, 'BTC', "../5-9", address_cache=cache )) == expected[5:]
+    records			= list( cache.records( MasterSecret( SEED_XMAS ), 'BTC', "../0-14", workers=2, chunksize=3 ))
+    assert records == list( accounts( SEED_XMAS, 'BTC', "../0-14", records=( 'pubkey', )))
+    assert ( cache.hits, cache.misses ) == ( 5, 5 + 10 )
+    assert list( addresses( SEED_XMAS, 'BTC', "../0-14", address_cache=cache, workers=2 )) == list( addresses( SEED_XMAS, 'BTC', "../0-14" ))
+    assert ( cache.hits, cache.misses ) == ( 5 + 15, 5 + 10 )
+    cache.close()
+
+
+def test_address_cache_file_duplicates( tmp_path ):
+    # Two handles may both append the same path; later appends are still numbered correctly
+    filename			= str( tmp_path / 'duplicates.adr' )
+    records			= {
+        path: ( acct.pubkey, acct.address )
+        for path in ( "m/0", "m/1", "m/2", "m/3" )
+        for acct in [ account( SEED_XMAS, 'BTC', path ) ]
+    }
+    one,two			= api.AddressCacheFile( filename ),api.AddressCacheFile( filename )
+    assert one.append( "m/0", *records["m/0"] ) and two.append( "m/0", *records["m/0"] )
+    assert one.append( "m/1", *records["m/1"] )
+    one.close()
+    two.close()
+    cached			= api.AddressCacheFile( filename )
+    assert len( cached ) == 2 and cached.mapped == 3
+    assert cached.append( "m/2", *records["m/2"] ) and cached.append( "m/3", *records["m/3"] )
+    assert { path: cached.get( path ) for path in records } == records
+    cached.close()
+    cached			= api.AddressCacheFile( filename )
+    assert { path: cached.get( path ) for path in records } == records
+    cached.close()
+
+
+def test_account_columns( tmp_path ):
+    filename			= str( tmp_path / 'accounts.npy' )
+    groups			= list( enumerate( accountgroups( SEED_XMAS, [ "ETH:../0-9", "BTC:../0-9" ], records=True )))
+    with AccountColumns( filename, chunksize=3 ) as columns:
+        assert columns.extend( groups ) == 10
+        assert len( columns ) == 20 and columns.writer.count == 18  # 2 rows not yet written
+    assert AccountColumns.path_indices( "m/84'/0'/0'/1/3" ) == [ 0x80000054, 0x80000000, 0x80000000, 1, 3 ]
+    with pytest.raises( ValueError ):
+        AccountColumns.path_indices( "m" + "/0" * 11 )
+
+    # An export interrupted by an exception leaves no (apparently complete) file behind
+    interrupted			= str( tmp_path / 'interrupted.npy' )
+    with pytest.raises( ValueError ):
+        with AccountColumns( interrupted, chunksize=3 ) as columns:
+            columns.extend( groups )
+            columns.append( 10, AccountRecord( 'BTC', 'bech32', "m" + "/0" * 11, groups[0][1][1].address ))
+    assert not os.path.exists( interrupted )
+
+    # The .npy header is rewritten w/ the final count, and the records follow it at a 64-byte boundary
+    with open( filename, 'rb' ) as f:
+        data			= f.read()
+    header_len			= 10 + int.from_bytes( data[8:10], 'little' )
+    assert header_len % 64 == 0 and "'shape': (20,)" in data[:header_len].decode( 'latin1' )
+    assert len( data ) == header_len + 20 * AccountColumns.RECORD.size
+    index,crypto,format,depth,*path,address = AccountColumns.RECORD.unpack_from( data, header_len + 3 * AccountColumns.RECORD.size )
+    btc				= groups[1][1][1]
+    assert ( index, crypto, format, depth, address.rstrip( b'\0' )) == ( 1, b'BTC\0\0\0\0\0', b'bech32\0\0', 5, btc.address.encode() )
+    assert path[:depth] == AccountColumns.path_indices( btc.path )
+
+    if numpy:
+        accts			= numpy.load( filename, mmap_mode='r' )
+        assert accts.shape == ( 20, ) and list( accts['index'][::2] ) == list( range( 10 ))
+        assert [ a.decode() for a in accts['address'][accts['crypto'] == b'BTC'] ] == [ b.address for _,(_,b) in groups ]
+        assert list( accts['path'][1::2,4] ) == list( range( 10 ))
@@ -22,7 +22,7 @@ import json
 import logging
 import string
 
-from ..			import addresses as slip39_addresses
+from ..			import addresses as slip39_addresses, accounts as slip39_accounts, PathRange, AccountColumns
 from ..util		import commas, log_cfg, log_level, input_secure
 from ..defaults		import BITS
 
@@ -61,7 +61,12 @@ cli.json			= False
 @click.option( "--secret", required=True, help="A hex seed or '{x,y,z}{pub,prv}...' x-public/private key to derive HD wallet addresses from; '-' reads it from stdin" )
 @click.option( "--format", help="legacy, segwit, bech32 (default: standard for cryptocurrency or '{x,y,z}{pub/prv}...' key)" )
 @click.option( '--unbounded/--no-unbounded', default=False, help="Allow unbounded sequences of addresses")
-def addresses( crypto, paths, secret, format, unbounded ):
+@click.option( "--workers", type=int, help="Derive the addresses in parallel, using this many worker processes" )
+@click.option( "--start", type=int, default=0, help="Begin at this address in the path ranges (default: 0)" )
+@click.option( "--count", type=int, help="Generate this many addresses (default: all); allows unbounded path ranges" )
+@click.option( "--shard", help="Generate only shard k/n (0 <= k < n) of the addresses, eg. 0/4 is every 4th address from --start" )
+@click.option( "--npy", help="Export the addresses to this columnar NumPy .npy file (memory-mappable), instead of output" )
+def addresses( crypto, paths, secret, format, unbounded, workers, start, count, shard, npy ):
     if secret == '-':
         secret			= input_secure( 'Master secret hex: ', secret=True )
     elif secret and ( secret.lower().startswith( '0x' )
@@ -71,6 +76,29 @@ def addresses( crypto, paths, secret, format, unbounded ):
         secret			= secret[2:]
     if not secret:
         log.error( f"Provide a random {commas( BITS, final='or' )}-bit Seed via --secret" )
+    if ( start or shard ) and not paths:
+        raise click.UsageError( "--start and --shard require --paths ranges, eg. \"../0-\" (with --count or --unbounded)" )
+    if start or count is not None or shard:
+        paths			= PathRange(
+            paths, allow_unbounded=unbounded or count is not None
+        ).selection( start=start, count=count, shard=shard )
+    if npy:
+        # Each row's index is that of its path, in all the path ranges
+        with AccountColumns( npy ) as columns:
+            columns.extend(
+                (index, [ record ])
+                for index,record in zip( PathRange.of( paths, allow_unbounded=unbounded ).indices(), slip39_accounts(
+                    master_secret	= secret,
+                    crypto		= crypto,
+                    paths		= paths,
+                    format		= format,
+                    allow_unbounded	= unbounded,
+                    workers		= workers,
+                    records		= True,
+                ))
+            )
+        log.info( f"Exported {len( columns )} addresses to {npy}" )
+        return
     if cli.json:
         click.echo( "[" )
     for i,(cry,pth,adr) in enumerate( slip39_addresses(
@@ -78,7 +106,8 @@ def addresses( crypto, paths, secret, format, unbounded ):
             crypto		= crypto,
             paths		= paths,
             format		= format,
-            allow_unbounded	= unbounded
+            allow_unbounded	= unbounded,
+            workers		= workers,
     )):
         if cli.json:
             if i:
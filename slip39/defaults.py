@@ -135,6 +135,40 @@ FILENAME_FORMAT			= "{name}-{date}+{time}-{crypto}-{address}.pdf"
 # Default Crypto accounts (and optional paths) to generate
 CRYPTO_PATHS			= ('ETH', 'BTC')
 
+# Derived HD wallet nodes retained for reuse by sequential/sibling derivation paths, eg. the
+# m/44'/60'/0'/0 parent of m/44'/60'/0'/0/0..N
+DERIVATION_CACHE_SIZE		= 1000
+
+# Scanning for used addresses stops after this many consecutive unused addresses (BIP-44 "gap limit")
+GAP_LIMIT			= 20
+
+# Columnar (.npy) exports of derived accounts are written in chunks of this many rows
+COLUMNS_CHUNKSIZE		= 10000
+
+# An AddressCache re-derives (and checks) this many randomly sampled cached addresses, when loaded
+ADDRESS_CACHE_VERIFY		= 8
+
+# A master secret just SLIP-39 encrypted (eg. by create, for a BIP-39 PDF cover page) may be
+# remembered in-process for up to this many seconds, so recovering the same Mnemonics once more
+# needn't repeat the PBKDF2 (0 disables)
+SECRET_CACHE_TTL		= 60
+
+# Recovering from noisy SLIP-39 Mnemonics tries this many random subsets of each group's Shares,
+# before trying all subsets in order
+RECOVERY_SAMPLES		= 1000
+
+# A damaged SLIP-39 Mnemonic (eg. w/ illegible '?' words) is only repaired, if it has no more than
+# this many valid completions
+RECOVERY_REPAIRS		= 100
+
+# The SLIP-39 iteration_exponent recommended by iteration_exponent_benchmark is the largest whose
+# PBKDF2 decryption (the cost of each recovery attempt) takes no longer than this many seconds
+ITERATION_SECONDS		= 2.0
+
+# A SeedEntropyStretcher remembers its SHA-512 chain state every this many rounds, so that stepping
+# back to (or jumping to) any earlier Seed requires at most this many rounds
+STRETCH_CHECKPOINT		= 64
+
 __d				= "55"
 __m				= "88"
 __o				= "BB"
@@ -31,7 +31,7 @@ try:
 except ImportError:
     pass
 
-from ..			import Account
+from ..			import Account, AccountRecord
 
 __author__                      = "Perry Kundert"
 __email__                       = "perry@dominionrnd.com"
@@ -233,8 +233,9 @@ def accountgroups_output(
 ):
     """Emit accountgroup records to the provided file, or sys.stdout.
 
-    For each record, we will support either a sequence of Accounts (produced by accountgroups()), or
-    a sequence of tuples of (<crypto>, <path>, <address>), (ie. recovered via accountgroups_input.
+    For each record, we will support either a sequence of Accounts or AccountRecords (produced by
+    accountgroups()), or a sequence of tuples of (<crypto>, <path>, <address>), (ie. recovered via
+    accountgroups_input.
 
     Supports binary file-like objects (eg pyserial.Serial) w/ the encoding parameter.  Outputs one line,
     blocking forever -- the counterparty can (and likely will) block for an indeterminate amount of time,
@@ -266,7 +267,7 @@ def accountgroups_output(
 
     # Emit the (optionally encrypted and indexed) accountgroup record.
     payload			= json.dumps([
-        (acct.crypto, acct.path, (acct.xpubkey if xpub else acct.address )) if isinstance( acct, Account ) else acct
+        (acct.crypto, acct.path, (acct.xpubkey if xpub else acct.address )) if isinstance( acct, (Account, AccountRecord) ) else acct
         for acct in group
     ])
     if cipher:
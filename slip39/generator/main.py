@@ -18,6 +18,7 @@
 from __future__         import annotations
 
 import argparse
+import itertools
 import logging
 import time
 
@@ -28,8 +29,8 @@ from serial		import Serial
 from .			import chacha20poly1305, accountgroups_output, accountgroups_input
 from ..util		import log_cfg, log_level, input_secure
 from ..defaults		import BAUDRATE, CRYPTO_PATHS
-from ..			import Account, cryptopaths_parser
-from ..api		import accountgroups, random_secret
+from ..			import Account, FormatContext, cryptopaths_parser
+from ..api		import accountgroups, random_secret, PathRange, AccountColumns
 
 __author__                      = "Perry Kundert"
 __email__                       = "perry@dominionrnd.com"
@@ -118,6 +119,21 @@ satisfactory.  This first nonce record is transmitted with an enumeration prefix
     ap.add_argument( '--path',
                      default=None,
                      help="Modify all derivation paths by replacing the final segment(s) w/ the supplied range(s), eg. '.../1/-' means .../1/[0,...)")
+    ap.add_argument( '--workers', type=int,
+                     default=None,
+                     help="Derive the address groups in parallel, using this many worker processes" )
+    ap.add_argument( '--start', type=int,
+                     default=0,
+                     help="Begin at this address group (default: 0); each path is computed directly, without deriving the prior groups" )
+    ap.add_argument( '--count', type=int,
+                     default=None,
+                     help="Generate this many address groups (default: all)" )
+    ap.add_argument( '--shard',
+                     default=None,
+                     help="Generate only shard k/n (0 <= k < n) of the address groups, eg. 0/4 is every 4th group from --start; enumerations are unchanged" )
+    ap.add_argument( '--npy',
+                     default=None,
+                     help="Export the address groups to this columnar NumPy .npy file (memory-mappable), instead of emitting records; use w/ --count if paths are unbounded" )
     ap.add_argument( '-d', '--device', type=str,
                      default=None,
                      help="Use this serial device to transmit (or --receive) records" )
@@ -164,10 +180,11 @@ satisfactory.  This first nonce record is transmitted with an enumeration prefix
     # --cryptocurrency, add it; specifying a format implies interest in that cryptocurrency.
     if not args.cryptocurrency:
         args.cryptocurrency	= list( CRYPTO_PATHS )  # the defaults, if none provided
+    context			= None
     for cf in args.format:
         try:
             crypto,format	= cf.split( ':' )
-            Account.address_format( crypto, format=format )  # Changes the default for crypto
+            context		= ( context or FormatContext() ).replace( { crypto: format } )
             if not any( k.startswith( crypto ) for k in args.cryptocurrency ):
                 args.cryptocurrency.append( crypto )
         except Exception as exc:
@@ -294,8 +311,31 @@ satisfactory.  This first nonce record is transmitted with an enumeration prefix
         args.cryptocurrency,
         edit			= args.path,
         hardened_defaults	= args.xpub,
+        context			= context,
     ))
 
+    # If only a --start, --count and/or --shard of the address groups are desired, select them from
+    # each crypto's paths.  Each group retains its enumeration (its index in the full sequence of groups).
+    indices			= itertools.count()
+    if args.start or args.count is not None or args.shard:
+        cryptopaths		= [
+            (cry, PathRange( pth ).selection( start=args.start, count=args.count, shard=args.shard ), fmt)
+            for cry,pth,fmt in cryptopaths
+        ]
+        indices			= cryptopaths[0][1].indices()
+
+    # Export mode; stream the (enumerated) groups into columnar .npy file, in chunks.
+    if args.npy:
+        with AccountColumns( args.npy ) as columns:
+            groups		= columns.extend( zip( indices, accountgroups(
+                master_secret	= master_secret,
+                cryptopaths	= cryptopaths,
+                workers		= args.workers,
+                records		= True,
+            )))
+        log.info( f"Exported {len( columns )} accounts in {groups} groups to {args.npy}" )
+        return 0
+
     #
     # Set up serial device, if desired.  We will attempt to send each record using hardware flow
     # control (software XON/XOFF flow control is also possible, but requires a 2-way serial data
@@ -374,9 +414,11 @@ satisfactory.  This first nonce record is transmitted with an enumeration prefix
     nonce_emit			= True
     nonce			= random_secret( 12 )
 
-    for index,group in enumerate( accountgroups(
+    for index,group in zip( indices, accountgroups(
         master_secret	= master_secret,
         cryptopaths	= cryptopaths,
+        workers		= args.workers,
+        records		= ( 'xpubkey', ) if args.xpub else True,
     )):
         if file is None and file_opener:
             file		= file_opener()
@@ -30,8 +30,11 @@ from itertools		import islice
 
 import FreeSimpleGUI as sg
 
-from ..api		import Account, create, group_parser, random_secret, cryptopaths_parser, paper_wallet_available, stretch_seed_entropy
-from ..recovery		import recover, recover_bip39, produce_bip39, scan_entropy, display_entropy
+from ..api		import (
+    Account, create, group_parser, random_secret, cryptopaths_parser, paper_wallet_available, stretch_seed_entropy,
+    SeedEntropyStretcher,
+)
+from ..recovery		import recover, recover_bip39, produce_bip39, scan_entropy, display_entropy, ShareAccumulator, MnemonicError
 from ..util		import log_level, log_cfg, ordinal, commas, chunker, hue_shift, rate_dB, entropy_rating_dB, timing, avg, user_name_full
 from ..layout		import write_pdfs, printers_available
 from ..defaults		import (
@@ -659,10 +662,15 @@ def update_seed_data( event, window, values ):
         window['-SD-PASS-F-'].update( visible=values['-SD-PASS-C-'] )
         try:
             passphrase		= pswd.strip().encode( 'UTF-8' )
-            seed		= recover(
-                mnemonics	= list( mnemonic_continuation( data.strip().split( '\n' ))),
+            # Only newly entered mnemonics are parsed; the secret is decrypted once enough are present
+            accumulator		= update_seed_data.accumulator.update(
+                list( mnemonic_continuation( data.strip().split( '\n' )))
+            )
+            seed		= accumulator.recover(
                 passphrase	= passphrase,
             )
+            if seed is None:
+                raise MnemonicError( str( accumulator ))
             bits		= len( seed ) * 8
         except Exception as exc:
             log.warning( f"SLIP-39 recovery failed w/ {data!r}: {exc}" )
@@ -741,6 +749,7 @@ update_seed_data.was		= {
 }
 update_seed_data.deficiencies	= ()
 update_seed_data.analysis	= ''
+update_seed_data.accumulator	= ShareAccumulator()
 
 
 def update_seed_entropy( event, window, values ):
@@ -897,6 +906,9 @@ def compute_master_secret( window, values, n=0 ):
 
     This function must have knowledge of the extra Seed Entropy settings, so it inspects the
     -SE-{NON/HEX}- checkbox values.
+
+    The n'th Seed Entropy is produced by a SeedEntropyStretcher, retained until the Seed Entropy (or
+    Seed size) changes; each successive Seed requires just one more round of SHA-512 stretching.
     """
     seed_data_hex		= values.get( '-SD-SEED-', window['-SD-SEED-'].get() )
     bits			= len( seed_data_hex ) * 4
@@ -912,10 +924,16 @@ def compute_master_secret( window, values, n=0 ):
         master_secret		= seed_data
     else:
         encoding 		= 'hex_codec' if values['-SE-HEX-'] else 'UTF-8'
-        seed_entr		= stretch_seed_entropy( values['-SE-DATA-'], n=n, bits=bits, encoding=encoding )
+        stretcher		= compute_master_secret.stretcher
+        if not stretcher or stretcher.key() != ( values['-SE-DATA-'], bits, encoding ):
+            stretcher		= compute_master_secret.stretcher = SeedEntropyStretcher(
+                values['-SE-DATA-'], bits=bits, encoding=encoding )
+        seed_entr		= stretcher( n )
         master_secret		= bytes( d ^ e for d,e in zip( seed_data, seed_entr ) )
     return master_secret
 
+compute_master_secret.stretcher	= None  # noqa: E305
+
 
 def update_seed_recovered( window, values, details, passphrase=None ):
     """Display the SLIP39 Mnemonics.  Each mnemonic word is maximum 8 characters in length, separated
@@ -32,7 +32,7 @@ import tabulate
 
 from crypto_licensing.misc import get_localzone, Duration
 
-from ..api		import Account
+from ..api		import Account, AccountRecord
 from ..util		import commas, is_listlike, is_mapping
 from ..defaults		import (
     INVOICE_CURRENCY, INVOICE_ROWS, INVOICE_STRFTIME, INVOICE_DUE, INVOICE_DESCRIPTION_MAX,
@@ -326,7 +326,7 @@ class Invoice:
     """
     def __init__(
         self, lines,
-        accounts: Sequence[Account],		 # [ <Account>, ... ]   .crypto is symbol, eg. BTC, ETH, XRP
+        accounts: Sequence[Union[Account,AccountRecord]],  # [ <Account>, ... ]   .crypto is symbol, eg. BTC, ETH, XRP
         currencies: Optional[List]	= None,	 # "USD" | [ "USD", "BTC" ] (first-most currencies/accounts is conversion "reference" currency)
         conversions: Optional[Dict]	= None,  # { ("USD","ETH"): 1234.56, ("USD","BTC"): 23456.78, ...}
         w3_url			= None,
@@ -12,7 +12,7 @@ import tabulate
 from crypto_licensing.misc import parse_datetime
 
 from ..util		import ordinal, commas
-from ..api		import account, accounts
+from ..api		import account, accounts, AccountRecord
 from .artifact		import (
     LineItem, Invoice, InvoiceMetadata, conversions_remaining, conversions_table, Contact,
     produce_invoice, write_invoices,
@@ -321,6 +321,23 @@ def test_tabulate( tmp_path ):
  ETH: 0xfc2077CA7F403cBECA41B1B0F62D91B5EA631B5E |     0 |     0 | WETH | Wrapped Ether
  XRP: rUPzi4ZwoYxi7peKCqUkzqEuSrzSRyLguV         |     0 |     0 | XRP  | Ripple"""  # noqa: E501
 
+    # The same tables are produced from AccountRecords
+    assert worthless == '\n\n====\n\n'.join(
+        f"{table}\n\n{sub}\n\n{tot}"
+        for _,table,sub,tot in Invoice(
+            [
+                line
+                for line,_ in line_amounts
+                if line.currency in ("ZEENUS", )
+            ],
+            currencies	= ["HOT", "ETH", "BTC", "USD"],
+            accounts	= list( map( AccountRecord.from_account, accounts )),
+            conversions	= dict( conversions ),
+        ).tables(
+            tablefmt	= 'presto',
+        )
+    )
+
     # No conversions of non-0 values; default Invoice currency is USD.  Longest digits should be 2
     # Instead of querying BTC, ETH prices, provide a conversion (so our invoice pricing is static)
     conversions_fixed		= dict( conversions ) | {
@@ -28,14 +28,14 @@ from datetime		import datetime
 from collections	import namedtuple
 from collections.abc	import Callable
 from pathlib		import Path
-from typing		import Dict, List, Tuple, Optional, Sequence, Any
+from typing		import Dict, List, Tuple, Optional, Sequence, Any, Union
 
 import qrcode
 import qrcode.image.svg
 import fpdf		# FPDF, FlexTemplate, FPDF_FONT_DIR
 import fpdf.svg
 
-from ..api		import Account, cryptopaths_parser, create, enumerate_mnemonic, group_parser
+from ..api		import Account, AccountRecord, cryptopaths_parser, create, create_parallel, enumerate_mnemonic, group_parser
 from ..util		import chunker
 from ..recovery		import recover, produce_bip39
 from ..defaults		import (
@@ -185,7 +185,7 @@ def produce_pdf(
     name: str,
     group_threshold: int,			# SLIP-39 Group Threshold required
     groups: Dict[str,Tuple[int,List[str]]],     # SLIP-39 Groups {<name>: (<need>,[<mnemonic>,...])
-    accounts: Sequence[Sequence[Account]],      # The crypto account(s); at least 1 of each required
+    accounts: Sequence[Sequence[Union[Account,AccountRecord]]],  # The crypto account(s); at least 1 of each required
     using_bip39: bool,				# Using BIP-39 wallets Seed generation
     anonymous: Optional[bool]	= None,		# Avoid printing crypto addresses, QR codes
     card_format: str		= CARD,		# 'index' or '(<h>,<w>),<margin>'
@@ -412,6 +412,7 @@ def write_pdfs(
     group_threshold	= None,		# int, or 1/2 of groups by default
     cryptocurrency	= None,		# sequence of [ 'ETH:<path>', ... ] to produce accounts for
     edit		= None,		# Adjust crypto paths according to the provided path edit
+    context		= None,		# A FormatContext selecting any non-default crypto address formats
     anonymous		= None,		# Produce cryptocurrency addresses and QR codes
     card_format		= None,		# Eg. "credit"; False outputs no SLIP-39 Mnemonic cards to PDF
     paper_format	= None,		# Eg. "Letter", "Legal", (x,y)
@@ -429,6 +430,8 @@ def write_pdfs(
     double_sided	= None,
     extendable		= None,		# Default: True
     identifier		= None,		# Default: random identifier
+    iteration_exponent	= None,		# SLIP-39 KDF runs 10,000 << e PBKDF2 iterations (default: 1)
+    workers		= None,		# Create many names' details in parallel, using this many processes
 ):
     """Writes a PDF containing a unique SLIP-39 encoded Seed Entropy for each of the names specified.
 
@@ -445,6 +448,12 @@ def write_pdfs(
     recommended).  Use the SLIP-39 "Recover" Controls, instead, to recover the BIP-39 Mnemonic
     phrase when needed to restore a hardware wallet.
 
+    The 'iteration_exponent' sets the cost of the SLIP-39 passphrase KDF (paid once by each create,
+    and again by each recovery); see api.iteration_exponent_benchmark to calibrate it.
+
+    If 'workers', the details for multiple 'names' are created by a pool of worker processes (each
+    using new OS randomness); they are still written in the order of the 'names' supplied.
+
     Returns a { "<filename>": <details>, ... } dictionary of all PDF files written, and each of
     their account details.
 
@@ -462,7 +471,7 @@ def write_pdfs(
 
     group_threshold		= int( group_threshold ) if group_threshold else math.ceil( len( groups ) * GROUP_THRESHOLD_RATIO )
 
-    cryptopaths			= list( cryptopaths_parser( cryptocurrency, edit=edit ))
+    cryptopaths			= list( cryptopaths_parser( cryptocurrency, edit=edit, context=context ))
 
     # If account details not provided in names, generate them.  If using_bip39 is specified, this is
     # where we use BIP-39 Seed generation to produce the wallet Seed, instead of SLIP-39 which uses
@@ -471,22 +480,28 @@ def write_pdfs(
     if not isinstance( names, dict ):
         assert not master_secret or not names or len( names ) == 1, \
             "Creating multiple account details from the same secret entropy doesn't make sense"
-        names			= {
-            name: create(
-                name		= name,
-                group_threshold	= group_threshold,
-                groups		= groups,
-                master_secret	= master_secret,
-                passphrase	= passphrase.encode( 'UTF-8' ) if passphrase else b'',
-                using_bip39	= using_bip39,  # Derive wallet Seed using BIP-39 Mnemonic + passphrase generation
-                cryptopaths	= cryptopaths,
-                extendable	= extendable,
-                identifier	= identifier,
-            )
-            for name in names or [ "" ]
-        }
+        create_kwds		= dict(
+            group_threshold	= group_threshold,
+            groups		= groups,
+            passphrase		= passphrase.encode( 'UTF-8' ) if passphrase else b'',
+            using_bip39		= using_bip39,  # Derive wallet Seed using BIP-39 Mnemonic + passphrase generation
+            cryptopaths		= cryptopaths,
+            extendable		= extendable,
+            identifier		= identifier,
+            iteration_exponent	= 1 if iteration_exponent is None else int( iteration_exponent ),
+            # Only a BIP-39 cover page recovers the Mnemonics just created
+            remember		= bool( using_bip39 and cover_page and ( card_format is not False or wallet_pwd not in (None, False) )),
+        )
+        if workers and not master_secret and names and len( names ) > 1:
+            # Many names, each w/ a new random secret; create them in parallel (in order)
+            names		= dict( zip( names, create_parallel( names, workers=workers, **create_kwds )))
+        else:
+            names		= {
+                name: create( name=name, master_secret=master_secret, **create_kwds )
+                for name in names or [ "" ]
+            }
 
-    if text and using_bip39:
+    if text and using_bip39 and master_secret:
         # Output the BIP-39 Mnemonic phrase we're using to generate the Seed as text.  We'll label
         # it as BIP-39, but it will just be ignored by standard SLIP-39 recovery attempts.
         print( f"Using BIP-39 Mnemonic: {produce_bip39( entropy=master_secret )}" )
@@ -590,6 +605,8 @@ def write_pdfs(
                         if double_sided is None or double_sided:
                             pdf.add_page( orientation='P', format=wallet_paper )
                         page_n	= p
+                    if not isinstance( account, Account ):
+                        raise ValueError( f"A paper wallet requires the full Account, not {account!r}; see AccountRecord.account" )
                     try:
                         private_enc		= account.encrypted( wallet_pwd )
                     except NotImplementedError as exc:
@@ -19,12 +19,13 @@ from __future__		import annotations
 
 import argparse
 import codecs
+import json
 import logging
 
 import tabulate
 
-from .			import Account
-from .api		import random_secret, stretch_seed_entropy
+from .			import Account, FormatContext
+from .api		import random_secret, stretch_seed_entropy, iteration_exponent_benchmark
 from .util		import log_cfg, log_level, input_secure
 from .layout		import write_pdfs
 from .defaults		import (   # noqa: F401
@@ -33,6 +34,7 @@ from .defaults		import (   # noqa: F401
     FILENAME_FORMAT,
     FILENAME_KEYWORDS,
     CRYPTO_PATHS,
+    ITERATION_SECONDS,
 )
 
 __author__                      = "Perry Kundert"
@@ -143,6 +145,18 @@ def main( argv=None ):
                      help="Disable double-sided PDF" )
     ap.add_argument( '--single-sided', dest="double_sided", action='store_false',
                      help="Enable single-sided PDF" )
+    ap.add_argument( '--workers', type=int,
+                     default=None,
+                     help="Create the SLIP-39 details for multiple names in parallel, using this many worker processes" )
+    ap.add_argument( '--iteration-exponent',
+                     default=None,
+                     help="SLIP-39 passphrase KDF cost; 10,000 << <exponent> PBKDF2 iterations to create and to recover, or 'auto' to calibrate (default: 1)" )
+    ap.add_argument( '--iteration-seconds', type=float,
+                     default=ITERATION_SECONDS,
+                     help=f"Calibrate --iteration-exponent auto to the largest exponent recovering in this many seconds on this machine (default: {ITERATION_SECONDS})" )
+    ap.add_argument( '--iteration-benchmark', action='store_true',
+                     default=False,
+                     help="Output JSON measurements of the SLIP-39 KDF cost of each --iteration-exponent, and the projected times to write PDFs for the names w/ --workers, and exit" )
     ap.add_argument( 'names', nargs="*",
                      help="Account names to produce; if --secret Entropy is supplied, only one is allowed.")
     args			= ap.parse_args( argv )
@@ -161,15 +175,34 @@ def main( argv=None ):
             "A --path must start with 'm/', or '../', indicating intent to replace 1 or more trailing components of each cryptocurrency's derivation path"
 
     # If any --format <crypto>:<format> address formats provided
+    context			= None
     for cf in args.format:
         try:
-            Account.address_format( *cf.split( ':' ) )
+            context		= ( context or FormatContext() ).replace( dict( [ cf.split( ':' ) ] ))
         except Exception as exc:
             log.error( f"Invalid address format: {cf}: {exc}" )
             raise
 
     bits_desired		= int( args.bits ) if args.bits else BITS_DEFAULT
 
+    # Calibrate the SLIP-39 KDF cost on this machine, if required.  The recommended exponent is the
+    # largest that recovers within --iteration-seconds; the projected batch times are for runs of
+    # the supplied names (and larger multiples), created by --workers.
+    iteration_exponent		= args.iteration_exponent
+    if args.iteration_benchmark or iteration_exponent == 'auto':
+        report			= iteration_exponent_benchmark(
+            target	= args.iteration_seconds,
+            names	= sorted( { len( args.names ) or 1, 10, 100, 1000 } ),
+            workers	= args.workers,
+            strength	= bits_desired,
+            using_bip39	= args.using_bip39,
+        )
+        if args.iteration_benchmark:
+            print( json.dumps( report, indent=4 ))
+            return 0
+        iteration_exponent	= report['recommended']
+        log.warning( f"Using SLIP-39 iteration exponent {iteration_exponent}; {report['exponents'][iteration_exponent]['decrypt']:.3f}s per recovery" )
+
     # Master Secret Seed data.  Either raw hex [0x]0123.., or a BIP-39 Mnemonic phrase.  If raw hex,
     # we'll also support adding additional entropy (either more raw hex from some external entropy
     # source, or UTF-8 data such as dice rolls, etc. which we'll stretch using SHA-512).
@@ -184,6 +217,10 @@ def main( argv=None ):
             master_secret	= master_secret[2:]
         if all( c in "0123456789abcdef" for c in master_secret.lower() ):
             master_secret	= codecs.decode( master_secret, 'hex_codec' )
+    elif len( args.names ) > 1:
+        # Multiple names; each is created from its own new random secret seed (see write_pdfs)
+        assert not args.entropy, "Additional entropy is supported only for a single name"
+        master_secret		= None
     else:
         # Generate a random secret seed, as bytes
         master_secret		= random_secret( bits_desired // 8 )
@@ -207,7 +244,7 @@ def main( argv=None ):
             master_secret	= bytes( d ^ e for d,e in zip( master_secret, entropy ) )
             args.show and show_table.append( tabulate.SEPARATING_LINE )
         args.show and show_table.append( [ "Master Seed:", f"0x{master_secret.hex()}", f"Using {'BIP' if args.using_bip39 else 'SLIP'}-39 derivation" ] )
-    else:
+    elif master_secret:
         assert not args.entropy, "No additional entropy supported for BIP-39 master secret"
         args.show and show_table.append( [ "Master Seed:", master_secret, "(Using BIP-39 derivation)" ] )
     args.show and print( tabulate.tabulate( show_table, headers=("Description", "Seed data", "Interpretation"), tablefmt='orgtbl' ))
@@ -257,6 +294,7 @@ def main( argv=None ):
             group_threshold	= args.threshold,
             cryptocurrency	= args.cryptocurrency,
             edit		= args.path,
+            context		= context,
             card_format		= args.card,    # False inhibits SLIP-39 Card output
             paper_format	= args.paper,
             filename		= args.output,  # outputs to the current working dir, by default
@@ -270,6 +308,8 @@ def main( argv=None ):
             double_sided	= args.double_sided,
             extendable		= args.extendable,
             identifier		= args.identifier,
+            iteration_exponent	= iteration_exponent,
+            workers		= args.workers,
         )
         if args.card is not False and (args.verbose - args.quiet) >= 0:
             print( "\n".join( results ))
@@ -16,19 +16,28 @@
 #
 from __future__		import annotations
 
+import hashlib
 import logging
+import threading
+import time
 
+from collections	import Counter
 from typing		import Dict, List, Optional, Union, Tuple, Sequence
 
-from shamir_mnemonic	import group_ems_mnemonics, EncryptedMasterSecret, Share, MnemonicError
+from shamir_mnemonic	import EncryptedMasterSecret, Share, MnemonicError
 from shamir_mnemonic.shamir import RANDOM_BYTES
+from shamir_mnemonic.share import ShareCommonParameters
 
 from mnemonic		import Mnemonic			# Requires passphrase as str
-from ..util		import commas
-from ..defaults		import BITS_DEFAULT
+from ..util		import commas, ordinal
+from ..defaults		import BITS_DEFAULT, SECRET_CACHE_TTL
 from .entropy		import (  # noqa F401
     shannon_entropy, signal_entropy, analyze_entropy, scan_entropy, display_entropy
 )
+from .search		import recover_search, recover_benchmark  # noqa F401
+from .repair		import slip39_candidates, slip39_repair, slip39_digested, bip39_repair  # noqa F401
+from .passphrase	import recover_passphrase  # noqa F401
+from .verify		import verify_mnemonics, verify_manifest  # noqa F401
 
 __author__                      = "Perry Kundert"
 __email__                       = "perry@dominionrnd.com"
@@ -38,26 +47,123 @@ __license__                     = "Dual License: GPLv3 (or later) and Commercial
 log				= logging.getLogger( __package__ )
 
 
+def secret_key(
+    encrypted_secret: EncryptedMasterSecret,
+    passphrase: bytes,
+) -> bytes:
+    """A digest identifying a passphrase-decrypted EncryptedMasterSecret: its identifier,
+    extendable flag, iteration exponent and ciphertext, and (a digest of) the SLIP-39 passphrase.
+    The same master secret encrypted w/ a different identifier (or passphrase) gets a different key.
+
+    """
+    digest			= hashlib.sha256( b'slip39-secret' )
+    digest.update( encrypted_secret.identifier.to_bytes( 2, 'big' ))
+    digest.update( bytes([ int( bool( encrypted_secret.extendable )), encrypted_secret.iteration_exponent ]))
+    digest.update( encrypted_secret.ciphertext )
+    digest.update( hashlib.sha256( passphrase ).digest() )
+    return digest.digest()
+
+
+def secret_remember(
+    encrypted_secret: EncryptedMasterSecret,
+    passphrase: bytes,
+    secret: bytes,
+    ttl: Optional[float]	= None,  # default: SECRET_CACHE_TTL seconds
+) -> None:
+    """Remember (briefly) the master secret just encrypted into this EncryptedMasterSecret w/ the
+    SLIP-39 passphrase, so that the immediately following recover of the same SLIP-39 Mnemonics need
+    not run the expensive PBKDF2 key derivation again.  This is only requested where such a recover
+    is known to follow, ie. when api.create is asked to 'remember' a using_bip39 secret, so that
+    layout.produce_pdf may produce its BIP-39 cover page.  Decrypted secrets (eg. each candidate of
+    a passphrase search) are never remembered here.
+
+    The cache's copy of the secret is retained in a bytearray only until it is recalled (once), or
+    for 'ttl' seconds, and only in this process; recalled and expired secrets are zeroed and
+    discarded.  A falsey ttl (eg. a SECRET_CACHE_TTL of 0) remembers nothing.
+
+    """
+    ttl				= SECRET_CACHE_TTL if ttl is None else ttl
+    with secret_remember.lock:
+        secret_expire()
+        if ttl:
+            key			= secret_key( encrypted_secret, passphrase )
+            secret_forget_key( key )
+            secret_remember.secrets[key] = ( time.monotonic() + ttl, bytearray( secret ))
+secret_remember.lock		= threading.Lock()  # noqa: E305
+secret_remember.secrets		= {}			# { key: (expiry, bytearray(secret)) }
+
+
+def secret_recall(
+    encrypted_secret: EncryptedMasterSecret,
+    passphrase: bytes,
+) -> Optional[bytes]:
+    """Return a copy of any (unexpired) master secret remembered for this passphrase-decrypted
+    EncryptedMasterSecret, or None.  A remembered secret may be recalled only once; the cache's own
+    copy is then zeroed and forgotten.  The returned copy is the caller's.
+
+    """
+    with secret_remember.lock:
+        secret_expire()
+        key			= secret_key( encrypted_secret, passphrase )
+        expiry, secret		= secret_remember.secrets.get( key, (None, None) )
+        if secret is None:
+            return None
+        recalled		= bytes( secret )
+        secret_forget_key( key )
+        return recalled
+
+
+def secret_forget_key( key: bytes ) -> None:
+    """Zero and discard any master secret remembered under key.  Caller must hold the lock."""
+    expiry, secret		= secret_remember.secrets.pop( key, (None, None) )
+    if secret is not None:
+        secret[:]		= bytes( len( secret ))
+
+
+def secret_expire( now: Optional[float] = None ) -> None:
+    """Zero and discard all master secrets remembered past their expiry.  Caller must hold the lock."""
+    now				= time.monotonic() if now is None else now
+    for key in [ k for k, (expiry, _) in secret_remember.secrets.items() if expiry <= now ]:
+        secret_forget_key( key )
+
+
+def secret_forget(
+    encrypted_secret: Optional[EncryptedMasterSecret] = None,
+    passphrase: bytes		= b"",
+) -> None:
+    """Zero and discard the master secret remembered for the passphrase-decrypted
+    EncryptedMasterSecret, or (by default) all remembered master secrets.  Any copies already
+    recalled (see secret_recall) are unaffected.
+
+    """
+    with secret_remember.lock:
+        if encrypted_secret is None:
+            for key in list( secret_remember.secrets ):
+                secret_forget_key( key )
+        else:
+            secret_forget_key( secret_key( encrypted_secret, passphrase ))
+
+
 def recover_encrypted(
     mnemonics: Sequence[Union[str,Share]],
     strict: bool = False,
+    workers: Optional[int]	= None,  # Recover the groups in parallel, using this many processes
 ) -> Tuple[EncryptedMasterSecret, Dict[int,Share], Sequence[int]]:
     """Recover encrypted SLIP-39 master secret Seed Entropy and Group details from the supplied
     SLIP-39 mnemonics.  Returns a sequence of EncryptedMasterSecret, and group Share detail that
     were used to resolve each one.
 
     We cannot know in advance what subset of these supplied mnemonics is required and/or valid, so
-    we need to iterate over all subset combinations on failure; this allows us to recover from 1 (or
-    more) incorrectly recovered SLIP-39 Mnemonics, using any others available.
-
-    We'll try to find one of the smallest subset combinations that satisfies the SLIP-39 recovery.
+    we may need to search subset combinations; this allows us to recover from 1 (or more)
+    incorrectly recovered SLIP-39 Mnemonics, using any others available.  See recover_search; once
+    a subset recovers a group's secret, the group's other mnemonics are simply checked against it.
 
     Use this method to recover but NOT decrypt the SLIP-39 master secret Seed.  Later, you may use
     this as a master_secret to slip39.create another set of SLIP-39 Mnemonics for this same
     passphrase-encrypted secret.
 
     """
-    for ems, groups in group_ems_mnemonics( mnemonics, strict=strict ):
+    for ems, groups in recover_search( mnemonics, strict=strict, workers=workers ):
         log.info(
             f"Recovered {len(ems.ciphertext)*8}-bit Encrypted SLIP-39 Seed Entropy using {len(groups)} groups comprising {sum(map(len,groups.values()))} mnemonics"
         )
@@ -71,6 +177,7 @@ def recover(
     as_entropy: Optional[bool]  = None,  # .. and recover original Entropy (not 512-bit Seed)
     language: Optional[str]	= None,  # ... provide BIP-39 language if not default 'english'
     strict: bool		= True,  # Fail if invalid Mnemonics are supplied
+    verify: bool		= False,  # Always decrypt; never use a remembered master secret
 ) -> bytes:
     """Recover, decrypt and return the (first) secret seed Entropy encoded in the SLIP-39 Mnemonics.
 
@@ -94,12 +201,48 @@ def recover(
 
     If strict, we will fail if invalid Mnemonics are supplied; otherwise, they'll be ignored.
 
+    The SLIP-39 decryption runs an (intentionally) expensive PBKDF2 key derivation.  If the master
+    secret was just encrypted into this same EncryptedMasterSecret in this process and remembered
+    (eg. by slip39.create, before producing its BIP-39 PDF cover page), it is recalled once (see
+    secret_remember) instead of decrypted again; a decrypted secret is not remembered.  The
+    Mnemonics are still fully recovered, so they must yield exactly the same EncryptedMasterSecret.
+    To independently verify the Mnemonics by decrypting the secret regardless, supply verify=True.
+
     """
     try:
         encrypted_secret, groups = next( recover_encrypted( mnemonics, strict=strict ))
     except StopIteration:
         raise MnemonicError( "Invalid set of mnemonics; No encoded secret found" )
 
+    return recover_decrypt(
+        encrypted_secret,
+        passphrase	= passphrase,
+        using_bip39	= using_bip39,
+        as_entropy	= as_entropy,
+        language	= language,
+        verify		= verify,
+    )
+
+
+def recover_decrypt(
+    encrypted_secret: EncryptedMasterSecret,
+    passphrase: Optional[Union[str,bytes]] = None,
+    using_bip39: Optional[bool]	= None,  # If a BIP-39 "backup" (default: Falsey)
+    as_entropy: Optional[bool]  = None,  # .. and recover original Entropy (not 512-bit Seed)
+    language: Optional[str]	= None,  # ... provide BIP-39 language if not default 'english'
+    verify: bool		= False,  # Always decrypt; never use a remembered master secret
+    decrypted: Optional[Dict[bytes,bytearray]] = None,  # The caller's own { secret_key: secret } decrypted
+) -> bytes:
+    """Decrypt and return the secret seed Entropy (or BIP-39 Seed) from a recovered SLIP-39
+    EncryptedMasterSecret, as for recover.  This is where the expensive SLIP-39 KDF is run.
+
+    A secret just encrypted (and remembered) by this process is recalled instead, once (see
+    secret_remember).  A caller recovering the same EncryptedMasterSecret repeatedly (eg. a
+    ShareAccumulator) may supply its own 'decrypted' dict, in which each secret it decrypts is
+    retained (under its secret_key) for reuse; its lifetime (and zeroing) is the caller's
+    responsibility.
+
+    """
     # python-shamir-mnemonic requires passphrase as bytes (not str)
     if passphrase is None:
         passphrase		= ""
@@ -107,7 +250,21 @@ def recover(
         passphrase if isinstance( passphrase, bytes ) else passphrase.encode( 'UTF-8' )
     )
 
-    secret			= encrypted_secret.decrypt( passphrase_slip39 )
+    secret			= None
+    if not verify:
+        key			= secret_key( encrypted_secret, passphrase_slip39 )
+        if decrypted is not None and key in decrypted:
+            secret		= bytes( decrypted[key] )
+        else:
+            secret		= secret_recall( encrypted_secret, passphrase_slip39 )
+            if secret is not None and decrypted is not None:
+                decrypted[key]	= bytearray( secret )
+    if secret is None:
+        secret			= encrypted_secret.decrypt( passphrase_slip39 )
+        if decrypted is not None:
+            decrypted[secret_key( encrypted_secret, passphrase_slip39 )] = bytearray( secret )
+    else:
+        log.info( "Seed recalled; SLIP-39 decryption skipped" )
 
     log.info( "Seed decoded from SLIP-39" + (
         f" (w/ no passphrase) and generated using BIP-39 Mnemonic representation w/ {'a' if passphrase else 'no'} passphrase"
@@ -121,15 +278,250 @@ def recover(
         # passphrase has been supplied in that case, as a side-effect.
         passphrase_bip39	= passphrase if isinstance( passphrase, str ) else passphrase.decode( 'UTF-8' )
         # This SLIP-39 was a "backup" of a BIP-39 Mnemonic, in a 'language' (default: "english").
-        secret			= recover_bip39(
-            mnemonic	= produce_bip39( entropy=secret, language=language ),
-            passphrase	= passphrase_bip39,
-            as_entropy	= as_entropy,
-            language	= language,
-        )
+        # The Mnemonic we produce is valid by construction; no need to parse it back.
+        if as_entropy:
+            assert not passphrase_bip39, \
+                "When recovering original BIP-39 entropy, no passphrase may be specified"
+            produce_bip39( entropy=secret, language=language )  # Entropy must be a valid BIP-39 size
+            secret		= bytes( secret )
+        else:
+            _,secret		= produce_bip39_seed( secret, passphrase=passphrase_bip39, language=language )
     return secret
 
 
+class ShareAccumulator:
+    """Accumulates SLIP-39 Mnemonics (eg. as each is entered during recovery), parsing and
+    validating (RS1024 checksum, parameters) each one just once, and indexing its Share by its
+    distinct SLIP-39 encoding (identifier, extendable, iteration exponent, group threshold and
+    count) and group index.
+
+    From this index, we always know exactly which groups (and how many more of their members) are
+    still missing.  Only once some encoding's group and member thresholds could be satisfied are
+    the Shares combined (no KDF) to recover the EncryptedMasterSecret, and only then is it
+    decrypted (the expensive KDF), once.
+
+    Invalid Mnemonics are remembered (with their error), and otherwise ignored unless strict.
+
+    """
+    def __init__(
+        self,
+        mnemonics: Optional[Sequence[Union[str,Share]]] = None,
+        strict: bool		= False,  # Fail if invalid Mnemonics are supplied
+    ):
+        self.strict		= strict
+        self.decrypted: Dict[bytes,bytearray] = {}		# { secret_key: secret } decrypted, once recovered
+        self.clear()
+        for mnemonic in mnemonics or ():
+            self.add( mnemonic )
+
+    def clear( self ):
+        self.mnemonics: Dict[str,Share] = {}			# { "<mnemonic>": Share }
+        self.invalid: Dict[str,str] = {}			# { "<mnemonic>": "<error>" }
+        self.shares: Dict[ShareCommonParameters,Dict[int,Dict[Share,None]]] = {}  # { <encoding>: { <group_index>: { Share: None, ...}}}
+        self.encrypted		= None			# The (EncryptedMasterSecret, groups), once recovered
+        for secret in self.decrypted.values():
+            secret[:]		= bytes( len( secret ))
+        self.decrypted.clear()
+
+    def __len__( self ):
+        return len( self.mnemonics )
+
+    def __iter__( self ):
+        return iter( self.mnemonics )
+
+    @staticmethod
+    def normalize( mnemonic: str ) -> str:
+        return ' '.join( mnemonic.lower().split() )
+
+    def add(
+        self,
+        mnemonic: Union[str,Share],
+    ) -> Optional[Share]:
+        """Parse and index the Mnemonic (once), returning its Share (or None if invalid)."""
+        if isinstance( mnemonic, Share ):
+            share		= mnemonic
+            mnemonic		= share.mnemonic()
+        else:
+            mnemonic		= self.normalize( mnemonic )
+            if mnemonic in self.mnemonics:
+                return self.mnemonics[mnemonic]
+            if not mnemonic:
+                return None
+            try:
+                share		= Share.from_mnemonic( mnemonic )
+            except MnemonicError as exc:
+                if self.strict:
+                    raise
+                log.info( f"Ignoring invalid SLIP-39 mnemonic: {exc}" )
+                self.invalid[mnemonic] = str( exc )
+                return None
+        if mnemonic not in self.mnemonics:
+            self.mnemonics[mnemonic] = share
+            self.shares.setdefault( share.common_parameters(), {} ).setdefault( share.group_index, {} )[share] = None
+            if self.encrypted is None:
+                self.encrypted	= False			# Something new to try
+        return share
+
+    def update(
+        self,
+        mnemonics: Sequence[Union[str,Share]],
+    ) -> ShareAccumulator:
+        """Accumulate exactly the supplied Mnemonics (eg. the current content of a text field).  Only
+        new ones are parsed; if any previously accumulated Mnemonic is no longer present, we start
+        over.
+
+        """
+        mnemonics		= [
+            m.mnemonic() if isinstance( m, Share ) else self.normalize( m )
+            for m in mnemonics
+        ]
+        if set( self.mnemonics ) - set( mnemonics ):
+            self.clear()
+        self.invalid		= {}
+        for mnemonic in mnemonics:
+            self.add( mnemonic )
+        return self
+
+    def missing( self ) -> Dict[ShareCommonParameters, Tuple[int, Dict[int, Tuple[int, int]]]]:
+        """For each distinct SLIP-39 encoding, the number of further groups required, and for each
+        group index w/ any Shares, the (<have>, <member_threshold>) number of distinct members.  A
+        member index w/ several different Shares (eg. a mistranscribed or a wrongly repaired Mnemonic;
+        see contested) counts only once.
+
+        """
+        missing			= {}
+        for common, groups in self.shares.items():
+            members		= {}
+            for group_index, shares in groups.items():
+                thresholds	= {}  # { <member_threshold>: { <member_index>, ... } }
+                for share in shares:
+                    thresholds.setdefault( share.member_threshold, set() ).add( share.index )
+                threshold	= max( thresholds, key=lambda t: len( thresholds[t] ))  # Normally, all the same
+                members[group_index] = ( len( thresholds[threshold] ), threshold )
+            complete		= sum( have >= threshold for have, threshold in members.values() )
+            missing[common]	= ( max( 0, common.group_threshold - complete ), members )
+        return missing
+
+    def contested( self ) -> Dict[ShareCommonParameters, Dict[int, List[int]]]:
+        """For each distinct SLIP-39 encoding, the member indices of each group index w/ more than one
+        different Share; at most one of each can be correct.
+
+        """
+        contested		= {}
+        for common, groups in self.shares.items():
+            for group_index, shares in groups.items():
+                indices		= Counter( share.index for share in shares )
+                if members := sorted( index for index, count in indices.items() if count > 1 ):
+                    contested.setdefault( common, {} )[group_index] = members
+        return contested
+
+    def satisfied( self ) -> List[ShareCommonParameters]:
+        """The SLIP-39 encodings w/ enough groups and members to (possibly) recover a secret."""
+        return [ common for common, (needs, _) in self.missing().items() if not needs ]
+
+    def __str__( self ) -> str:
+        """Describe what is still missing, for each distinct SLIP-39 encoding w/ Shares, and any
+        invalid Mnemonics.
+
+        """
+        descriptions		= []
+        if not self.shares:
+            descriptions.append( "No valid SLIP-39 mnemonics" )
+        contested		= self.contested()
+        for common, (needs, members) in self.missing().items():
+            groups		= commas(
+                f"{ordinal( group_index + 1 )} group {have}/{threshold}"
+                + ( f" ({len( indices )} contested)" if ( indices := contested.get( common, {} ).get( group_index )) else "" )
+                for group_index, (have, threshold) in sorted( members.items() )
+            )
+            descriptions.append(
+                f"SLIP-39 {common.identifier}: {f'needs {needs} more' if needs else 'has enough'}"
+                f" of {common.group_threshold}/{common.group_count} groups; {groups}"
+            )
+        if self.invalid:
+            descriptions.append( f"{len( self.invalid )} invalid: {next( iter( self.invalid.values() ))}" )
+        return '; '.join( descriptions )
+
+    def recover_encrypted( self ) -> Optional[Tuple[EncryptedMasterSecret, Dict[int,Share]]]:
+        """Recover the (first) EncryptedMasterSecret and the groups of Mnemonics used, once enough
+        Shares have been accumulated (no KDF is required).  Returns None until then, or if no secret
+        can be recovered from the Shares accumulated so far.
+
+        """
+        if self.encrypted is False:
+            self.encrypted	= None
+            for common in self.satisfied():
+                shares		= [ share for shares in self.shares[common].values() for share in shares ]
+                try:
+                    self.encrypted = next( recover_encrypted( shares ))
+                    break
+                except StopIteration:
+                    log.info( f"SLIP-39 {common.identifier}: No encoded secret found in {len( shares )} mnemonics" )
+        return self.encrypted or None
+
+    def recover(
+        self,
+        passphrase: Optional[Union[str,bytes]] = None,
+        using_bip39: Optional[bool] = None,  # If a BIP-39 "backup" (default: Falsey)
+        as_entropy: Optional[bool] = None,  # .. and recover original Entropy (not 512-bit Seed)
+        language: Optional[str]	= None,  # ... provide BIP-39 language if not default 'english'
+        verify: bool		= False,  # Always decrypt; never use a remembered master secret
+    ) -> Optional[bytes]:
+        """Recover and decrypt the secret seed Entropy (see recover), once enough Shares have been
+        accumulated; otherwise, return None.
+
+        """
+        encrypted		= self.recover_encrypted()
+        if encrypted is None:
+            return None
+        encrypted_secret, _	= encrypted
+        return recover_decrypt(
+            encrypted_secret,
+            passphrase		= passphrase,
+            using_bip39		= using_bip39,
+            as_entropy		= as_entropy,
+            language		= language,
+            verify		= verify,
+            decrypted		= self.decrypted,
+        )
+
+
+def bip39_mnemonic(
+    language: Optional[str]	= None,   # default: english
+) -> Mnemonic:
+    """Return the shared python-mnemonic Mnemonic for the BIP-39 language.  Constructing one loads
+    (and then the Mnemonic searches) its 2048-word list, so we construct each language's just once,
+    and also index its words.
+
+    """
+    language			= language or "english"
+    m				= bip39_mnemonic.languages.get( language )
+    if m is None:
+        m			= Mnemonic( language )
+        bip39_mnemonic.indices[language] = { w: i for i, w in enumerate( m.wordlist ) }
+        bip39_mnemonic.languages[language] = m
+    return m
+bip39_mnemonic.languages	= {}  # noqa: E305
+bip39_mnemonic.indices		= {}
+
+
+def bip39_detect(
+    mnemonic: str,
+) -> str:
+    """Detect the language of a BIP-39 Mnemonic.  If its words are all complete words of exactly one
+    language, that's it; otherwise (eg. prefixes supplied), use Mnemonic.detect_language's search.
+
+    """
+    words			= set( Mnemonic.normalize_string( mnemonic ).split() )
+    exact			= [
+        language for language in Mnemonic.list_languages()
+        if bip39_mnemonic( language ) and words <= bip39_mnemonic.indices[language].keys()
+    ]
+    if len( exact ) == 1:
+        return exact[0]
+    return Mnemonic.detect_language( mnemonic )
+
+
 def recover_bip39(
     mnemonic: str,
     passphrase: Optional[Union[str,bytes]] = None,
@@ -165,9 +557,9 @@ def recover_bip39(
     # english/french has ambiguous words (fixed in python-mnemonic versions >=0.20).  Mnemonic must
     # be able to unambiguously detect language with the first few un-expanded mnemonics.
     if not language:
-        language		= Mnemonic.detect_language( mnemonic_stripped )
+        language		= bip39_detect( mnemonic_stripped )
         log.info( f"BIP-39 Language detected: {language}" )
-    m				= Mnemonic( language )
+    m				= bip39_mnemonic( language )
     mnemonic_expanded		= m.expand( mnemonic_stripped )
     if mnemonic_expanded != mnemonic_stripped:
         log.info( "BIP-39 Mnemonic Phrase prefixes expanded" )
@@ -202,4 +594,21 @@ def produce_bip39(
         if not strength:
             strength		= BITS_DEFAULT
         entropy			= RANDOM_BYTES( strength // 8 )
-    return Mnemonic( language or "english" ).to_mnemonic( entropy )
+    return bip39_mnemonic( language ).to_mnemonic( entropy )
+
+
+def produce_bip39_seed(
+    entropy: bytes,
+    passphrase: Optional[Union[str,bytes]] = None,
+    language: Optional[str]	= None,
+) -> Tuple[str,bytes]:
+    """Produce the BIP-39 Mnemonic for the provided entropy, and its 512-bit Seed (w/ the optional
+    passphrase).  Equivalent to recover_bip39( produce_bip39( entropy ), passphrase ), but w/o
+    re-parsing and validating the Mnemonic we just produced, or detecting its (known) language.
+
+    """
+    mnemonic			= produce_bip39( entropy=entropy, language=language )
+    if passphrase is None:
+        passphrase		= ""
+    passphrase_bip39		= passphrase if isinstance( passphrase, str ) else passphrase.decode( 'UTF-8' )
+    return mnemonic, bytes( Mnemonic.to_seed( mnemonic, passphrase=passphrase_bip39 ))
@@ -19,10 +19,16 @@ from __future__		import annotations
 
 import argparse
 import codecs
+import itertools
+import json
 import logging
 
 from ..util		import log_cfg, log_level, input_secure, ordinal
-from .			import recover, recover_bip39, produce_bip39
+from ..defaults		import RECOVERY_REPAIRS
+from .			import ShareAccumulator, recover_bip39, produce_bip39
+from .repair		import slip39_repair, slip39_digested, bip39_repair
+from .passphrase	import recover_passphrase
+from .verify		import verify_manifest
 
 __author__                      = "Perry Kundert"
 __email__                       = "perry@dominionrnd.com"
@@ -61,6 +67,30 @@ original BIP-39 mnemonic phrase.
 --entropy.  This modifies the BIP-39 recovery to return the original BIP-39 Mnemonic Entropy, before
 decryption and seed generation.  It has no effect for SLIP-39 recovery.
 
+A damaged SLIP-39 mnemonic may be entered with a '?' for each illegible word, and/or with a '?'
+following each doubtful word (eg. "academic acid? ? brother ...").  Misspelled words, and a single
+wrong word, are also repaired.  If its member or group threshold exceeds 1, every valid completion
+is tried (the SLIP-39 digests reject wrong ones); otherwise, the completion must be unique, or the
+valid completions are listed, to enter the correct one.  Each illegible word multiplies the
+search by 1024, so repairing more than 2 may take a long time; use --workers to search in parallel.
+
+A damaged BIP-39 mnemonic is repaired the same way.  Each illegible word multiplies the search by
+2048, and many completions will have valid checksums; supply the --target address (or xpub... key)
+of an account it produced (at --crypto and --path), to select the right one.  A long search can be
+interrupted, and resumed by supplying the same --checkpoint file.
+
+A forgotten SLIP-39 passphrase (or BIP-39 "25th word") may be recovered from your --mnemonic(s) and
+the --target address (or xpub... key) of an account, by trying candidate passphrases: each word of
+the --guess-words file(s) (and common variations of it), and each --guess-mask (eg. "Secret?d?d";
+?l, ?u, ?d, ?s and ?a match a lower-case, upper-case, digit, symbol or any character).  Use --workers
+and --checkpoint for long searches.
+
+After producing SLIP-39 cards, each set of Mnemonics can be verified to recover its wallet, by every
+threshold subset of each group's Mnemonics (and of the groups), or by --verify-samples random subsets.
+The --verify-manifest is a CSV file w/ a header, and a row for each set: its "mnemonics" file (eg. the
+output of slip39 --text), and the expected "address" and/or "fingerprint" (and any "crypto", "path").
+A JSON report is output for each set; the exit status is non-zero if any set fails.
+
 """ )
 
     ap.add_argument( '-v', '--verbose', action="count",
@@ -88,6 +118,34 @@ decryption and seed generation.  It has no effect for SLIP-39 recovery.
     ap.add_argument( '--language',
                      default=None,
                      help="BIP-39 Mnemonic language (default: english)" )
+    ap.add_argument( '--workers', type=int,
+                     default=None,
+                     help="Repair damaged SLIP-39 or BIP-39 mnemonics in parallel, using this many worker processes" )
+    ap.add_argument( '--target',
+                     default=None,
+                     help="Repair a BIP-39 mnemonic producing this address or xpub... key" )
+    ap.add_argument( '--crypto',
+                     default=None,
+                     help="The --target cryptocurrency (default: ETH for 0x... addresses, otherwise BTC)" )
+    ap.add_argument( '--path',
+                     default=None,
+                     help="The --target derivation path (default: the cryptocurrency's default path)" )
+    ap.add_argument( '--checkpoint',
+                     default=None,
+                     help="Record the BIP-39 repair progress in (and resume it from) this file" )
+    ap.add_argument( '--guess-words', action='append',
+                     help="Recover the passphrase, trying each word in this file (and variations)" )
+    ap.add_argument( '--guess-mask', action='append',
+                     help="Recover the passphrase, trying each matching this mask, eg. 'Secret?d?d'" )
+    ap.add_argument( '--no-guess-variations', dest='guess_variations', action='store_false',
+                     default=True,
+                     help="Do not try variations of each --guess-words word" )
+    ap.add_argument( '--verify-manifest',
+                     default=None,
+                     help="Verify every SLIP-39 Mnemonic set in this manifest CSV recovers its expected wallet" )
+    ap.add_argument( '--verify-samples', type=int,
+                     default=None,
+                     help="Verify this many random threshold subsets of each group (default: all)" )
     ap.add_argument( '-p', '--passphrase',
                      default=None,
                      help="Decrypt the SLIP-39 or BIP-39 master secret w/ this passphrase, '-' reads it from stdin (default: None/'')" )
@@ -119,6 +177,56 @@ decryption and seed generation.  It has no effect for SLIP-39 recovery.
     secret			= None
     algo			= "BIP-39" if args.bip39 else "SLIP-39"
     mnemonics			= args.mnemonic or []
+    if args.verify_manifest:
+        # Verify many sets of SLIP-39 Mnemonics, reporting the results for each as JSON lines
+        count = failed		= 0
+        for report in verify_manifest(
+            args.verify_manifest,
+            passphrase	= passphrase,
+            using_bip39	= args.using_bip39,
+            samples	= args.verify_samples,
+            workers	= args.workers,
+        ):
+            count	       += 1
+            failed	       += not report['pass']
+            if not report['pass']:
+                log.warning( f"{report['file']}: {'; '.join( report['errors'] )}" )
+            print( json.dumps( report ), flush=True )
+        log.warning( f"Verified {count - failed} of {count} SLIP-39 Mnemonic sets; {failed} failed" )
+        return 1 if failed else 0
+    if args.guess_words or args.guess_mask:
+        # Recover a forgotten passphrase, from the supplied mnemonics and a known target account
+        assert args.target and mnemonics, "Passphrase recovery requires --mnemonic(s) and a --target"
+        words			= []
+        for filename in args.guess_words or []:
+            with open( filename, 'r', encoding='UTF-8' ) as f:
+                words.extend( line.strip() for line in f if line.strip() )
+        try:
+            found		= recover_passphrase(
+                mnemonics,
+                target		= args.target,
+                words		= words,
+                masks		= args.guess_mask or [],
+                mutate		= args.guess_variations,
+                using_bip39	= True if args.bip39 else args.using_bip39,
+                crypto		= args.crypto,
+                path		= args.path,
+                language	= args.language,
+                workers		= args.workers,
+                checkpoint	= args.checkpoint,
+            )
+        except KeyboardInterrupt:
+            return 0
+        except Exception as exc:
+            log.error( f"Could not recover the {algo} passphrase with supplied mnemonics: {exc}" )
+            return 1
+        if not found:
+            log.error( f"Could not recover the {algo} passphrase producing {args.target}" )
+            return 1
+        phrase, bip39		= found
+        log.warning( f"Recovered the {'BIP-39' if bip39 else 'SLIP-39'} passphrase; recover w/ {'--using-bip39 ' if bip39 and not args.bip39 else ''}--passphrase -" )
+        print( phrase )
+        return 0
     if args.bip39:
         # Recover from a BIP-39 Mnemonic.  By default, outputs the generated 512-bit wallet Seed,
         # required to derive crypto accounts.  Optionally, with the --entropy option, returns the
@@ -142,12 +250,41 @@ decryption and seed generation.  It has no effect for SLIP-39 recovery.
             return 0
         except Exception as exc:
             log.error( f"Could not recover {algo} seed with supplied mnemonic: {exc}" )
+            # Perhaps it is damaged (eg. illegible/doubtful '?' words); try to repair it.  With a
+            # target, the first completion producing it is the one; otherwise, it must be unique.
+            try:
+                completions	= list( itertools.islice( bip39_repair(
+                    mnemonics[0],
+                    passphrase	= passphrase.decode( 'UTF-8' ),
+                    target	= args.target,
+                    crypto	= args.crypto,
+                    path	= args.path,
+                    language	= args.language,
+                    workers	= args.workers,
+                    checkpoint	= args.checkpoint,
+                ), 1 if args.target else RECOVERY_REPAIRS + 1 ))
+            except KeyboardInterrupt:
+                return 0
+            except Exception as exc:
+                log.error( f"Could not repair {algo} mnemonic: {exc}" )
+                completions	= []
+            if len( completions ) == 1:
+                log.warning( f"Repaired {algo} mnemonic: {completions[0]}" )
+                secret		= recover_bip39(
+                    completions[0],
+                    passphrase	= passphrase,
+                    as_entropy	= args.entropy,
+                    language	= args.language,
+                )
+            elif completions:
+                log.error( f"Found {'over ' if len( completions ) > RECOVERY_REPAIRS else ''}{min( len( completions ), RECOVERY_REPAIRS )} repaired {algo} mnemonics; supply a --target address to select one" )
     else:
-        # Collect more mnemonics 'til we can successfully recover the master secret seed
+        # Collect more mnemonics 'til we can successfully recover the master secret seed.  Each is
+        # parsed just once; the master secret is only decrypted once enough have been collected.
+        accumulator		= ShareAccumulator( mnemonics )
         while secret is None:
             try:
-                secret		= recover(
-                    mnemonics,
+                secret		= accumulator.recover(
                     passphrase	= passphrase,
                     using_bip39	= args.using_bip39,
                     as_entropy	= args.entropy,
@@ -156,15 +293,44 @@ decryption and seed generation.  It has no effect for SLIP-39 recovery.
             except KeyboardInterrupt:
                 return 0
             except Exception as exc:
-                if mnemonics:
-                    log.info( f"Could not recover {algo} seed with {len(mnemonics)} supplied mnemonics: {exc}" )
+                log.warning( f"Could not recover {algo} seed with {len(accumulator)} supplied mnemonics: {exc}" )
+            if secret is None:
+                if len( accumulator ):
+                    log.warning( f"Could not yet recover {algo} seed with {len(accumulator)} supplied mnemonics: {accumulator}" )
                 try:
-                    phrase	= input_secure( f"Enter {ordinal(len(mnemonics)+1)} {algo} mnemonic: ", secret=False )
+                    phrase	= input_secure( f"Enter {ordinal(len(accumulator)+1)} {algo} mnemonic: ", secret=False )
                 except KeyboardInterrupt:
                     return 0
                 if ':' in phrase:  # Discard any "<name>: <mnemonic>" name prefix.
                     _,phrase	= phrase.split( ':', 1 )
-                mnemonics.append( phrase )
+                if accumulator.add( phrase ) is None and phrase.strip():
+                    log.warning( f"Invalid {algo} mnemonic: {accumulator.invalid.get( accumulator.normalize( phrase ))}" )
+                    # Perhaps it is damaged (eg. illegible/doubtful '?' words); try its completions.
+                    # If its member or group threshold exceeds 1, the SLIP-39 digests reject any
+                    # wrong (but checksum-valid) completion, so we can try them all.  Otherwise (a
+                    # 1-of-1 member, w/ a group threshold of 1), nothing would detect a wrong one;
+                    # only a unique completion is accepted.
+                    try:
+                        completions = slip39_repair( accumulator.normalize( phrase ), workers=args.workers )
+                    except KeyboardInterrupt:
+                        completions = []
+                    except Exception as exc:
+                        log.info( f"Could not repair {algo} mnemonic: {exc}" )
+                        completions = []
+                    if len( completions ) > RECOVERY_REPAIRS:
+                        log.warning( f"Too many ({len( completions )}) repaired {algo} mnemonics; please enter more words" )
+                    elif len( completions ) == 1:
+                        log.warning( f"Repaired {algo} mnemonic: {completions[0]}" )
+                        accumulator.add( completions[0] )
+                    elif completions and slip39_digested( completions ):
+                        log.warning( f"Trying {len( completions )} repaired {algo} mnemonics" )
+                        for completion in completions:
+                            log.info( f"Repaired {algo} mnemonic: {completion}" )
+                            accumulator.add( completion )
+                    elif completions:
+                        log.warning( f"Found {len( completions )} repaired {algo} mnemonics, which a threshold of 1 can't distinguish; please enter the correct one:" )
+                        for completion in completions:
+                            log.warning( f"    {completion}" )
     if secret:
         if args.using_bip39 and args.entropy in (None, True):
             secret		= produce_bip39(
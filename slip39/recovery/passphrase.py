@@ -0,0 +1,266 @@
+
+#
+# Python-slip39 -- Ethereum SLIP-39 Account Generation and Recovery
+#
+# Copyright (c) 2022, Dominion Research & Development Corp.
+#
+# Python-slip39 is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.  It is also available under alternative (eg. Commercial) licenses, at
+# your option.  See the LICENSE file at the top of the source tree.
+#
+# Python-slip39 is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+from __future__		import annotations
+
+import hashlib
+import itertools
+import json
+import logging
+import math
+import string
+
+from collections	import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing		import Callable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from shamir_mnemonic	import EncryptedMasterSecret, Share, MnemonicError
+from shamir_mnemonic.cipher import BASE_ITERATION_COUNT
+
+from mnemonic		import Mnemonic
+
+from ..util		import timer
+from .repair		import account_match, checkpoint_load, checkpoint_save
+
+__author__                      = "Perry Kundert"
+__email__                       = "perry@dominionrnd.com"
+__copyright__                   = "Copyright (c) 2022 Dominion Research & Development Corp."
+__license__                     = "Dual License: GPLv3 (or later) and Commercial (see LICENSE)"
+
+log				= logging.getLogger( __package__ )
+
+
+# Mask placeholders, as used by common password recovery tools: eg. "?u?l?l?l?d?d" for "Abcd12"
+PASSPHRASE_MASKS		= dict(
+    l			= string.ascii_lowercase,
+    u			= string.ascii_uppercase,
+    d			= string.digits,
+    s			= string.punctuation + ' ',
+    a			= string.ascii_letters + string.digits + string.punctuation + ' ',
+)
+PASSPHRASE_MASKS['?']		= '?'
+
+# Commonly substituted characters, and suffixes appended to dictionary words
+PASSPHRASE_LEET			= str.maketrans( 'aeiost', '431057' )
+PASSPHRASE_SUFFIXES		= tuple( str( n ) for n in range( 100 )) + ( '!', '123', '1234' )
+
+# Candidate passphrases are evaluated (and checkpointed) in tasks of this many
+PASSPHRASE_CHUNK		= 64
+
+# The BIP-39 Seed is stretched by 2048 rounds of PBKDF2 HMAC-SHA512
+BIP39_ITERATION_COUNT		= 2048
+
+
+def passphrase_mask(
+    mask: str,
+) -> Tuple[int,Iterator[str]]:
+    """Return the number of candidate passphrases matching the mask, and an iterator yielding them.
+    Each ?l, ?u, ?d, ?s or ?a matches a lower-case, upper-case, digit, symbol or any character
+    (see PASSPHRASE_MASKS), ?? matches a '?', and any other character matches itself.
+
+    """
+    charsets			= []
+    chars			= iter( mask )
+    for c in chars:
+        if c == '?':
+            c			= next( chars, '?' )
+            if c not in PASSPHRASE_MASKS:
+                raise ValueError( f"Unrecognized passphrase mask ?{c} in {mask!r}; use one of {', '.join( '?' + k for k in PASSPHRASE_MASKS )}" )
+            charsets.append( PASSPHRASE_MASKS[c] )
+        else:
+            charsets.append( c )
+    return math.prod( map( len, charsets )), ( ''.join( p ) for p in itertools.product( *charsets ))
+
+
+def passphrase_mutations(
+    word: str,
+) -> List[str]:
+    """The word, its capitalized, upper-, lower-case and "leet" variants, each w/ common suffixes."""
+    bases			= list( dict.fromkeys( [
+        word, word.capitalize(), word.lower(), word.upper(), word.lower().translate( PASSPHRASE_LEET ),
+    ] ))
+    return bases + [ base + suffix for base in bases for suffix in PASSPHRASE_SUFFIXES ]
+
+
+def passphrase_candidates(
+    words: Sequence[str]	= (),		# Dictionary words (eg. from a wordlist file)
+    masks: Sequence[str]	= (),		# eg. "Secret?d?d"
+    mutate: bool		= True,		# Also try mutations of each dictionary word
+) -> Tuple[int,Iterator[str]]:
+    """Return the number of candidate passphrases, and an iterator yielding them, cheapest sources
+    first: the dictionary words as-is, then each source (their mutations, and each mask) in order of
+    size.  The order is deterministic, so a search may be resumed by skipping candidates.
+
+    """
+    words			= list( dict.fromkeys( words ))
+    sources			= [ ( len( words ), iter( words )) ]
+    if mutate and words:
+        mutations		= list( dict.fromkeys( m for w in words for m in passphrase_mutations( w ) if m not in words ))
+        sources.append( ( len( mutations ), iter( mutations )))
+    sources.extend( sorted( map( passphrase_mask, masks ), key=lambda s: s[0] ))
+    return sum( count for count, _ in sources ), itertools.chain.from_iterable( it for _, it in sources )
+
+
+def passphrase_plan(
+    mnemonics: Sequence[Union[str,Share]],
+    using_bip39: Optional[bool]	= None,		# None: the passphrase may be SLIP-39 or BIP-39
+    language: Optional[str]	= None,
+) -> List[Tuple[str,Union[str,EncryptedMasterSecret],int]]:
+    """Determine how each candidate passphrase must be evaluated: a list of ('bip39', <phrase>) and/or
+    ('slip39', <EncryptedMasterSecret>) KDFs, w/ their PBKDF2 iteration counts, cheapest first.
+
+    A single BIP-39 Mnemonic's passphrase is its BIP-39 "25th word".  For SLIP-39 Mnemonics, the
+    Shares are recovered (no KDF) just once.  If a SLIP-39 "backup" of a BIP-39 Mnemonic is
+    using_bip39, then the SLIP-39 decryption (w/ no passphrase) is also done just once, and each
+    candidate only costs a BIP-39 PBKDF2.  Otherwise, each must run the SLIP-39 Feistel KDF (4
+    rounds, totalling 10,000 << iteration_exponent PBKDF2 HMAC-SHA256 iterations); if using_bip39
+    is unknown, the much cheaper BIP-39 interpretation is tried first (unless the secret is too large
+    to be BIP-39 entropy, eg. 512 bits).
+
+    Raises a MnemonicError if the Mnemonics are neither a valid BIP-39 Mnemonic, nor a sufficient set
+    of SLIP-39 Mnemonics to recover a secret.
+
+    """
+    from .			import recover_encrypted, produce_bip39, bip39_detect, bip39_mnemonic  # (recovery imports passphrase)
+    if len( mnemonics ) == 1 and isinstance( mnemonics[0], str ):
+        phrase			= ' '.join( mnemonics[0].lower().split() )
+        bip39_language		= language or bip39_detect( phrase ) if len( phrase.split() ) in ( 12, 15, 18, 21, 24 ) else None
+        if bip39_language and bip39_mnemonic( bip39_language ).check( phrase ):
+            return [ ( 'bip39', phrase, BIP39_ITERATION_COUNT ) ]
+    recovered			= next( recover_encrypted( mnemonics ), None )
+    if recovered is None:
+        raise MnemonicError(
+            "Neither a valid BIP-39 Mnemonic (eg. w/ a correct checksum), nor a recoverable set of SLIP-39 Mnemonics supplied" )
+    ems, _			= recovered
+    plan			= []
+    if using_bip39 in ( None, True ):
+        # Only 128- to 256-bit secrets (eg. not 512-bit) can be the entropy of a BIP-39 Mnemonic
+        entropy			= ems.decrypt( b"" )
+        if len( entropy ) in ( 16, 20, 24, 28, 32 ):
+            plan.append( ( 'bip39', produce_bip39( entropy=entropy, language=language ), BIP39_ITERATION_COUNT ))
+        elif using_bip39:
+            raise ValueError( f"A {len( entropy ) * 8}-bit SLIP-39 secret cannot be the entropy of a BIP-39 Mnemonic" )
+    if using_bip39 in ( None, False ):
+        plan.append( ( 'slip39', ems, BASE_ITERATION_COUNT << ems.iteration_exponent ))
+    return sorted( plan, key=lambda kdf: kdf[2] )
+
+
+def passphrase_search(
+    plan: Sequence[Tuple[str,Union[str,EncryptedMasterSecret],int]],
+    passphrases: Sequence[str],
+    target: str,
+    **kwds,						# crypto, path, format for account_match
+) -> Optional[Tuple[str,bool]]:
+    """Evaluate the candidate passphrases w/ each KDF of the plan, returning the first producing the
+    target (and whether it was a BIP-39 passphrase), or None.
+
+    """
+    for passphrase in passphrases:
+        for kind, secret, _ in plan:
+            if kind == 'bip39':
+                seed		= Mnemonic.to_seed( secret, passphrase )
+            else:
+                seed		= secret.decrypt( passphrase.encode( 'UTF-8' ))
+            if account_match( seed, target, **kwds ):
+                return passphrase, kind == 'bip39'
+    return None
+
+
+def recover_passphrase(
+    mnemonics: Sequence[Union[str,Share]],
+    target: str,			# An address or xpub... key derived from the secret w/ the passphrase
+    words: Sequence[str]	= (),		# Dictionary words (eg. from a wordlist file)
+    masks: Sequence[str]	= (),		# eg. "Secret?d?d"
+    mutate: bool		= True,		# Also try mutations of each dictionary word
+    using_bip39: Optional[bool]	= None,		# None: the passphrase may be SLIP-39 or BIP-39
+    crypto: Optional[str]	= None,		# default: 'ETH' for 0x... targets, otherwise 'BTC'
+    path: Optional[str]		= None,		# default: the crypto's path_default
+    format: Optional[str]	= None,
+    language: Optional[str]	= None,
+    workers: Optional[int]	= None,		# Search in parallel, using this many processes
+    checkpoint: Optional[str]	= None,		# Record (and resume) progress in this JSON file
+    progress: Optional[Callable[[int,int],None]] = None,  # Called w/ (<done>, <total>) candidates
+) -> Optional[Tuple[str,bool]]:
+    """Recover a forgotten SLIP-39 passphrase (or BIP-39 "25th word"), given the owner's Mnemonics
+    and a known address (or xpub... key), from candidate passphrases generated from dictionary words
+    (and their mutations) and masks.  Returns the passphrase and whether it is a BIP-39 passphrase
+    (ie. the SLIP-39 Mnemonics are using_bip39), or None.
+
+    Each candidate requires an expensive KDF (see passphrase_plan), so tasks of PASSPHRASE_CHUNK
+    candidates are evaluated by a pool of 'workers' processes, w/ only a few tasks in flight at a
+    time (masks may produce a vast number of candidates).  The throughput and ETA are logged, and
+    the number of tasks completed (and any passphrase found, so this file must be kept as secure as
+    the Mnemonics) is recorded in any 'checkpoint' file, to resume an interrupted search.
+
+    """
+    plan			= passphrase_plan( mnemonics, using_bip39=using_bip39, language=language )
+    total, candidates		= passphrase_candidates( words=words, masks=masks, mutate=mutate )
+    log.info( f"Searching {total:,} passphrases w/ {' then '.join( f'{kind} ({iterations:,} iterations)' for kind, _, iterations in plan )} KDF" )
+
+    search			= hashlib.sha256( json.dumps( [
+        list( words ), list( masks ), mutate, using_bip39, target, crypto, path, format, language,
+        hashlib.sha256( repr( [ ( kind, str( secret )) for kind, secret, _ in plan ] ).encode( 'UTF-8' )).hexdigest(),
+    ] ).encode( 'UTF-8' )).hexdigest()
+    state			= checkpoint_load( checkpoint, search, tasks=0, found=None )
+    if state['found']:
+        return tuple( state['found'] )
+    done			= resumed	= min( total, state['tasks'] * PASSPHRASE_CHUNK )
+    if done:
+        log.warning( f"Resuming passphrase recovery after {done:,} of {total:,} candidates" )
+    candidates			= itertools.islice( candidates, done, None )
+    tasks			= iter( lambda: list( itertools.islice( candidates, PASSPHRASE_CHUNK )), [] )
+
+    from ..api			import Account, worker_init		# (api depends on recovery)
+    kwds			= dict( target=target, crypto=crypto, path=path, format=format )
+    pool			= ProcessPoolExecutor(
+        max_workers	= workers,
+        initializer	= worker_init,
+        initargs	= ( dict( Account.CRYPTO_FORMAT ), Account.ECC_BACKEND ),
+    ) if workers else None
+    inflight			= deque()
+    found			= None
+    begun			= timer()
+    try:
+        while found is None:
+            # Keep a few tasks in flight per worker; complete (and checkpoint) them in order
+            while len( inflight ) < 2 * ( workers or 0 ) + 1:
+                task		= next( tasks, None )
+                if task is None:
+                    break
+                inflight.append( (
+                    len( task ),
+                    pool.submit( passphrase_search, plan, task, **kwds ) if pool else passphrase_search( plan, task, **kwds )
+                ))
+            if not inflight:
+                break
+            count, result	= inflight.popleft()
+            found		= result.result() if pool else result
+            done	       += count
+            state['tasks']     += 1
+            state['found']	= found
+            checkpoint_save( checkpoint, state )
+            if progress:
+                progress( done, total )
+            if log.isEnabledFor( logging.INFO ):
+                elapsed		= timer() - begun
+                rate		= ( done - resumed ) / max( elapsed, 1e-6 )
+                log.info( f"Searched {done:,} of {total:,} passphrases at {rate:,.1f}/s; ETA {( total - done ) / rate:.1f}s" )
+    finally:
+        if pool:
+            pool.shutdown( wait=True, cancel_futures=True )
+    if found:
+        log.warning( f"Recovered {'BIP-39' if found[1] else 'SLIP-39'} passphrase after {done:,} of {total:,} candidates" )
+    return found
@@ -0,0 +1,564 @@
+
+#
+# Python-slip39 -- Ethereum SLIP-39 Account Generation and Recovery
+#
+# Copyright (c) 2022, Dominion Research & Development Corp.
+#
+# Python-slip39 is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.  It is also available under alternative (eg. Commercial) licenses, at
+# your option.  See the LICENSE file at the top of the source tree.
+#
+# Python-slip39 is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+from __future__		import annotations
+
+import hashlib
+import itertools
+import json
+import logging
+import math
+import os
+
+try:
+    import numpy
+except ImportError:
+    numpy			= None
+
+from collections	import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing		import Callable, Dict, Generator, Iterator, List, Optional, Sequence, Tuple, Union
+
+from shamir_mnemonic	import Share, MnemonicError
+from shamir_mnemonic.share import _customization_string
+from shamir_mnemonic.wordlist import WORDLIST, WORD_INDEX_MAP
+
+from mnemonic		import Mnemonic
+
+from ..util		import ordinal, timer
+
+__author__                      = "Perry Kundert"
+__email__                       = "perry@dominionrnd.com"
+__copyright__                   = "Copyright (c) 2022 Dominion Research & Development Corp."
+__license__                     = "Dual License: GPLv3 (or later) and Commercial (see LICENSE)"
+
+log				= logging.getLogger( __package__ )
+
+
+# The SLIP-39 RS1024 checksum generator (see shamir_mnemonic.rs1024)
+RS1024_GEN			= (
+    0xE0E040, 0x1C1C080, 0x3838100, 0x7070200, 0xE0E0009,
+    0x1C0C2412, 0x38086C24, 0x3090FC48, 0x21B1F890, 0x3F3F120,
+)
+
+# Candidate completions are searched in chunks of about this many (vectorized, if numpy available)
+REPAIR_CHUNK			= 1 << 20
+
+# BIP-39 candidates are checksum-filtered and (if a target is supplied) stretched in tasks of about
+# this many; a checkpoint is recorded as each task completes
+BIP39_REPAIR_CHUNK		= 1 << 16
+
+
+def rs1024_step( chk, value ):
+    """Advance the RS1024 polymod checksum state 'chk' by one 10-bit word 'value'.  Either may be an
+    int, or a numpy array (to advance many candidate states at once).
+
+    """
+    b				= chk >> 20
+    chk				= ( chk & 0xFFFFF ) << 10 ^ value
+    for i, gen in enumerate( RS1024_GEN ):
+        chk		       ^= -(( b >> i ) & 1 ) & gen
+    return chk
+
+
+def rs1024_state( values: Sequence[int], chk: int = 1 ) -> int:
+    """The RS1024 polymod state after the given values; a valid checksum's final state is 1."""
+    for value in values:
+        chk			= rs1024_step( chk, value )
+    return chk
+
+
+def edit_distance( a: str, b: str ) -> int:
+    """The Levenshtein distance between two words."""
+    row				= list( range( len( b ) + 1 ))
+    for i, ca in enumerate( a ):
+        prev, row[0]		= row[0], i + 1
+        for j, cb in enumerate( b ):
+            prev, row[j+1]	= row[j+1], min( row[j+1] + 1, row[j] + 1, prev + ( ca != cb ))
+    return row[-1]
+
+
+def word_candidates(
+    word: str,
+    wordlist: Sequence[str],
+    distance: int		= 1,		# Include words within this edit distance
+) -> List[str]:
+    """Candidate words from the wordlist for a (perhaps illegible, misspelled or low-confidence) word.
+
+    An erased word ('?' or '') may be any word.  A known word is just itself, unless marked as
+    low-confidence by a trailing '?' (eg. 'acid?'), when the words within one more edit distance of
+    it are also candidates.  Otherwise, the candidates are the words sharing its first 4 letters
+    (which uniquely identify each SLIP-39 and English BIP-39 word), and those within an edit
+    distance of it, closest first.
+
+    """
+    word			= word.strip().lower()
+    if word in ( '?', '' ):
+        return list( wordlist )
+    uncertain			= word.endswith( '?' )
+    word			= word.rstrip( '?' )
+    if word in wordlist and not uncertain:
+        return [ word ]
+    if uncertain:
+        distance	       += 1
+    distances			= {
+        w: 0 if len( word ) >= 4 and w.startswith( word[:4] ) else edit_distance( word, w )
+        for w in wordlist
+    }
+    return sorted(
+        ( w for w, d in distances.items() if d <= distance ),
+        key		= lambda w: ( w != word, distances[w] ),
+    )
+
+
+def slip39_candidates(
+    word: str,
+    distance: int		= 1,
+) -> List[str]:
+    """Candidate SLIP-39 words for a (perhaps illegible, misspelled or low-confidence) word."""
+    return word_candidates( word, WORDLIST, distance=distance )
+
+
+def slip39_choices(
+    mnemonic: Union[str,Sequence[str]],
+    candidates: Optional[Dict[int,Sequence[str]]] = None,  # { <position>: [<word>, ...] } overrides
+    distance: int		= 1,
+) -> List[List[int]]:
+    """The candidate SLIP-39 word indices for each position of the mnemonic."""
+    words			= mnemonic.split() if isinstance( mnemonic, str ) else list( mnemonic )
+    choices			= []
+    for position, word in enumerate( words ):
+        options			= ( candidates or {} ).get( position ) or slip39_candidates( word, distance=distance )
+        if not options:
+            raise MnemonicError( f"No candidate SLIP-39 words for the {ordinal( position + 1 )} word {word!r}" )
+        choices.append( [ WORD_INDEX_MAP[w.lower()] for w in options ] )
+    return choices
+
+
+def slip39_search(
+    choices: Sequence[Sequence[int]],
+) -> List[Tuple[int,...]]:
+    """Return every combination of the choices (a word index for each position) w/ a valid RS1024
+    checksum.
+
+    The checksum state is advanced through each run of known words just once, and then (for each
+    candidate at an erased position) only through the remaining words.  If numpy is available, all
+    the candidates' states are advanced together, as arrays; a search of more than REPAIR_CHUNK
+    candidates is vectorized in chunks (see slip39_chunks), to bound its memory.
+
+    """
+    if numpy is not None and math.prod( map( len, choices )) > REPAIR_CHUNK:
+        return [
+            found
+            for chunk in slip39_chunks( choices )
+            for found in slip39_search( chunk )
+        ]
+    found			= []
+    for extendable in ( False, True ):
+        # The extendable flag (which selects the checksum's customization string) is the 5th bit of
+        # the 2nd word; only its candidates w/ the corresponding flag are compatible.
+        options			= [ list( c ) for c in choices ]
+        if len( options ) > 1:
+            options[1]		= [ i for i in options[1] if bool( i >> 4 & 1 ) == extendable ]
+            if not options[1]:
+                continue
+        chk			= rs1024_state( _customization_string( extendable ))
+        if numpy is not None and math.prod( map( len, options )) > 1:
+            states		= numpy.array( [ chk ], dtype=numpy.int64 )
+            picks		= numpy.zeros( (1, 0), dtype=numpy.int16 )
+            for opts in options:
+                if len( opts ) == 1:
+                    states	= rs1024_step( states, opts[0] )
+                    continue
+                values		= numpy.array( opts, dtype=numpy.int64 )
+                states		= rs1024_step( numpy.repeat( states, len( values )), numpy.tile( values, len( states )))
+                picks		= numpy.hstack( [
+                    numpy.repeat( picks, len( values ), axis=0 ),
+                    numpy.tile( values, len( picks ))[:, None].astype( numpy.int16 ),
+                ] )
+            valid		= picks[states == 1]
+            erased		= [ n for n, opts in enumerate( options ) if len( opts ) > 1 ]
+            for row in valid:
+                indices		= [ opts[0] for opts in options ]
+                for n, i in zip( erased, row ):
+                    indices[n]	= int( i )
+                found.append( tuple( indices ))
+        else:
+            def search( chk, n, prefix ):
+                while n < len( options ) and len( options[n] ) == 1:
+                    chk		= rs1024_step( chk, options[n][0] )
+                    prefix	= prefix + ( options[n][0], )
+                    n	       += 1
+                if n == len( options ):
+                    if chk == 1:
+                        found.append( prefix )
+                    return
+                for i in options[n]:
+                    search( rs1024_step( chk, i ), n + 1, prefix + ( i, ))
+            search( chk, 0, () )
+    return found
+
+
+def slip39_chunks(
+    choices: Sequence[Sequence[int]],
+    split: int			= 0,		# Split on at least this many erased words
+) -> Iterator[List[List[int]]]:
+    """Split the choices on each candidate of as many leading erased words as are required to limit
+    each chunk to no more than REPAIR_CHUNK candidates (eg. 4 erased words are split on the first
+    two).  The chunks are generated lazily, in order.
+
+    """
+    erased			= [ n for n, c in enumerate( choices ) if len( c ) > 1 ]
+    rows			= math.prod( map( len, choices ))
+    splits			= []
+    for n in erased:
+        if rows <= REPAIR_CHUNK and len( splits ) >= split:
+            break
+        splits.append( n )
+        rows		      //= len( choices[n] )
+    for picks in itertools.product( *( choices[n] for n in splits )):
+        chunk			= [ list( c ) for c in choices ]
+        for n, i in zip( splits, picks ):
+            chunk[n]		= [ i ]
+        yield chunk
+
+
+def slip39_repair(
+    mnemonic: Union[str,Sequence[str]],
+    candidates: Optional[Dict[int,Sequence[str]]] = None,  # { <position>: [<word>, ...] } overrides
+    distance: int		= 1,		# Include words within this edit distance of unknown words
+    workers: Optional[int]	= None,		# Search in parallel, using this many processes
+    progress: Optional[Callable[[int,int],None]] = None,  # Called w/ (<done>, <total>) candidates
+) -> List[str]:
+    """Return every valid completion of a damaged SLIP-39 mnemonic, eg. w/ illegible words ('?'),
+    low-confidence words ('acid?'), misspelled words, or explicit 'candidates' for some positions.
+
+    If every word is known but the checksum is invalid, one of them must be wrong; each position is
+    tried with every other word (the RS1024 checksum can correct any single wrong word).
+
+    Each erased word multiplies the search by up to 1024 candidates.  Large searches are split (on
+    the candidates of enough leading erased words) into chunks of no more than REPAIR_CHUNK, which
+    may be searched by 'workers' processes; 'progress' is called (and an ETA logged) as each chunk
+    completes.
+
+    """
+    choices			= slip39_choices( mnemonic, candidates=candidates, distance=distance )
+    if all( len( c ) == 1 for c in choices ):
+        if slip39_search( choices ):
+            return [ ' '.join( WORDLIST[c[0]] for c in choices ) ]
+        log.info( "Invalid SLIP-39 checksum; trying a substitution for each word" )
+        chunks			= [
+            choices[:n] + [ [ i for i in range( len( WORDLIST )) if i != choices[n][0] ] ] + choices[n+1:]
+            for n in range( len( choices ))
+        ]
+        total			= sum( math.prod( map( len, chunk )) for chunk in chunks )
+    else:
+        # Split on enough leading erased words (at least the first, if parallel) to limit each chunk
+        chunks			= slip39_chunks( choices, split=1 if workers else 0 )
+        total			= math.prod( map( len, choices ))
+
+    done			= 0
+    begun			= timer()
+    completions			= []
+    pool			= ProcessPoolExecutor( max_workers=workers ) if workers else None
+    chunks			= iter( chunks )
+    inflight			= deque()
+    try:
+        while True:
+            # Keep a few chunks in flight per worker; there may be very many
+            while len( inflight ) < 2 * ( workers or 0 ) + 1:
+                chunk		= next( chunks, None )
+                if chunk is None:
+                    break
+                inflight.append( ( chunk, pool.submit( slip39_search, chunk ) if pool else slip39_search( chunk )) )
+            if not inflight:
+                break
+            chunk, found	= inflight.popleft()
+            if pool:
+                found		= found.result()
+            for indices in found:
+                completion	= ' '.join( WORDLIST[i] for i in indices )
+                try:
+                    Share.from_mnemonic( completion )
+                except MnemonicError as exc:
+                    log.info( f"Ignoring checksum-valid but invalid SLIP-39 completion: {exc}" )
+                    continue
+                completions.append( completion )
+            done	       += math.prod( map( len, chunk ))
+            if progress:
+                progress( done, total )
+            if log.isEnabledFor( logging.INFO ):
+                elapsed		= timer() - begun
+                log.info( f"Searched {done:,} of {total:,} SLIP-39 candidates; {len( completions )} found, ETA {elapsed * ( total - done ) / done:.1f}s" )
+    finally:
+        if pool:
+            pool.shutdown( wait=True, cancel_futures=True )
+    return completions
+
+
+def slip39_digested(
+    mnemonics: Sequence[str],
+) -> bool:
+    """Whether a wrong (but checksum-valid) one of these SLIP-39 Mnemonics (eg. repaired completions)
+    would be rejected by the SLIP-39 digests, when combined w/ the others of its set.  If either its
+    member or group threshold exceeds 1, it is combined w/ other Shares (of its group, or of other
+    groups), and so checked by a digest; only a 1-of-1 member of a set w/ a group threshold of 1
+    silently recovers a wrong secret.
+
+    """
+    return all(
+        share.member_threshold > 1 or share.group_threshold > 1
+        for share in map( Share.from_mnemonic, mnemonics )
+    )
+
+
+def bip39_language(
+    words: Sequence[str],
+) -> str:
+    """Detect the BIP-39 language of (perhaps damaged) words; the one recognizing the most of them."""
+    from .			import bip39_mnemonic		# (recovery imports repair)
+    words			= set( w.strip().lower().rstrip( '?' ) for w in words )
+    return max(
+        Mnemonic.list_languages(),
+        key		= lambda language: len( words & set( bip39_mnemonic( language ).wordlist )),
+    )
+
+
+def account_match(
+    seed: bytes,
+    target: str,			# An address, or an xpub... key
+    crypto: Optional[str]	= None,  # default: 'ETH' for 0x... targets, otherwise 'BTC'
+    path: Optional[str]		= None,  # default: the crypto's path_default
+    format: Optional[str]	= None,
+) -> bool:
+    """Whether the seed derives the target address or xpub... key, at the path."""
+    from ..api			import Account		# (api depends on recovery)
+    if crypto is None:
+        crypto			= 'ETH' if target.lower().startswith( '0x' ) else 'BTC'
+    acct			= Account( crypto, format ).from_seed( seed, path )
+    return target.lower() in ( acct.address.lower(), acct.xpubkey.lower() )
+
+
+def bip39_match(
+    phrase: str,
+    passphrase: str,
+    target: str,
+    **kwds,						# crypto, path, format for account_match
+) -> bool:
+    """Whether the BIP-39 phrase (w/ passphrase) generates the target address or xpub... key.
+    Stretching the BIP-39 Seed (a 2048-round PBKDF2 HMAC-SHA512) dominates the cost.
+
+    """
+    return account_match( Mnemonic.to_seed( phrase, passphrase ), target, **kwds )
+
+
+def checkpoint_load(
+    checkpoint: Optional[str],
+    search: str,			# Identifies the search; any other search's checkpoint is ignored
+    **state,						# The initial state, eg. tasks=0
+) -> Dict:
+    """Return the state recorded in the checkpoint file for this search, or the initial state."""
+    state			= dict( state, search=search )
+    if checkpoint and os.path.exists( checkpoint ):
+        with open( checkpoint, 'r' ) as f:
+            saved		= json.load( f )
+        if saved.get( 'search' ) == search:
+            state		= saved
+        else:
+            log.warning( f"Ignoring checkpoint {checkpoint} for a different search" )
+    return state
+
+
+def checkpoint_save(
+    checkpoint: Optional[str],
+    state: Dict,
+):
+    """Atomically record the search state in the checkpoint file (if any)."""
+    if checkpoint:
+        with open( checkpoint + '.tmp', 'w' ) as f:
+            json.dump( state, f )
+        os.replace( checkpoint + '.tmp', checkpoint )
+
+
+def bip39_search(
+    language: str,
+    choices: Sequence[Sequence[int]],
+    lo: int,
+    hi: int,
+    target: Optional[str]	= None,
+    **kwds,						# passphrase, crypto, path, format for bip39_match
+) -> Tuple[int,List[str]]:
+    """Search the candidate BIP-39 phrases w/ outer ordinals [lo,hi); each ordinal selects a word for
+    every erased position but the last, and all of the last one's candidates are tried.  Returns the
+    number of checksum-valid candidates, and those matching the target (or all of them, if None).
+
+    The entropy+checksum integer is assembled incrementally: the known words are combined once, and
+    each candidate word's bits are pre-shifted into place.  Only about 1 in 2^(words/3) candidates
+    survive the checksum, to be stretched and compared against the target.
+
+    """
+    from .			import bip39_mnemonic		# (recovery imports repair)
+    wordlist			= bip39_mnemonic( language ).wordlist
+    n				= len( choices )
+    checksum_bits		= n // 3
+    entropy_bytes		= ( n * 11 - checksum_bits ) // 8
+    erased			= [ p for p, c in enumerate( choices ) if len( c ) > 1 ]
+    shifted			= [ [ i << 11 * ( n - 1 - p ) for i in c ] for p, c in enumerate( choices ) ]
+    base			= 0
+    for p, c in enumerate( shifted ):
+        if len( c ) == 1:
+            base	       |= c[0]
+    outer, inner		= erased[:-1], shifted[erased[-1]] if erased else ( 0, )
+    survivors			= 0
+    found			= []
+    for number in range( lo, hi ):
+        value			= base
+        for p in reversed( outer ):
+            number, digit	= divmod( number, len( shifted[p] ))
+            value	       |= shifted[p][digit]
+        for last in inner:
+            full		= value | last
+            entropy		= ( full >> checksum_bits ).to_bytes( entropy_bytes, 'big' )
+            if hashlib.sha256( entropy ).digest()[0] >> ( 8 - checksum_bits ) != full & (( 1 << checksum_bits ) - 1 ):
+                continue
+            survivors	       += 1
+            phrase		= ' '.join( wordlist[full >> 11 * ( n - 1 - p ) & 0x7FF] for p in range( n ))
+            if target is None or bip39_match( phrase, target=target, **kwds ):
+                found.append( phrase )
+    return survivors, found
+
+
+def bip39_repair(
+    mnemonic: Union[str,Sequence[str]],
+    candidates: Optional[Dict[int,Sequence[str]]] = None,  # { <position>: [<word>, ...] } overrides
+    passphrase: str		= "",
+    target: Optional[str]	= None,		# An address or xpub... key the repaired phrase must produce
+    crypto: Optional[str]	= None,		# default: 'ETH' for 0x... targets, otherwise 'BTC'
+    path: Optional[str]		= None,		# default: the crypto's path_default
+    format: Optional[str]	= None,
+    language: Optional[str]	= None,		# default: detected from the words
+    distance: int		= 1,		# Include words within this edit distance of unknown words
+    workers: Optional[int]	= None,		# Search in parallel, using this many processes
+    checkpoint: Optional[str]	= None,		# Record (and resume) progress in this JSON file
+    progress: Optional[Callable[[int,int],None]] = None,  # Called w/ (<done>, <total>) candidates
+) -> Generator[str,None,None]:
+    """Yield each valid completion of a damaged BIP-39 mnemonic (illegible '?', doubtful 'word?' or
+    misspelled words); if a target address (or xpub... key) is supplied, only those producing it.
+
+    If every word is known but the checksum is invalid, each position is tried with every other word.
+
+    Each erased word multiplies the search by 2048 candidates, but only 1 in 16 (12 words) to 1 in 256
+    (24 words) pass the checksum.  Each survivor must be stretched by a 2048-round PBKDF2, before
+    its account can be compared to the target; the searches are performed by a pool of 'workers'
+    processes, in tasks of about BIP39_REPAIR_CHUNK candidates.
+
+    A long search may be interrupted and resumed, if a 'checkpoint' file is supplied; the number of
+    tasks completed (and the completions found, so this file must be kept as secure as the phrase
+    itself), are recorded as each task completes.
+
+    """
+    words			= mnemonic.split() if isinstance( mnemonic, str ) else list( mnemonic )
+    if len( words ) not in ( 12, 15, 18, 21, 24 ):
+        raise ValueError( f"BIP-39 Mnemonics must have 12, 15, 18, 21 or 24 words, not {len( words )}" )
+    if not language:
+        language		= bip39_language( words )
+        log.info( f"BIP-39 Language detected: {language}" )
+    from .			import bip39_mnemonic		# (recovery imports repair)
+    wordlist			= bip39_mnemonic( language ).wordlist
+    index			= bip39_mnemonic.indices[language]
+    choices			= []
+    for position, word in enumerate( words ):
+        options			= ( candidates or {} ).get( position ) or word_candidates( word, wordlist, distance=distance )
+        if not options:
+            raise ValueError( f"No candidate BIP-39 {language} words for the {ordinal( position + 1 )} word {word!r}" )
+        choices.append( [ index[w.lower()] for w in options ] )
+    if all( len( c ) == 1 for c in choices ) and not bip39_search( language, choices, 0, 1 )[0]:
+        log.info( "Invalid BIP-39 checksum; trying a substitution for each word" )
+        patterns		= [
+            choices[:n] + [ [ i for i in range( len( wordlist )) if i != choices[n][0] ] ] + choices[n+1:]
+            for n in range( len( choices ))
+        ]
+    else:
+        patterns		= [ choices ]
+
+    # Each task searches a range of outer ordinals of one pattern (every erased word but the last);
+    # there may be very many, so they are generated (and submitted) lazily
+    splits			= []  # [ (<pattern>, <erased>, <outers>, <step>), ... ]
+    for pattern in patterns:
+        erased			= [ len( c ) for c in pattern if len( c ) > 1 ]
+        outers			= math.prod( erased[:-1] )
+        step			= max( 1, BIP39_REPAIR_CHUNK // ( erased[-1] if erased else 1 ))
+        splits.append( (pattern, erased, outers, step) )
+    count			= sum( ( outers + step - 1 ) // step for _,_,outers,step in splits )
+    total			= sum( math.prod( erased ) for _,erased,_,_ in splits )
+    tasks			= (
+        ( pattern, lo, hi, math.prod( erased ) * ( hi - lo ) // outers )
+        for pattern, erased, outers, step in splits
+        for lo in range( 0, outers, step )
+        for hi in [ min( lo + step, outers ) ]
+    )
+
+    # Resume from any checkpoint of this very same search
+    search			= hashlib.sha256( json.dumps( [
+        language, patterns, target, crypto, path, format, hashlib.sha256( passphrase.encode( 'UTF-8' )).hexdigest()
+    ] ).encode( 'UTF-8' )).hexdigest()
+    state			= checkpoint_load( checkpoint, search, tasks=0, found=[] )
+    if state['tasks']:
+        log.warning( f"Resuming BIP-39 repair after {state['tasks']} of {count} tasks" )
+    yield from state['found']
+
+    from ..api			import Account, worker_init		# (api depends on recovery)
+    kwds			= dict( target=target, passphrase=passphrase, crypto=crypto, path=path, format=format )
+    if not target:
+        kwds			= dict( target=None )
+    pool			= ProcessPoolExecutor(
+        max_workers	= workers,
+        initializer	= worker_init,
+        initargs	= ( dict( Account.CRYPTO_FORMAT ), Account.ECC_BACKEND ),
+    ) if workers and count - state['tasks'] > 1 else None
+    done			= resumed	= sum( t[3] for t in itertools.islice( tasks, state['tasks'] ))
+    survived			= 0
+    begun			= timer()
+    inflight			= deque()
+    try:
+        while True:
+            # Keep a few tasks in flight per worker; there may be very many
+            while len( inflight ) < 2 * ( workers or 0 ) + 1:
+                task		= next( tasks, None )
+                if task is None:
+                    break
+                inflight.append( ( task, (
+                    pool.submit( bip39_search, language, *task[:3], **kwds ) if pool else
+                    bip39_search( language, *task[:3], **kwds )
+                )) )
+            if not inflight:
+                break
+            task, result	= inflight.popleft()
+            survivors, found	= result.result() if pool else result
+            survived	       += survivors
+            done	       += task[3]
+            state['tasks']     += 1
+            state['found'].extend( found )
+            checkpoint_save( checkpoint, state )
+            yield from found
+            if progress:
+                progress( done, total )
+            if count > 1 and log.isEnabledFor( logging.INFO ):
+                elapsed		= timer() - begun
+                log.info( f"Searched {done:,} of {total:,} BIP-39 candidates; {survived:,} checksum-valid, {len( state['found'] )} found, ETA {elapsed * ( total - done ) / max( 1, done - resumed ):.1f}s" )
+    finally:
+        if pool:
+            pool.shutdown( wait=True, cancel_futures=True )
@@ -0,0 +1,311 @@
+
+#
+# Python-slip39 -- Ethereum SLIP-39 Account Generation and Recovery
+#
+# Copyright (c) 2022, Dominion Research & Development Corp.
+#
+# Python-slip39 is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.  It is also available under alternative (eg. Commercial) licenses, at
+# your option.  See the LICENSE file at the top of the source tree.
+#
+# Python-slip39 is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+from __future__		import annotations
+
+import dataclasses
+import itertools
+import logging
+import math
+import random
+
+from collections	import Counter, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from typing		import Dict, Generator, List, Optional, Sequence, Tuple, Union
+
+from shamir_mnemonic	import EncryptedMasterSecret, Share, MnemonicError, group_ems_mnemonics
+from shamir_mnemonic.shamir import RawShare, _recover_secret, _interpolate
+from shamir_mnemonic.share import ShareCommonParameters, ShareGroupParameters
+
+from ..util		import timer
+from ..defaults		import RECOVERY_SAMPLES
+
+__author__                      = "Perry Kundert"
+__email__                       = "perry@dominionrnd.com"
+__copyright__                   = "Copyright (c) 2022 Dominion Research & Development Corp."
+__license__                     = "Dual License: GPLv3 (or later) and Commercial (see LICENSE)"
+
+log				= logging.getLogger( __package__ )
+
+
+# A point (x, data) on a SLIP-39 Shamir polynomial, and what it came from: a member Share (in a
+# group), or a group's recovered secret (and the Shares it was recovered from).
+Point				= namedtuple( 'Point', ('x', 'data', 'shares') )
+
+
+def partition_shares(
+    mnemonics: Sequence[Union[str,Share]],
+    strict: bool		= False,  # Fail if invalid Mnemonics are supplied
+) -> Dict[ShareCommonParameters, Dict[ShareGroupParameters, List[Share]]]:
+    """Parse (and RS1024 checksum validate) each distinct Mnemonic just once, and partition the
+    Shares by their distinct SLIP-39 encoding (identifier, extendable, iteration exponent, group
+    threshold and count), and then by group (group index and member threshold).  Invalid
+    Mnemonics are ignored unless strict.
+
+    """
+    partitions			= {}
+    seen			= set()
+    for mnemonic in mnemonics:
+        if isinstance( mnemonic, str ):
+            mnemonic		= ' '.join( mnemonic.lower().split() )
+        if mnemonic in seen:
+            continue
+        seen.add( mnemonic )
+        try:
+            share		= mnemonic if isinstance( mnemonic, Share ) else Share.from_mnemonic( mnemonic )
+        except MnemonicError as exc:
+            if strict:
+                raise
+            log.info( f"Ignoring invalid SLIP-39 mnemonic: {exc}" )
+            continue
+        grouping		= partitions.setdefault( share.common_parameters(), {} ).setdefault( share.group_parameters(), [] )
+        if share not in grouping:
+            grouping.append( share )
+    return partitions
+
+
+def rank_points( points: Sequence[Point] ) -> List[Point]:
+    """Rank the points most likely consistent first.  Points whose x coordinate (member or group
+    index) is contested by another point w/ different data cannot all be correct, so we try
+    uncontested points first.
+
+    """
+    contested			= Counter( p.x for p in points )
+    return sorted( points, key=lambda p: contested[p.x] )
+
+
+def subsets(
+    threshold: int,
+    points: Sequence[Point],
+    samples: int		= 0,		# Try this many random subsets first
+    rng: Optional[random.Random] = None,
+) -> Sequence[Tuple[Point,...]]:
+    """Yield threshold-sized subsets of points w/ distinct x coordinates, each just once.
+
+    A few corrupt points spoil most subsets containing them; in lexicographic order, the first
+    clean subset can be thousands of subsets away (eg. the first of 16 points is corrupt: all 6,435
+    of the 8-point subsets including it come first).  So, a number of random subsets of the
+    (ranked) points are tried first, before trying all the rest in order.
+
+    """
+    rng				= rng or random
+    contested			= Counter( p.x for p in points )
+    indices			= range( len( points ))
+    uncontested			= [ i for i in indices if contested[points[i].x] == 1 ]
+    tried			= set()
+    for population in ( uncontested, indices ) if samples else ():
+        if len( population ) < threshold:
+            continue
+        for _ in range( min( samples, math.comb( len( population ), threshold ))):
+            subset		= tuple( sorted( rng.sample( population, threshold )))
+            if subset not in tried:
+                tried.add( subset )
+                if len( set( points[i].x for i in subset )) == threshold:
+                    yield tuple( points[i] for i in subset )
+    for subset in itertools.combinations( indices, threshold ):
+        if subset not in tried and len( set( points[i].x for i in subset )) == threshold:
+            yield tuple( points[i] for i in subset )
+
+
+def recover_points(
+    threshold: int,
+    points: Sequence[Point],
+    samples: Optional[int]	= None,		# default: RECOVERY_SAMPLES random subsets
+) -> List[Tuple[bytes, List[Point]]]:
+    """Recover each distinct secret (and all the points consistent with it) from points on one or
+    more threshold-degree SLIP-39 polynomials, some perhaps corrupt.
+
+    Subsets of the (ranked) points are tried in turn (see subsets); the first to recover a secret
+    w/ a valid digest defines the polynomial.  Then, each remaining point is checked for
+    consistency by a single interpolation (no further subset search), and the consistent points are
+    removed before searching for any other secret.  With a threshold of 1, no digest is available;
+    each distinct data is its own secret.
+
+    Returns [ (<secret>, [<point>, ...]), ... ], best supported secrets first.
+
+    """
+    if threshold == 1:
+        secrets			= {}
+        for p in points:
+            secrets.setdefault( p.data, [] ).append( p )
+        return sorted( secrets.items(), key=lambda sp: -len( sp[1] ))
+
+    found			= []
+    remaining			= rank_points( points )
+    while len( set( p.x for p in remaining )) >= threshold:
+        for subset in subsets( threshold, remaining, RECOVERY_SAMPLES if samples is None else samples ):
+            rawshares		= [ RawShare( p.x, p.data ) for p in subset ]
+            try:
+                secret		= _recover_secret( threshold, rawshares )
+            except MnemonicError:
+                continue
+            consistent		= [
+                p for p in remaining
+                if p in subset or _interpolate( rawshares, p.x ) == p.data
+            ]
+            found.append( (secret, consistent) )
+            remaining		= [ p for p in remaining if p not in consistent ]
+            break
+        else:
+            break
+    return sorted( found, key=lambda sp: -len( sp[1] ))
+
+
+def recover_group(
+    grouping: ShareGroupParameters,
+    shares: Sequence[Share],
+) -> List[Point]:
+    """Recover each distinct group secret available from the group's Shares, as a Point at its
+    group index (w/ all the consistent Shares it was recovered from).
+
+    """
+    return [
+        Point( grouping.group_index, secret, tuple( p.shares[0] for p in members ))
+        for secret, members in recover_points(
+            grouping.member_threshold,
+            [ Point( share.index, share.value, (share,) ) for share in shares ]
+        )
+    ]
+
+
+def recover_search(
+    mnemonics: Sequence[Union[str,Share]],
+    strict: bool		= False,  # Fail if invalid Mnemonics are supplied, or none recovered
+    workers: Optional[int]	= None,  # Recover the groups in parallel, using this many processes
+) -> Generator[Tuple[EncryptedMasterSecret, Dict[int,set]],None,None]:
+    """Recover and yield each EncryptedMasterSecret (and the {<group_index>: {<mnemonic>, ...}} of
+    all the Mnemonics consistent with it), from a large and possibly noisy set of SLIP-39 Mnemonics.
+    Like shamir_mnemonic.group_ems_mnemonics, but scales to many groups and shares w/ a handful of
+    incorrect (but RS1024 valid) Mnemonics.
+
+    Each Mnemonic is parsed and validated just once, and the Shares partitioned by encoding and
+    group.  Each group's secret(s) are recovered from ranked subsets of its Shares; the rest of its
+    Shares are then simply checked for consistency.  The same is then done with the recovered
+    group secrets, to recover the EncryptedMasterSecret.  No KDF is required; the digests embedded
+    in each group (and in the group secrets) detect corrupt Shares (except, of course, for
+    thresholds of 1).
+
+    If 'workers', the groups are recovered in parallel by a pool of processes; this only pays off
+    for very large numbers of very noisy groups.
+
+    """
+    partitions			= partition_shares( mnemonics, strict=strict )
+    groupings			= [
+        (common, grouping, shares)
+        for common, sharegroups in partitions.items()
+        for grouping, shares in sharegroups.items()
+    ]
+    if workers and len( groupings ) > 1:
+        with ProcessPoolExecutor( max_workers=workers ) as pool:
+            recovered		= list( pool.map( recover_group, *list( zip( *groupings ))[1:] ))
+    else:
+        recovered		= [ recover_group( grouping, shares ) for _, grouping, shares in groupings ]
+    group_points		= {}
+    for (common, _, _), points in zip( groupings, recovered ):
+        group_points.setdefault( common, [] ).extend( points )
+
+    found			= 0
+    for common, points in group_points.items():
+        for ciphertext, groups in recover_points( common.group_threshold, points ):
+            ems			= EncryptedMasterSecret(
+                common.identifier, common.extendable, common.iteration_exponent, ciphertext,
+            )
+            using		= {}
+            for group in groups:
+                using.setdefault( group.x, set() ).update( share.mnemonic() for share in group.shares )
+            found	       += 1
+            yield ems, using
+    if strict and not found:
+        raise MnemonicError( "Invalid set of mnemonics; No encoded secret found" )
+
+
+def corrupt_share(
+    share: Share,
+    rng: Optional[random.Random] = None,
+) -> Share:
+    """A Share w/ a corrupted value, but a valid RS1024 checksum (eg. a card transcribed incorrectly,
+    and then "fixed" by someone re-computing its checksum, or a decoy); only the group digest can
+    detect it.
+
+    """
+    rng				= rng or random
+    value			= bytearray( share.value )
+    value[rng.randrange( len( value ))] ^= 1 << rng.randrange( 8 )
+    return dataclasses.replace( share, value=bytes( value ))
+
+
+def corrupt_mnemonic(
+    mnemonic: str,
+    rng: Optional[random.Random] = None,
+) -> str:
+    """A Mnemonic w/ one word mistyped; detected by its RS1024 checksum."""
+    rng				= rng or random
+    words			= mnemonic.split()
+    n				= rng.randrange( len( words ))
+    words[n]			= 'academic' if words[n] != 'academic' else 'acid'
+    return ' '.join( words )
+
+
+def recover_benchmark(
+    group_threshold: int	= 4,
+    groups: Optional[Dict[str,Tuple[int,int]]] = None,  # default: 8 groups of 5/8
+    corrupt: int		= 2,		# Shares per group w/ corrupt values, but valid checksums
+    mistyped: int		= 2,		# Shares per group w/ mistyped words (invalid checksums)
+    baseline: bool		= True,		# Also time shamir_mnemonic.group_ems_mnemonics
+    seed: Optional[int]		= None,
+) -> Dict[str,float]:
+    """Create a synthetic set of SLIP-39 cards, corrupt some of them (as in recovery_test.py), and
+    measure the time to recover the EncryptedMasterSecret using recover_search (and, optionally,
+    the baseline group_ems_mnemonics).  Returns { "<method>": <seconds>, ... }.
+
+    """
+    from ..api			import mnemonics as produce_mnemonics, random_secret
+
+    rng				= random.Random( seed )
+    groups			= groups or { f"g{g}": (5, 8) for g in range( 8 ) }
+    secret			= random_secret( 16 )
+    g_mnems			= produce_mnemonics(
+        group_threshold	= group_threshold,
+        groups		= list( groups.values() ),
+        master_secret	= secret,
+    )
+    cards			= []
+    for mnems in g_mnems:
+        mnems			= list( mnems )
+        rng.shuffle( mnems )
+        for n, mnem in enumerate( mnems ):
+            if n < corrupt:
+                # This card was transcribed incorrectly
+                mnem		= corrupt_share( Share.from_mnemonic( mnem ), rng ).mnemonic()
+            elif n < corrupt + mistyped:
+                # ... and this one was mistyped once, and then re-entered correctly
+                cards.append( corrupt_mnemonic( mnem, rng ))
+            cards.append( mnem )
+    rng.shuffle( cards )
+    log.info( f"Recovering from {len( cards )} SLIP-39 cards in {len( groups )} groups, w/ {corrupt} corrupt and {mistyped} mistyped per group" )
+
+    methods			= dict( search=recover_search )
+    if baseline:
+        methods['baseline']	= group_ems_mnemonics
+    durations			= {}
+    for name, method in methods.items():
+        begun			= timer()
+        ems, _			= next( method( cards ))
+        durations[name]		= timer() - begun
+        assert ems.decrypt( b"" ) == secret, \
+            f"{name} recovered the wrong secret"
+        log.info( f"{name:>12}: {durations[name]:9.3f}s" )
+    return durations
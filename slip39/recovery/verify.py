@@ -0,0 +1,247 @@
+
+#
+# Python-slip39 -- Ethereum SLIP-39 Account Generation and Recovery
+#
+# Copyright (c) 2022, Dominion Research & Development Corp.
+#
+# Python-slip39 is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.  It is also available under alternative (eg. Commercial) licenses, at
+# your option.  See the LICENSE file at the top of the source tree.
+#
+# Python-slip39 is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+from __future__		import annotations
+
+import csv
+import itertools
+import logging
+import math
+import os
+import random
+
+from concurrent.futures import ProcessPoolExecutor
+from functools		import partial
+from typing		import Dict, Generator, List, Optional, Sequence, Tuple, Union
+
+from shamir_mnemonic	import Share, MnemonicError
+from shamir_mnemonic.shamir import RawShare, _recover_secret
+
+from ..defaults		import MNEM_ROWS_COLS
+from ..util		import timer
+
+__author__                      = "Perry Kundert"
+__email__                       = "perry@dominionrnd.com"
+__copyright__                   = "Copyright (c) 2022 Dominion Research & Development Corp."
+__license__                     = "Dual License: GPLv3 (or later) and Commercial (see LICENSE)"
+
+log				= logging.getLogger( __package__ )
+
+
+def combinations(
+    items: Sequence,
+    threshold: int,
+    samples: Optional[int]	= None,		# Only (up to) this many random combinations; None: all
+    rng: Optional[random.Random] = None,
+) -> Generator[Tuple,None,None]:
+    """Yield every threshold-sized combination of the items, or a random sample of them (each once)."""
+    total			= math.comb( len( items ), threshold )
+    if samples is None or samples >= total:
+        yield from itertools.combinations( items, threshold )
+        return
+    rng				= rng or random
+    tried			= set()
+    while len( tried ) < samples:
+        subset			= tuple( sorted( rng.sample( range( len( items )), threshold )))
+        if subset not in tried:
+            tried.add( subset )
+            yield tuple( items[i] for i in subset )
+
+
+def read_mnemonics(
+    filename: str,
+) -> List[str]:
+    """Read the SLIP-39 Mnemonics from a file, one per line, eg. as output by slip39 --text; any
+    "<name> <group> <n>: " card label before a Mnemonic is discarded.  Blank and '#' lines are
+    ignored, as are any other labelled lines (eg. "Using BIP-39 Mnemonic: ...", output w/
+    --using-bip39) and lines not of a SLIP-39 Mnemonic's length (20, 33 or 59 words).
+
+    """
+    mnemonics			= []
+    with open( filename, 'r', encoding='UTF-8' ) as f:
+        for number, line in enumerate( f, start=1 ):
+            line		= line.strip()
+            if not line or line.startswith( '#' ):
+                continue
+            if ':' in line:
+                label,line	= line.split( ':', 1 )
+                if not label.split() or not label.split()[-1].isdigit():
+                    log.info( f"{filename}:{number}: Ignoring {label!r} line" )
+                    continue
+            words		= line.lower().split()
+            if len( words ) not in MNEM_ROWS_COLS:
+                log.warning( f"{filename}:{number}: Ignoring {len( words )}-word line; not a SLIP-39 Mnemonic" )
+                continue
+            mnemonics.append( ' '.join( words ))
+    return mnemonics
+
+
+def verify_mnemonics(
+    mnemonics: Sequence[Union[str,Share]],
+    address: Optional[str]	= None,		# The expected first address
+    fingerprint: Optional[str]	= None,		# The expected root fingerprint (see AddressCache.fingerprint)
+    crypto: Optional[str]	= None,		# default: 'ETH' for 0x... addresses, otherwise 'BTC'
+    path: Optional[str]		= None,		# default: the crypto's path_default
+    format: Optional[str]	= None,
+    passphrase: Optional[Union[str,bytes]] = None,
+    using_bip39: Optional[bool]	= None,
+    samples: Optional[int]	= None,		# Check (up to) this many random subsets per group; None: all
+    rng: Optional[random.Random] = None,
+) -> Dict:
+    """Verify that a complete set of SLIP-39 Mnemonics (eg. as printed on cards) recovers the expected
+    wallet, via every (or a random sample of) threshold subset of each group's Mnemonics and of the
+    groups.  Returns a report: { "pass": <bool>, "errors": [...], "address": ..., ... }.
+
+    The master secret is recovered (and decrypted w/ the expensive KDF) just once, w/ recover.
+    Then, each threshold subset of a group's Mnemonics must recover (by interpolation, verifying the
+    SLIP-39 digest) the same group secret, and each group threshold subset of the groups must
+    recover the same encrypted master secret; no further KDFs are required.
+
+    """
+    from .			import recover				# (recovery imports verify)
+    from ..api			import Account, AddressCache		# (api depends on recovery)
+    report			= dict( errors=[], mnemonics=len( mnemonics ), groups=0, subsets=0 )
+    try:
+        shares			= [ m if isinstance( m, Share ) else Share.from_mnemonic( m ) for m in mnemonics ]
+        if not shares:
+            raise MnemonicError( "No SLIP-39 Mnemonics supplied" )
+        if len( set( s.common_parameters() for s in shares )) > 1:
+            raise MnemonicError( "SLIP-39 Mnemonics from more than one set supplied" )
+        secret			= recover( shares, passphrase=passphrase, using_bip39=using_bip39 )
+    except Exception as exc:
+        report['errors'].append( f"Recovery failed: {exc}" )
+        report['pass']		= False
+        return report
+
+    # Every threshold subset of each group's Mnemonics must recover the same group secret
+    groups			= {}
+    for share in shares:
+        groups.setdefault( share.group_index, [] ).append( share )
+    secrets			= {}
+    for group_index, members in sorted( groups.items() ):
+        threshold		= members[0].member_threshold
+        if len( members ) < threshold:
+            report['errors'].append( f"Group {group_index+1} has only {len( members )} of {threshold} required Mnemonics" )
+            continue
+        for subset in combinations( members, threshold, samples=samples, rng=rng ):
+            report['subsets']  += 1
+            which		= f"Group {group_index+1} Mnemonics {', '.join( str( s.index+1 ) for s in subset )}"
+            try:
+                group_secret	= _recover_secret( threshold, [ RawShare( s.index, s.value ) for s in subset ] )
+            except MnemonicError as exc:
+                report['errors'].append( f"{which} fail to recover the group: {exc}" )
+                continue
+            if secrets.setdefault( group_index, group_secret ) != group_secret:
+                report['errors'].append( f"{which} recover a different group secret" )
+    report['groups']		= len( secrets )
+
+    # Every group threshold subset of the groups must recover the same encrypted master secret
+    group_threshold		= shares[0].group_threshold
+    if len( secrets ) < group_threshold:
+        report['errors'].append( f"Only {len( secrets )} of {shares[0].group_count} groups recovered; {group_threshold} required" )
+    encrypted			= None
+    for subset in combinations( sorted( secrets.items() ), group_threshold, samples=samples, rng=rng ):
+        report['subsets']      += 1
+        which			= f"Groups {', '.join( str( g+1 ) for g, _ in subset )}"
+        try:
+            ciphertext		= _recover_secret( group_threshold, [ RawShare( g, s ) for g, s in subset ] )
+        except MnemonicError as exc:
+            report['errors'].append( f"{which} fail to recover the secret: {exc}" )
+            continue
+        if encrypted is None:
+            encrypted		= ciphertext
+        elif ciphertext != encrypted:
+            report['errors'].append( f"{which} recover a different secret" )
+
+    # The recovered secret must produce the expected wallet
+    if crypto is None:
+        crypto			= 'ETH' if ( address or '' ).lower().startswith( '0x' ) or not address else 'BTC'
+    acct			= Account( crypto, format ).from_seed( secret, path )
+    report.update( crypto=acct.crypto, path=acct.path, address=acct.address, fingerprint=AddressCache.fingerprint( acct ))
+    if address and address.lower() != acct.address.lower():
+        report['errors'].append( f"Address {acct.address} doesn't match {address}" )
+    if fingerprint and fingerprint.lower() != report['fingerprint']:
+        report['errors'].append( f"Fingerprint {report['fingerprint']} doesn't match {fingerprint}" )
+    report['pass']		= not report['errors']
+    return report
+
+
+def verify_entry(
+    entry: Dict[str,str],
+    directory: str		= '',
+    **kwds,						# passphrase, using_bip39, samples for verify_mnemonics
+) -> Dict:
+    """Verify one manifest entry (a row: mnemonics, and address and/or fingerprint, crypto, path)."""
+    begun			= timer()
+    filename			= os.path.join( directory, entry['mnemonics'] )
+    try:
+        mnemonics		= read_mnemonics( filename )
+    except OSError as exc:
+        report			= dict( errors=[ f"Could not read {filename}: {exc}" ] )
+        report['pass']		= False
+    else:
+        report			= verify_mnemonics(
+            mnemonics,
+            address	= entry.get( 'address' ) or None,
+            fingerprint	= entry.get( 'fingerprint' ) or None,
+            crypto	= entry.get( 'crypto' ) or None,
+            path	= entry.get( 'path' ) or None,
+            **kwds
+        )
+    return dict( file=entry['mnemonics'], seconds=round( timer() - begun, 3 ), **report )
+
+
+def verify_manifest(
+    manifest: str,			# A CSV file w/ mnemonics,address[,fingerprint,crypto,path] columns
+    passphrase: Optional[Union[str,bytes]] = None,
+    using_bip39: Optional[bool]	= None,
+    samples: Optional[int]	= None,		# Check (up to) this many random subsets per group; None: all
+    workers: Optional[int]	= None,		# Verify the sets in parallel, using this many processes
+) -> Generator[Dict,None,None]:
+    """Verify every set of SLIP-39 Mnemonics in a manifest, yielding a report for each (in order).
+
+    The manifest is a CSV file w/ a header; each row names a 'mnemonics' file (relative to the
+    manifest's directory; see read_mnemonics), and its expected 'address' and/or 'fingerprint' (of
+    the 'crypto' and 'path', if not the default).  The sets are verified (see verify_mnemonics) by
+    a pool of 'workers' processes.
+
+    """
+    with open( manifest, 'r', encoding='UTF-8', newline='' ) as f:
+        entries			= [
+            { k.strip(): ( v or '' ).strip() for k, v in row.items() if k }
+            for row in csv.DictReader( f, skipinitialspace=True )
+        ]
+    verify			= partial(
+        verify_entry,
+        directory	= os.path.dirname( manifest ),
+        passphrase	= passphrase,
+        using_bip39	= using_bip39,
+        samples		= samples,
+    )
+    if not workers or len( entries ) < 2:
+        yield from map( verify, entries )
+        return
+
+    from ..api			import Account, worker_init		# (api depends on recovery)
+    pool			= ProcessPoolExecutor(
+        max_workers	= workers,
+        initializer	= worker_init,
+        initargs	= ( dict( Account.CRYPTO_FORMAT ), Account.ECC_BACKEND ),
+    )
+    try:
+        yield from pool.map( verify, entries, chunksize=max( 1, len( entries ) // ( workers * 8 )))
+    finally:
+        pool.shutdown( wait=True, cancel_futures=True )
@@ -2,6 +2,7 @@ import base64
 import cmath
 import codecs
 import csv
+import dataclasses
 import hashlib
 import itertools
 import json
@@ -13,15 +14,26 @@ import random
 import secrets
 import multiprocessing
 
+try:
+    import numpy
+except ImportError:
+    numpy			= None
+
 from collections	import deque
 
 import shamir_mnemonic
 from shamir_mnemonic.constants import MAX_SHARE_COUNT
 
 from .api		import create, account, path_hardened
-from .recovery		import recover, recover_bip39, shannon_entropy, signal_entropy, analyze_entropy
+from .recovery		import recover, recover_bip39, produce_bip39, produce_bip39_seed, bip39_mnemonic, bip39_detect, shannon_entropy, signal_entropy, analyze_entropy, secret_forget, ShareAccumulator
+from .recovery.search	import recover_search, recover_benchmark, corrupt_share, corrupt_mnemonic
+from .recovery.repair	import slip39_candidates, slip39_choices, slip39_chunks, slip39_repair, slip39_digested, rs1024_state, rs1024_step, bip39_repair
+from .recovery		import repair
+from .recovery.passphrase import recover_passphrase, passphrase_candidates, passphrase_mask, passphrase_plan
+from .recovery.verify	import verify_mnemonics, verify_manifest, read_mnemonics
 from .recovery.entropy	import fft, ifft, pfft, dft, dft_on_real, dft_to_rms_mags, entropy_bin_dfts, denoise_mags, signal_draw, signal_recover_real, scan_entropy
 from .dependency_test	import substitute, nonrandom_bytes, SEED_XMAS, SEED_ONES, SEED_ZERO
+from .layout		import write_pdfs
 from .util		import avg, rms, ordinal, commas, round_onto
 
 log				= logging.getLogger( __package__ )
@@ -108,6 +120,28 @@ def test_recover_non_extendable():
     ]) == SEED_XMAS
 
 
+def test_produce_bip39_seed():
+    """The shared per-language BIP-39 Mnemonics, and the direct entropy to Mnemonic and Seed path."""
+    assert bip39_mnemonic() is bip39_mnemonic( "english" ) is bip39_mnemonic( "english" )
+    assert bip39_mnemonic.indices["english"]["zoo"] == 2047
+    assert bip39_detect( "zoo " * 11 + "wrong" ) == "english"
+    assert bip39_detect( "zoo " * 11 + "wron" ) == "english"		# prefixes use Mnemonic.detect_language
+    for language in ( "english", "french", "japanese" ):
+        for entropy in ( SEED_XMAS, SEED_ONES * 2, bytes( 20 )):
+            for passphrase in ( None, "", "banana", b"banana" ):
+                mnemonic, seed	= produce_bip39_seed( entropy, passphrase=passphrase, language=language )
+                assert mnemonic == produce_bip39( entropy=entropy, language=language )
+                assert seed == recover_bip39( mnemonic, passphrase=passphrase, language=language )
+    with pytest.raises( ValueError ):
+        produce_bip39_seed( bytes( 18 ))
+
+    # A SLIP-39 "backup" of BIP-39 entropy recovers the same BIP-39 Seed, w/o re-parsing its Mnemonic
+    details			= create( "bip39", 1, dict( one=(1, 1) ), SEED_XMAS, using_bip39=True )
+    assert recover( details.groups['one'][1], passphrase="banana", using_bip39=True ) \
+        == recover_bip39( produce_bip39( entropy=SEED_XMAS ), passphrase="banana" )
+    assert recover( details.groups['one'][1], using_bip39=True, as_entropy=True ) == SEED_XMAS
+
+
 @substitute( shamir_mnemonic.shamir, 'RANDOM_BYTES', nonrandom_bytes )
 def test_recover_bip39_non_extendable():
     """Go through the 3 methods for producing accounts from the same 0xffff...ffff Seed Entropy."""
@@ -320,6 +354,383 @@ def test_create_recover_extendable():
     ]) == SEED_XMAS
 
 
+def test_create_recover_remembered( monkeypatch ):
+    """The SLIP-39 KDF run by a remembering create isn't repeated by the next recover, unless verify=True."""
+    decrypts			= []
+    decrypt			= shamir_mnemonic.EncryptedMasterSecret.decrypt
+
+    def decrypt_counted( self, passphrase ):
+        decrypts.append( passphrase )
+        return decrypt( self, passphrase )
+    monkeypatch.setattr( shamir_mnemonic.EncryptedMasterSecret, 'decrypt', decrypt_counted )
+
+    try:
+        # By default, nothing is remembered
+        details			= create( "forgotten", 2, groups_example, SEED_XMAS, passphrase="secret" )
+        mnems			= details.groups['one'][1] + details.groups['fren'][1][:3]
+        assert recover( mnems, passphrase="secret" ) == SEED_XMAS
+        assert decrypts == [ b"secret" ]
+
+        details			= create( "remembered", 2, groups_example, SEED_XMAS, passphrase="secret", remember=True )
+        mnems			= details.groups['one'][1] + details.groups['fren'][1][:3]
+
+        # A different passphrase (or an independent verification) decrypts; decrypted secrets
+        # (eg. passphrase search candidates) are never remembered
+        assert recover( mnems, passphrase="wrong" ) != SEED_XMAS
+        assert recover( mnems, passphrase="wrong" ) != SEED_XMAS
+        assert recover( mnems, passphrase="secret", verify=True ) == SEED_XMAS
+        assert decrypts == [ b"secret", b"wrong", b"wrong", b"secret" ]
+
+        # The remembered secret is recalled just once; then, it must be decrypted again (each time)
+        assert recover( mnems, passphrase=b"secret" ) == SEED_XMAS
+        assert decrypts == [ b"secret", b"wrong", b"wrong", b"secret" ]
+        assert recover( mnems, passphrase="secret" ) == SEED_XMAS
+        assert recover( mnems, passphrase="secret" ) == SEED_XMAS
+        assert decrypts == [ b"secret", b"wrong", b"wrong", b"secret", b"secret", b"secret" ]
+
+        # Once forgotten, the secret must be decrypted
+        details			= create( "remembered", 2, groups_example, SEED_XMAS, passphrase="secret", remember=True )
+        mnems			= details.groups['one'][1] + details.groups['fren'][1][:3]
+        secret_forget()
+        assert recover( mnems, passphrase="secret" ) == SEED_XMAS
+        assert len( decrypts ) == 7
+    finally:
+        secret_forget()
+
+
+def test_share_accumulator( monkeypatch ):
+    """Mnemonics are parsed once, missing groups/members reported, and the secret decrypted once."""
+    details			= create( "accumulated", 2, groups_example, SEED_XMAS )
+    secret_forget()
+
+    parses			= []
+    from_mnemonic		= shamir_mnemonic.Share.from_mnemonic.__func__
+
+    def from_mnemonic_counted( cls, mnemonic ):
+        parses.append( mnemonic )
+        return from_mnemonic( cls, mnemonic )
+    monkeypatch.setattr( shamir_mnemonic.Share, 'from_mnemonic', classmethod( from_mnemonic_counted ))
+
+    accumulator			= ShareAccumulator()
+    assert accumulator.recover() is None
+    assert str( accumulator ) == "No valid SLIP-39 mnemonics"
+
+    fren			= details.groups['fren'][1]
+    accumulator.add( fren[0] )
+    accumulator.add( "academic acid academic" )
+    [(common, (needs, members))] = accumulator.missing().items()
+    assert needs == 2 and members == { 3: (1, 3) }
+    assert accumulator.recover() is None
+    assert "needs 2 more of 2/4 groups; 4th group 1/3; 1 invalid" in str( accumulator )
+
+    # The same text in any case/spacing is a duplicate; each is only parsed once
+    accumulator.update( [ fren[0].upper(), fren[1], "  ".join( fren[2].split() ) ] )
+    assert len( accumulator ) == 3 and not accumulator.invalid
+    assert accumulator.satisfied() == []
+    assert accumulator.recover() is None
+    accumulator.add( details.groups['one'][1][0] )
+    assert accumulator.satisfied() == [ common ]
+    assert len( parses ) == 5
+
+    decrypts			= []
+    decrypt			= shamir_mnemonic.EncryptedMasterSecret.decrypt
+
+    def decrypt_counted( self, passphrase ):
+        decrypts.append( passphrase )
+        return decrypt( self, passphrase )
+    monkeypatch.setattr( shamir_mnemonic.EncryptedMasterSecret, 'decrypt', decrypt_counted )
+    try:
+        assert accumulator.recover() == SEED_XMAS
+        assert accumulator.recover() == SEED_XMAS
+        assert len( decrypts ) == 1
+    finally:
+        secret_forget()
+
+    # Removing a previously accumulated mnemonic starts over
+    accumulator.update( fren[:2] )
+    assert len( accumulator ) == 2 and accumulator.recover() is None
+
+    # A contested member (eg. a mistranscribed card) counts just once
+    share			= shamir_mnemonic.Share.from_mnemonic( fren[1] )
+    accumulator.add( corrupt_share( share, random.Random( 1 )))
+    assert len( accumulator ) == 3
+    [(common, (needs, members))] = accumulator.missing().items()
+    assert members == { 3: (2, 3) }
+    assert accumulator.contested() == { common: { 3: [ share.index ] } }
+    assert "needs 2 more of 2/4 groups; 4th group 2/3 (1 contested)" in str( accumulator )
+
+
+def test_recover_search():
+    """Recovery from noisy mnemonics: corrupt (but checksum valid), mistyped and decoy cards."""
+    rng				= random.Random( 39 )
+    details			= create( "noisy", 3, dict( (f"g{g}", (3, 6)) for g in range( 5 )), SEED_XMAS )
+    decoys			= create( "decoy", 3, dict( (f"g{g}", (3, 6)) for g in range( 5 )), SEED_ONES )
+    cards			= []
+    for (_,(_,mnems)),(_,(_,decoy)) in zip( details.groups.items(), decoys.groups.items() ):
+        shares			= [ shamir_mnemonic.Share.from_mnemonic( m ) for m in mnems ]
+        cards.append( corrupt_share( shares[0], rng ).mnemonic() )
+        cards.append( corrupt_mnemonic( mnems[1], rng ))
+        cards.extend( mnems[1:] )
+        # A decoy w/ the same identifier and member index as one of ours contests that index
+        decoy_share		= shamir_mnemonic.Share.from_mnemonic( decoy[2] )
+        cards.append( dataclasses.replace( decoy_share, identifier=shares[2].identifier ).mnemonic() )
+    rng.shuffle( cards )
+
+    [(ems, groups)]		= list( recover_search( cards ))
+    assert ems.decrypt( b"" ) == SEED_XMAS
+    assert sorted( groups ) == [ 0, 1, 2, 3, 4 ]
+    assert all( len( mnems ) == 5 for mnems in groups.values() )
+    assert list( recover_search( cards, workers=2 )) == [(ems, groups)]
+    assert recover( cards, strict=False ) == SEED_XMAS
+
+    with pytest.raises( shamir_mnemonic.MnemonicError ) as excinfo:
+        list( recover_search( cards, strict=True ))
+    assert "Invalid mnemonic checksum" in str( excinfo.value )
+    with pytest.raises( shamir_mnemonic.MnemonicError ) as excinfo:
+        list( recover_search( details.groups['g0'][1][:2], strict=True ))
+    assert "No encoded secret found" in str( excinfo.value )
+
+    durations			= recover_benchmark( group_threshold=2, groups=dict( a=(3,6), b=(3,6), c=(3,6) ), seed=1 )
+    assert set( durations ) == { 'search', 'baseline' }
+    for method, duration in durations.items():
+        print( f"{method:>12}: {duration:9.3f}s" )
+
+
+def test_slip39_repair():
+    """Repair of damaged SLIP-39 mnemonics: illegible, doubtful, misspelled and wrong words."""
+    assert slip39_candidates( "academic" ) == [ "academic" ]
+    assert slip39_candidates( "emperr" ) == [ "emperor" ]
+    assert slip39_candidates( "pubic" ) == [ "cubic", "public" ]
+    assert slip39_candidates( "acid?" )[0] == "acid" and "avoid" in slip39_candidates( "acid?" )
+    assert len( slip39_candidates( "?" )) == 1024
+
+    # The vectorized RS1024 step agrees w/ the scalar one
+    if numpy is not None:
+        chk			= rs1024_state( b"shamir" )
+        values			= numpy.arange( 1024, dtype=numpy.int64 )
+        assert list( rs1024_step( numpy.full( 1024, chk, dtype=numpy.int64 ), values )) \
+            == [ rs1024_step( chk, int( v )) for v in values ]
+
+    for extendable in ( False, True ):
+        details			= create( "repair", 2, dict( one=(1, 1), two=(2, 3) ), SEED_XMAS, extendable=extendable )
+        mnemonic		= details.groups['two'][1][1]
+        words			= mnemonic.split()
+        assert slip39_repair( mnemonic ) == [ mnemonic ]
+
+        damaged			= list( words )
+        damaged[3]		= "?"
+        damaged[9]		= words[9] + "?"
+        damaged[14]		= words[14][:4] + "x"
+        assert mnemonic in slip39_repair( damaged )
+
+        damaged			= list( words )
+        damaged[1]		= "?"
+        damaged[-1]		= "?"
+        progress		= []
+        completions		= slip39_repair( damaged, progress=lambda done, total: progress.append( (done, total) ))
+        assert mnemonic in completions
+        assert progress[-1] == ( 1024 * 1024, 1024 * 1024 )
+        assert slip39_repair( damaged, workers=2 ) == completions
+        # Smaller chunks (split on more leading erased words) find the same completions
+        candidates		= {
+            n: [ words[n] ] + [ w for w in shamir_mnemonic.wordlist.WORDLIST[:32] if w != words[n] ][:31]
+            for n in ( 1, 3 )
+        }
+        completions		= slip39_repair( damaged, candidates=candidates )
+        assert mnemonic in completions
+        found			= repair.slip39_search( slip39_choices( damaged, candidates=candidates ))
+        with substitute( repair, 'REPAIR_CHUNK', 1 << 12 ):
+            assert sorted( repair.slip39_search( slip39_choices( damaged, candidates=candidates ))) == sorted( found )
+            progress		= []
+            assert slip39_repair(
+                damaged, candidates=candidates, progress=lambda done, total: progress.append( (done, total) )
+            ) == completions
+            assert len( progress ) == 32 * 32 and progress[-1] == ( 32 * 32 * 1024, 32 * 32 * 1024 )
+
+        # Many erased words are split (lazily) on enough leading ones to limit each chunk
+        damaged			= list( words )
+        for n in ( 3, 5, 8, 13 ):
+            damaged[n]		= "?"
+        choices			= slip39_choices( damaged )
+        chunks			= slip39_chunks( choices )
+        chunk			= next( chunks )
+        assert [ len( c ) for c in chunk ].count( 1024 ) == 2 and len( chunk[3] ) == len( chunk[5] ) == 1
+        assert sum( 1 for _ in itertools.islice( chunks, 9 )) == 9
+
+        # A single wrong word is corrected
+        damaged			= list( words )
+        damaged[7]		= next( w for w in slip39_candidates( "?" ) if w != words[7] )
+        assert mnemonic in slip39_repair( damaged )
+
+        # Completions w/ a member or group threshold > 1 are verified by the SLIP-39 digests
+        assert slip39_digested( completions )
+        assert slip39_digested( details.groups['one'][1] )
+        assert slip39_digested( create( "repair", 1, dict( two=(2, 3) ), SEED_XMAS ).groups['two'][1] )
+        assert not slip39_digested( create( "repair", 1, dict( one=(1, 1), two=(2, 3) ), SEED_XMAS ).groups['one'][1] )
+
+        # The repaired mnemonic recovers the secret
+        assert recover( [ details.groups['one'][1][0], details.groups['two'][1][0], mnemonic ] ) == SEED_XMAS
+
+    with pytest.raises( shamir_mnemonic.MnemonicError ) as excinfo:
+        slip39_repair( "x" * 20 )
+    assert "No candidate SLIP-39 words for the 1st word" in str( excinfo.value )
+
+
+def test_bip39_repair( tmp_path ):
+    """Repair of damaged BIP-39 mnemonics; checksum-valid candidates are matched against a target."""
+    phrase			= " ".join( [ "zoo" ] * 23 + [ "vote" ] )
+    address			= account( recover_bip39( phrase ), "ETH" ).address
+    words			= phrase.split()
+
+    damaged			= list( words )
+    damaged[4]			= "?"
+    completions			= list( bip39_repair( damaged ))
+    assert phrase in completions and len( completions ) == 8		# 1 in 256 pass the checksum
+    assert list( bip39_repair( damaged, target=address )) == [ phrase ]
+    assert list( bip39_repair( damaged, target=address.lower() )) == [ phrase ]
+
+    # A misspelled, a doubtful and a wrong word
+    damaged			= list( words )
+    damaged[1]			= "zo"
+    damaged[7]			= "zoo?"
+    assert phrase in bip39_repair( damaged )
+    damaged			= list( words )
+    damaged[2]			= "abandon"
+    assert list( bip39_repair( damaged, target=address )) == [ phrase ]
+
+    # A doubtful and an illegible word; the search is checkpointed, and resumed w/o repeating tasks
+    damaged			= list( words )
+    damaged[0]			= "zoo?"
+    damaged[23]			= "?"
+    checkpoint			= str( tmp_path / "repair.json" )
+    progress			= []
+    found			= list( bip39_repair(
+        damaged, target=address, workers=2, checkpoint=checkpoint,
+        progress=lambda done, total: progress.append( (done, total) ),
+    ))
+    assert found == [ phrase ]
+    assert progress[-1] == ( 34 * 2048, 34 * 2048 )
+    progress			= []
+    assert list( bip39_repair(
+        damaged, target=address, checkpoint=checkpoint,
+        progress=lambda done, total: progress.append( (done, total) ),
+    )) == [ phrase ]
+    assert progress == []
+
+    with pytest.raises( ValueError ) as excinfo:
+        list( bip39_repair( words[:11] ))
+    assert "must have 12, 15, 18, 21 or 24 words" in str( excinfo.value )
+
+
+def test_recover_passphrase( tmp_path ):
+    """Recovery of forgotten SLIP-39 and BIP-39 passphrases from dictionary words, variations and masks."""
+    count, candidates		= passphrase_mask( "a?d??" )
+    assert count == 10 and list( candidates )[:2] == [ "a0?", "a1?" ]
+    with pytest.raises( ValueError ):
+        passphrase_mask( "?x" )
+    count, candidates		= passphrase_candidates( words=[ "secret", "hunter" ], masks=[ "?d?d?d", "?u" ] )
+    candidates			= list( candidates )
+    assert count == len( candidates ) == len( set( candidates ))
+    assert candidates[:2] == [ "secret", "hunter" ] and candidates[-1] == "999"
+    assert candidates.index( "Secret42" ) < candidates.index( "A" ) < candidates.index( "000" )
+
+    address			= account( SEED_XMAS, "ETH" ).address
+    details			= create( "passphrase", 1, dict( one=(1, 1) ), SEED_XMAS, passphrase=b"Secret42" )
+    mnemonics			= details.groups['one'][1]
+    assert recover_passphrase( mnemonics, address, words=[ "secret" ] ) == ( "Secret42", False )
+    checkpoint			= str( tmp_path / "passphrase.json" )
+    assert recover_passphrase(
+        mnemonics, address, masks=[ "Secret?d?d" ], using_bip39=False, workers=2, checkpoint=checkpoint
+    ) == ( "Secret42", False )
+    assert recover_passphrase(
+        mnemonics, address, masks=[ "Secret?d?d" ], using_bip39=False, checkpoint=checkpoint
+    ) == ( "Secret42", False )
+    assert recover_passphrase( mnemonics, address, words=[ "hunter" ], mutate=False ) is None
+
+    # A BIP-39 "25th word", and a SLIP-39 backup of a BIP-39 Mnemonic, using_bip39
+    phrase			= produce_bip39( entropy=SEED_XMAS )
+    address			= account( recover_bip39( phrase, passphrase="hunter2!" ), "ETH" ).address
+    assert recover_passphrase( [ phrase ], address, masks=[ "hunter?d?s" ] ) == ( "hunter2!", True )
+    details			= create( "passphrase", 1, dict( one=(1, 1) ), SEED_XMAS, using_bip39=True )
+    assert recover_passphrase( details.groups['one'][1], address, words=[ "hunter2" ] ) == ( "hunter2!", True )
+
+    # Neither a valid BIP-39 Mnemonic (eg. a bad checksum), nor a recoverable SLIP-39 set
+    with pytest.raises( shamir_mnemonic.MnemonicError, match="Neither a valid BIP-39 Mnemonic" ):
+        passphrase_plan( [ " ".join( [ "zoo" ] * 24 ) ] )
+    with pytest.raises( shamir_mnemonic.MnemonicError, match="Neither a valid BIP-39 Mnemonic" ):
+        recover_passphrase( create( "passphrase", 1, dict( two=(2, 3) ), SEED_XMAS ).groups['two'][1][:1], address, words=[ "hunter2" ] )
+
+    # A 512-bit SLIP-39 secret can't be BIP-39 entropy; only its SLIP-39 passphrase is searched
+    secret			= SEED_XMAS * 4
+    address			= account( secret, "ETH" ).address
+    details			= create( "passphrase", 1, dict( one=(1, 1) ), secret, passphrase=b"Secret42" )
+    mnemonics			= details.groups['one'][1]
+    assert [ kind for kind, _, _ in passphrase_plan( mnemonics ) ] == [ 'slip39' ]
+    with pytest.raises( ValueError ):
+        passphrase_plan( mnemonics, using_bip39=True )
+    assert recover_passphrase( mnemonics, address, words=[ "secret" ] ) == ( "Secret42", False )
+
+
+def test_verify_manifest( tmp_path, capsys, monkeypatch ):
+    """Bulk verification of SLIP-39 Mnemonic sets against a manifest of their expected wallets."""
+    addresses			= {}
+    for name, secret in ( ( "xmas", SEED_XMAS ), ( "ones", SEED_ONES ), ( "zero", SEED_ZERO ) ):
+        details			= create( name, 2, groups_example, secret )
+        addresses[name]		= account( secret, "ETH" ).address
+        with open( tmp_path / f"{name}.txt", 'w' ) as f:
+            for g_name, ( _, g_mnems ) in details.groups.items():
+                for i, mnem in enumerate( g_mnems ):
+                    f.write( f"{name} {g_name} {i+1}: {mnem}\n" )
+    # Spoil a Mnemonic of the "zero" set; it remains a valid Share, but can't recover its group
+    with open( tmp_path / "zero.txt" ) as f:
+        lines			= f.readlines()
+    label, mnemonic		= lines[-1].split( ': ' )
+    share			= shamir_mnemonic.Share.from_mnemonic( mnemonic )
+    lines[-1]			= f"{label}: {corrupt_share( share, random.Random( 1 )).mnemonic()}\n"
+    with open( tmp_path / "zero.txt", 'w' ) as f:
+        f.writelines( lines )
+
+    manifest			= tmp_path / "manifest.csv"
+    with open( manifest, 'w' ) as f:
+        f.write( "mnemonics,address,fingerprint\n" )
+        f.write( f"xmas.txt,{addresses['xmas']},\n" )
+        f.write( f"ones.txt,{addresses['xmas']},\n" )
+        f.write( f"zero.txt,{addresses['zero']},\n" )
+        f.write( "none.txt,,\n" )
+    reports			= list( verify_manifest( str( manifest )))
+    assert [ r['pass'] for r in reports ] == [ True, False, False, False ]
+    assert reports[0]['groups'] == 4 and reports[0]['subsets'] == 1 + 1 + 6 + 10 + 6
+    assert "doesn't match" in reports[1]['errors'][0]
+    assert any( "Group 4 Mnemonics" in e for e in reports[2]['errors'] )
+    assert "Could not read" in reports[3]['errors'][0]
+    assert [ dict( r, seconds=0 ) for r in verify_manifest( str( manifest ), workers=2 ) ] \
+        == [ dict( r, seconds=0 ) for r in reports ]
+
+    # A fingerprint identifies the wallet, too; and a sample of the subsets may be verified
+    mnemonics			= read_mnemonics( tmp_path / "xmas.txt" )
+    assert len( mnemonics ) == 11
+    report			= verify_mnemonics( mnemonics, fingerprint=reports[0]['fingerprint'], samples=2 )
+    assert report['pass'] and report['subsets'] == 1 + 1 + 2 + 2 + 2
+    report			= verify_mnemonics( mnemonics, fingerprint=reports[2]['fingerprint'] )
+    assert not report['pass'] and "Fingerprint" in report['errors'][0]
+
+    # The slip39 --text output of a using_bip39 set (w/ its "Using BIP-39 Mnemonic: ..." line) and
+    # any '#' comments (even w/ a ':') are not SLIP-39 Mnemonics
+    monkeypatch.chdir( tmp_path )
+    capsys.readouterr()
+    details,			= write_pdfs(
+        names=[ "bip" ], master_secret=SEED_XMAS, using_bip39=True, text=True, card_format=False,
+        group=[ "one(1/1)", "fren(2/3)" ], group_threshold=1,
+    ).values()
+    with open( tmp_path / "bip.txt", 'w' ) as f:
+        f.write( "# Printed: 2024-01-01\n" )
+        f.write( capsys.readouterr().out )
+    mnemonics			= read_mnemonics( tmp_path / "bip.txt" )
+    assert mnemonics == details.groups['one'][1] + details.groups['fren'][1]
+    report			= verify_mnemonics( mnemonics, address=details.accounts[0][0].address, using_bip39=True )
+    assert report['pass'], report['errors']
+
+
 @substitute( shamir_mnemonic.shamir, 'RANDOM_BYTES', nonrandom_bytes )
 def test_create_recover_smoke_extendable():
     simple_base			= create( **simple_example, master_secret=SEED_ONES, extendable=True )
@@ -405,6 +405,67 @@ def chunker( sequence, size ):
         sequence		= sequence[size:]
 
 
+class NpyWriter:
+    """Stream fixed-size records into a NumPy .npy (format version 1.0) file, w/o requiring numpy.
+
+    The 1-dimensional array's record count needn't be known in advance: the header reserves room for
+    the largest count, and is re-written with the actual count on close.  If used as a context
+    manager and an exception is raised, the incomplete file is discarded.  The records (packed bytes,
+    eg. from struct.pack) must match the structured dtype 'descr', eg. "[('index', '<u8'), ('address',
+    '|S64')]".  The result may be memory-mapped, eg. numpy.load( filename, mmap_mode='r' ).
+
+    """
+    MAGIC			= b'\x93NUMPY\x01\x00'
+
+    def __init__( self, filename: str, descr: str, itemsize: int ):
+        self.filename		= filename
+        self.descr		= descr
+        self.itemsize		= itemsize
+        self.count		= 0
+        self.header_len		= 0
+        self.header_len		= len( self.header( 10 ** 20 ))  # Room for any count
+        self.file		= open( filename, 'wb' )
+        self.file.write( self.header( 0 ))
+
+    def header( self, count: int ) -> bytes:
+        """The .npy header for 'count' records, padded to header_len (and a multiple of 64 bytes)."""
+        header			= f"{{'descr': {self.descr}, 'fortran_order': False, 'shape': ({count},), }}"
+        prefix			= len( self.MAGIC ) + 2
+        length			= max( self.header_len, ( prefix + len( header ) + 1 + 63 ) // 64 * 64 )
+        header			= header.ljust( length - prefix - 1 ) + '\n'
+        return self.MAGIC + len( header ).to_bytes( 2, 'little' ) + header.encode( 'latin1' )
+
+    def write( self, records: bytes ):
+        """Append some (a multiple of itemsize bytes) packed records."""
+        assert len( records ) % self.itemsize == 0, \
+            f"Records must be a multiple of {self.itemsize} bytes, not {len( records )}"
+        self.file.write( records )
+        self.count	       += len( records ) // self.itemsize
+
+    def close( self ):
+        if self.file.closed:
+            return
+        self.file.seek( 0 )
+        self.file.write( self.header( self.count ))
+        self.file.close()
+
+    def discard( self ):
+        """Abandon an incomplete file; it is removed, rather than finalized w/ a misleading count."""
+        if not self.file.closed:
+            self.file.close()
+        if os.path.exists( self.filename ):
+            os.remove( self.filename )
+
+    def __enter__( self ):
+        return self
+
+    def __exit__( self, exc_type, *exc ):
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+
 def hex_to_rgb( value, real=False, precision=4 ):
     """
     Convert hex color to ints, or reals rounded to a certain precision.